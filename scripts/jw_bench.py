@@ -0,0 +1,412 @@
+"""Offline-Benchmark für den JW Meetings Scraper
+
+Spielt einen aufgezeichneten Seitenbestand (Wochenübersicht, Inhaltsverzeichnis,
+Artikel) ohne Netzwerk und ohne Wartezeiten ab und misst pro Woche die Stufen
+fetch, soup, outline, midweek, weekend und serialize sowie den Speicher-Peak.
+Die Seiten kommen über einen Ersatz-Transport, fetch misst also den Weg des
+Scrapers mit Scheduler, Streaming und Lied-Scanner, nur ohne Netzwerk.
+
+Aufnahme:  python3 scripts/jw_bench.py --record --from 2025/10 --weeks 8
+Messung:   python3 scripts/jw_bench.py --weeks 52 --json temp/bench.json
+Vergleich: python3 scripts/jw_bench.py --weeks 52 --baseline temp/bench.json
+Durchsatz: python3 scripts/jw_bench.py --weeks 52 --parse-workers 4
+Kaltstart: python3 scripts/jw_bench.py --startup 20 [--bundle temp/jw_scraper.pyz]
+Ausgaben:  python3 scripts/jw_bench.py --by-issue --weeks 5
+
+Mit --by-issue laufen die Wochen über die Inhaltsverzeichnisse von Arbeitsheft und
+Wachtturm (index_issue, week_title); der Bestand enthält dafür mwb25.03 und w25.01.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Set
+
+import jw_log
+import jw_scraper
+from jw_model import dumps
+from jw_parser import classify_url
+from jw_scraper import JWMeetingScraper, iso_weeks_from, parse_year_week
+from jw_transport import ReplayTransport
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+STAGES = ["fetch", "soup", "outline", "midweek", "weekend", "serialize"]
+
+
+class FixtureCorpus:
+    """Aufgezeichnete Seiten, über index.json nach URL abgelegt"""
+
+    def __init__(self, directory: str = FIXTURES_DIR):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.index: Dict[str, str] = {}
+        self._pages: Dict[str, str] = {}
+        # Ausgelieferte Dateien und URLs, die nur über eine Ersatzseite bedient wurden
+        self.served: Set[str] = set()
+        self.fallbacks: Set[str] = set()
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def _read(self, filename: str) -> str:
+        if filename not in self._pages:
+            with open(os.path.join(self.directory, filename), encoding="utf-8") as f:
+                self._pages[filename] = f.read()
+        return self._pages[filename]
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Exakte URL, sonst die erste aufgezeichnete Seite derselben Art
+
+        Ausgaben nur exakt: ein fremdes Inhaltsverzeichnis würde Wochen falsch zuordnen.
+        """
+        filename = self.index.get(url)
+        kind = classify_url(url)
+        if filename is None and kind != "issue":
+            filename = next((name for recorded, name in self.index.items() if classify_url(recorded) == kind), None)
+            if filename:
+                self.fallbacks.add(url)
+        if not filename:
+            return None
+        self.served.add(filename)
+        return self._read(filename)
+
+    def record(self, url: str, html: str, lp: str):
+        """Legt die Seite unter Art und Pfad hinter dem Sprachteil `lp` ab (z. B. week_2025_10.html)"""
+        kind = classify_url(url)
+        filename = f"{kind}_{url.rstrip('/').rsplit(f'/{lp}/', 1)[-1].replace('/', '_')}.html"
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, filename), "w", encoding="utf-8") as f:
+            f.write(html)
+        self.index[url] = filename
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2)
+            f.write("\n")
+
+
+class FixtureResponses:
+    """Antworten aus dem Bestand in der Form, die ReplayTransport erwartet: (Status, Header, Body)"""
+
+    HEADERS = {"content-type": "text/html; charset=utf-8"}
+
+    def __init__(self, corpus: FixtureCorpus):
+        self.corpus = corpus
+
+    def get(self, url: str, default):
+        html = self.corpus.lookup(url)
+        return (200, self.HEADERS, html.encode("utf-8")) if html else default
+
+
+class FixtureTransport(ReplayTransport):
+    """Ersatz-Transport über den Seitenbestand statt über ein WARC-Archiv (ohne Rate-Limit)"""
+
+    def __init__(self, corpus: FixtureCorpus):
+        self.responses = FixtureResponses(corpus)
+
+    async def open(self):
+        pass
+
+
+class StageTimer:
+    """Misst exklusive Zeiten pro Stufe (verschachtelte Stufen werden abgezogen)"""
+
+    def __init__(self):
+        self.current: Dict[str, float] = {}
+        self._stack: List[List] = []
+
+    def reset(self):
+        self.current = {stage: 0.0 for stage in STAGES}
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            total = time.perf_counter() - frame[1]
+            self.current[name] = self.current.get(name, 0.0) + total - frame[2]
+            if self._stack:
+                self._stack[-1][2] += total
+
+
+class ReplayScraper(JWMeetingScraper):
+    """Scraper mit lokalem Ersatz-Transport: liefert Seiten aus dem Bestand, ohne Wartezeit"""
+
+    def __init__(self, corpus: FixtureCorpus, timer: StageTimer, parse_executor=None, by_issue: bool = False):
+        super().__init__(parse_executor=parse_executor, by_issue=by_issue, transport=FixtureTransport(corpus))
+        self.corpus = corpus
+        self.timer = timer
+
+    async def _download(self, url: str, scanner=None) -> str:
+        # Scheduler-Platz, Transport und (bei Artikeln) Streaming in den Scanner
+        with self.timer.stage("fetch"):
+            return await super()._download(url, scanner)
+
+    def _parse_midweek_meeting(self, outline):
+        with self.timer.stage("midweek"):
+            return super()._parse_midweek_meeting(outline)
+
+    async def _parse_weekend_meeting(self, outline):
+        with self.timer.stage("weekend"):
+            return await super()._parse_weekend_meeting(outline)
+
+
+class RecordingScraper(JWMeetingScraper):
+    """Live-Scraper, der jede geladene Seite in den Bestand schreibt"""
+
+    def __init__(self, corpus: FixtureCorpus, by_issue: bool = False):
+        super().__init__(by_issue=by_issue)
+        self.corpus = corpus
+
+    async def _fetch_page(self, url: str, scanner=None) -> str:
+        # Immer die vollständige Seite laden, damit der Bestand nicht abgeschnitten wird
+        html = await super()._fetch_page(url)
+        if html and classify_url(url) != "other":
+            self.corpus.record(url, html, self.rules.lp)
+        if html and scanner is not None:
+            scanner.feed(html)
+        return html
+
+
+def patch_stage(timer: StageTimer, name: str, attribute: str):
+    """Umhüllt eine in jw_scraper importierte Funktion mit einer Zeitmessung"""
+    original = getattr(jw_scraper, attribute)
+
+    def timed(*args, **kwargs):
+        with timer.stage(name):
+            return original(*args, **kwargs)
+
+    setattr(jw_scraper, attribute, timed)
+
+
+async def replay(args) -> Dict:
+    corpus = FixtureCorpus(args.fixtures)
+    if not corpus.index:
+        raise SystemExit(f"Keine Aufnahmen in {args.fixtures} gefunden (zuerst --record ausführen)")
+
+    timer = StageTimer()
+    patch_stage(timer, "soup", "make_soup")
+    patch_stage(timer, "outline", "build_week_outline")
+    scraper = ReplayScraper(corpus, timer, by_issue=args.by_issue)
+
+    samples = {stage: [] for stage in STAGES + ["total"]}
+    peaks = []
+    if args.memory:
+        tracemalloc.start()
+
+    fallback_weeks = []
+    try:
+        for year, week in iso_weeks_from(args.start, args.weeks):
+            timer.reset()
+            if args.memory:
+                tracemalloc.reset_peak()
+            fallbacks_before = len(corpus.fallbacks)
+            started = time.perf_counter()
+
+            meeting_data = await scraper.scrape_meeting(year, week)
+            with timer.stage("serialize"):
+                dumps(meeting_data)
+
+            samples["total"].append(time.perf_counter() - started)
+            for stage in STAGES:
+                samples[stage].append(timer.current[stage])
+            if args.memory:
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            if len(corpus.fallbacks) > fallbacks_before:
+                fallback_weeks.append(f"{year}/{week:02d}")
+    finally:
+        if args.memory:
+            tracemalloc.stop()
+        await scraper.close()
+
+    # Wochen ohne eigene Aufnahme parsen dieselbe Ersatzseite erneut und zählen nicht als neue Seiten
+    result = {"weeks": args.weeks, "pages": len(corpus.served), "fallback_weeks": fallback_weeks, "stages": {}}
+    for stage, values in samples.items():
+        ordered = sorted(values)
+        result["stages"][stage] = {
+            "mean_ms": statistics.mean(values) * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            "total_ms": sum(values) * 1000,
+        }
+    if peaks:
+        result["memory_peak_kb"] = {"max": max(peaks) / 1024, "mean": statistics.mean(peaks) / 1024}
+    return result
+
+
+async def throughput(args) -> float:
+    """Wochen pro Sekunde, wenn alle Wochen gleichzeitig laufen (Parsen in der Loop oder im Prozess-Pool)"""
+    corpus = FixtureCorpus(args.fixtures)
+    executor = jw_scraper.create_parse_pool(args.parse_workers) if args.parse_workers else None
+    # Die Stufen überlappen sich hier, gemessen wird nur die Gesamtzeit
+    scraper = ReplayScraper(corpus, StageTimer(), parse_executor=executor, by_issue=args.by_issue)
+    weeks = list(iso_weeks_from(args.start, args.weeks))
+
+    try:
+        if executor:
+            # Pool-Prozesse vorab starten, damit ihr Start nicht mitgemessen wird
+            html = corpus.lookup(f"{scraper.base_url}/{weeks[0][0]}/{str(weeks[0][1]).zfill(2)}") or ""
+            await asyncio.gather(*(scraper._run_parse(jw_scraper.parse_week_html, html, "de")
+                                   for _ in range(args.parse_workers)))
+        started = time.perf_counter()
+        await asyncio.gather(*(scraper.scrape_meeting(year, week) for year, week in weeks))
+        elapsed = time.perf_counter() - started
+    finally:
+        # Schließt auch den Prozess-Pool
+        await scraper.close()
+    return len(weeks) / elapsed
+
+
+def report(result: Dict, baseline: Optional[Dict]):
+    print(f"{result['weeks']} Wochen abgespielt ({result['pages']} verschiedene Seiten)")
+    if result["fallback_weeks"]:
+        print(f"Achtung: {len(result['fallback_weeks'])} von {result['weeks']} Wochen ohne eigene Aufnahme "
+              f"({', '.join(result['fallback_weeks'])}); sie parsen Ersatzseiten erneut, "
+              f"die Zeiten gelten also nur für {result['pages']} verschiedene Seiten")
+    print(f"{'Stufe':<12}{'Mittel ms':>12}{'p95 ms':>12}{'Summe ms':>12}{'vs. Basis':>12}")
+    for stage, values in result["stages"].items():
+        delta = ""
+        if baseline and stage in baseline.get("stages", {}):
+            before = baseline["stages"][stage]["mean_ms"]
+            if before:
+                delta = f"{(values['mean_ms'] - before) / before * 100:+.1f}%"
+        print(f"{stage:<12}{values['mean_ms']:>12.2f}{values['p95_ms']:>12.2f}{values['total_ms']:>12.1f}{delta:>12}")
+    if "memory_peak_kb" in result:
+        peak = result["memory_peak_kb"]
+        print(f"Speicher-Peak pro Woche: max {peak['max']:.0f} KB, Mittel {peak['mean']:.0f} KB")
+
+
+def _top_level_imports(importtime: str) -> Dict[str, float]:
+    """Kumulierte Zeit (ms) der obersten Importe; jw_scraper selbst wird in seine Importe aufgeschlüsselt
+
+    Zeilen: "import time: self [us] | cumulative | imported package", die
+    Einrückung des Namens ist die Tiefe, Kinder stehen vor ihrem Elternmodul.
+    """
+    pending: Dict[int, Dict[str, float]] = {}
+    imports: Dict[str, float] = {}
+    for line in importtime.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        children = pending.pop(depth + 1, {})
+        if depth == 0:
+            if name == "jw_scraper":
+                imports.update(children)
+            else:
+                imports[name] = int(fields[1]) / 1000
+        else:
+            pending.setdefault(depth, {})[name] = int(fields[1]) / 1000
+    return imports
+
+
+def measure_startup(runs: int, bundle: Optional[str] = None) -> Dict:
+    """Kaltstart des CLI: Wanduhrzeit bis nach dem Argument-Parsing und Importzeiten laut -X importtime
+
+    Jeder Lauf ist ein neuer Interpreter mit `--help`, also Interpreterstart,
+    Importe und argparse, aber kein Abruf.
+    """
+    entry = bundle or os.path.join(os.path.dirname(os.path.abspath(__file__)), "jw_scraper.py")
+    wall = []
+    imports: Dict[str, float] = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-X", "importtime", entry, "--help"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+        wall.append((time.perf_counter() - started) * 1000)
+        imports = _top_level_imports(completed.stderr)
+    top = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:10]
+    return {
+        "runs": runs,
+        "entry": entry,
+        "wall_ms": {"median": statistics.median(wall), "min": min(wall)},
+        "imports_ms": sum(imports.values()),
+        "top_imports_ms": dict(top),
+    }
+
+
+def report_startup(result: Dict, baseline: Optional[Dict]):
+    wall = result["wall_ms"]
+    delta = ""
+    if baseline and "wall_ms" in baseline:
+        before = baseline["wall_ms"]["median"]
+        delta = f" ({(wall['median'] - before) / before * 100:+.1f}% vs. Basis)"
+    print(f"Kaltstart {result['entry']} ({result['runs']} Läufe): Median {wall['median']:.0f} ms, "
+          f"Minimum {wall['min']:.0f} ms{delta}")
+    print(f"Importe (letzter Lauf): {result['imports_ms']:.0f} ms, die teuersten:")
+    for name, elapsed in result["top_imports_ms"].items():
+        print(f"  {name:<28}{elapsed:>8.1f} ms")
+
+
+async def record(args):
+    corpus = FixtureCorpus(args.fixtures)
+    scraper = RecordingScraper(corpus, by_issue=args.by_issue)
+    try:
+        for year, week in iso_weeks_from(args.start, args.weeks):
+            await scraper.scrape_meeting(year, week)
+    finally:
+        await scraper.close()
+    print(f"{len(corpus.index)} Seiten in {args.fixtures} aufgezeichnet")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline-Benchmark für den JW Meetings Scraper')
+    parser.add_argument('--from', dest='start', default='2025/10', help='Erste Woche im Format YYYY/WW (Standard: 2025/10)')
+    parser.add_argument('--weeks', type=int, default=26, help='Anzahl der Wochen (Standard: 26)')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Verzeichnis der aufgezeichneten Seiten')
+    parser.add_argument('--by-issue', action='store_true', help='Wochen aus den Inhaltsverzeichnissen von Arbeitsheft und Wachtturm laden (wie jw_scraper --by-issue)')
+    parser.add_argument('--record', action='store_true', help='Seiten live abrufen und aufzeichnen statt zu messen')
+    parser.add_argument('--memory', action='store_true', help='Speicher-Peak pro Woche mit tracemalloc messen (verlangsamt die Zeitmessung)')
+    parser.add_argument('--json', help='Ergebnisse als JSON speichern (z. B. als Basis für spätere Vergleiche)')
+    parser.add_argument('--baseline', help='Früher gespeicherte Ergebnisse zum Vergleich')
+    parser.add_argument('--parse-workers', type=int, help='Durchsatz mit gleichzeitigen Wochen messen, geparst in so vielen Prozessen (0 = in der Event-Loop)')
+    parser.add_argument('--startup', type=int, metavar='LÄUFE', help='Kaltstart des CLI in so vielen neuen Interpretern messen (-X importtime)')
+    parser.add_argument('--bundle', help='Mit --startup: dieses Zipapp (jw_bundle.py) statt scripts/jw_scraper.py messen')
+    args = parser.parse_args()
+    try:
+        parse_year_week(args.start)
+    except ValueError as e:
+        parser.error(str(e))
+    # Meldungen des Scrapers würden die Messung stören, nur Fehler ausgeben
+    jw_log.configure("error")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.startup:
+        result = measure_startup(args.startup, args.bundle)
+        report_startup(result, baseline)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2)
+        return
+
+    if args.record:
+        asyncio.run(record(args))
+        return
+
+    if args.parse_workers is not None:
+        rate = asyncio.run(throughput(args))
+        print(f"{args.weeks} Wochen gleichzeitig, {args.parse_workers or 'keine'} Parse-Prozesse: {rate:.1f} Wochen/s")
+        return
+
+    result = asyncio.run(replay(args))
+    report(result, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Baut den Scraper als vorkompiliertes Zipapp
+
+Das Archiv enthält die jw_*-Module nur als Bytecode (.pyc): beim Start wird
+kein Quelltext gelesen, geprüft oder übersetzt, und alle Module kommen aus
+einer einzigen Datei. Die Abhängigkeiten (aiohttp, bs4, ...) stammen weiter
+aus der Python-Umgebung. Bytecode ist versionsgebunden, das Archiv läuft nur
+mit der Python-Version, mit der es gebaut wurde.
+
+Bauen:   python3 scripts/jw_bundle.py                 (temp/jw_scraper.pyz)
+Starten: python3 temp/jw_scraper.pyz --year-week 2025/10
+Worker:  JW_SCRAPER_BUNDLE=temp/jw_scraper.pyz (statt scripts/jw_scraper.py)
+"""
+import argparse
+import glob
+import os
+import py_compile
+import sys
+import tempfile
+import zipfile
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Werkzeuge, die der Scraper zur Laufzeit nicht braucht
+EXCLUDED = {"jw_bench.py", "jw_parser_bench.py", "jw_bundle.py"}
+
+# Der Guard ist nötig: Parse-Prozesse (spawn) führen __main__ erneut als __mp_main__ aus
+MAIN = """import sys
+
+from jw_scraper import main
+
+if __name__ == "__main__":
+    sys.exit(main())
+"""
+
+
+def modules():
+    return sorted(path for path in glob.glob(os.path.join(SCRIPTS_DIR, "jw_*.py"))
+                  if os.path.basename(path) not in EXCLUDED)
+
+
+def build(output: str, optimize: int = 0) -> int:
+    """Schreibt das Archiv und gibt die Anzahl der Module zurück"""
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    sources = modules()
+    # Wie zipapp: Shebang-Zeile vor dem Archiv, damit die Datei direkt ausführbar ist
+    with tempfile.TemporaryDirectory() as tmp, open(output, "wb") as f:
+        f.write(b"#!/usr/bin/env python3\n")
+        # Unkomprimiert: Importe lesen den Bytecode direkt, ohne zu entpacken
+        with zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as archive:
+            for source in sources:
+                name = os.path.splitext(os.path.basename(source))[0]
+                compiled = py_compile.compile(source, cfile=os.path.join(tmp, name + ".pyc"),
+                                              doraise=True, optimize=optimize)
+                archive.write(compiled, name + ".pyc")
+            archive.writestr("__main__.py", MAIN)
+    os.chmod(output, 0o755)
+    return len(sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vorkompiliertes Zipapp des JW Meetings Scrapers bauen')
+    parser.add_argument('--output', default=os.path.join('temp', 'jw_scraper.pyz'), help='Zieldatei (Standard: temp/jw_scraper.pyz)')
+    parser.add_argument('--optimize', type=int, default=0, choices=(0, 1, 2), help='Optimierungsstufe des Bytecodes wie python -O/-OO (Standard: 0)')
+    args = parser.parse_args()
+
+    count = build(args.output, args.optimize)
+    print(f"{count} Module für Python {sys.version_info.major}.{sys.version_info.minor} nach {args.output} gepackt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import os
+import sqlite3
+import time
+import zlib
+from typing import NamedTuple, Optional
+
+
+class CachedPage(NamedTuple):
+    url: str
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+
+class HttpCache:
+    """Persistenter Seiten-Cache in SQLite (zlib-komprimiert, LRU nach Größe, TTL)
+
+    Frische Einträge werden ohne Anfrage geliefert, abgelaufene mit
+    If-None-Match/If-Modified-Since revalidiert.
+    """
+
+    def __init__(self, path: str = os.path.join("temp", "jw_http_cache.sqlite"),
+                 ttl: float = 7 * 24 * 3600, max_bytes: int = 200 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)")
+        self._db.commit()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        row = self._db.execute(
+            "SELECT body, etag, last_modified, stored_at FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._db.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        self._db.commit()
+        body, etag, last_modified, stored_at = row
+        return CachedPage(url, zlib.decompress(body).decode("utf-8"), etag, last_modified, stored_at)
+
+    def put(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        body = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO pages (url, body, size, etag, last_modified, stored_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, body, len(body), etag, last_modified, now, now),
+        )
+        self._db.commit()
+        self._evict()
+
+    def revalidated(self, url: str):
+        """Markiert einen Eintrag nach einer 304-Antwort wieder als frisch"""
+        now = time.time()
+        self._db.execute("UPDATE pages SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+        self._db.commit()
+
+    def _evict(self):
+        # Am längsten nicht genutzte Einträge entfernen, bis die Größengrenze eingehalten ist
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for url, size in self._db.execute("SELECT url, size FROM pages ORDER BY accessed_at").fetchall():
+            self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+# Ausgaben auf wol.jw.org: das Arbeitsheft erscheint alle zwei Monate (mwb25.03 = März/April),
+# die Studienausgabe des Wachtturms monatlich (w25.01) und wird zwei Monate später studiert
+WORKBOOK_PREFIX = "mwb"
+STUDY_PREFIX = "w"
+STUDY_LEAD_MONTHS = 2
+
+
+def _symbol(prefix: str, year: int, month: int) -> str:
+    return f"{prefix}{year % 100:02d}.{month:02d}"
+
+
+def _add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    index = year * 12 + month - 1 + months
+    return index // 12, index % 12 + 1
+
+
+def workbook_issues(monday: date) -> List[Tuple[str, date]]:
+    """Arbeitsheft-Ausgaben, in denen die Woche stehen kann: (Symbol, Mitte des Zeitraums)
+
+    Eine Woche über den Monatswechsel kann in der Ausgabe des Montags oder
+    des Sonntags stehen; beide Kandidaten werden geprüft.
+    """
+    issues = []
+    for day in (monday, monday + timedelta(days=6)):
+        month = day.month - (day.month + 1) % 2
+        issue = (_symbol(WORKBOOK_PREFIX, day.year, month), date(day.year, month + 1, 1))
+        if issue not in issues:
+            issues.append(issue)
+    return issues
+
+
+def study_issues(monday: date) -> List[Tuple[str, date]]:
+    """Wachtturm-Ausgaben, deren Studienartikel in die Woche fallen können: (Symbol, Mitte des Studienmonats)"""
+    issues = []
+    for day in (monday, monday + timedelta(days=6)):
+        year, month = _add_months(day.year, day.month, -STUDY_LEAD_MONTHS)
+        issue = (_symbol(STUDY_PREFIX, year, month), date(day.year, day.month, 15))
+        if issue not in issues:
+            issues.append(issue)
+    return issues
+
+
+def index_issue(entries, rules, near: date) -> Dict[date, Tuple[str, str]]:
+    """Ordnet die Einträge eines Inhaltsverzeichnisses ihrer Woche zu: Montag -> (href, Titel)
+
+    `entries` kommt aus find_issue_entries; Einträge ohne erkennbaren
+    Wochenbereich (Vorwort, Fragekasten, ...) werden übergangen.
+    """
+    index = {}
+    for href, title, text in entries:
+        start = rules.week_start(text, near)
+        if start is not None:
+            index.setdefault(start, (href, title))
+    return index
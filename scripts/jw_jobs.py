@@ -0,0 +1,62 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+
+class JobJournal:
+    """Checkpoints für Bereichs-Jobs in SQLite: erledigte Wochen werden beim Neustart übersprungen"""
+
+    def __init__(self, path: str = os.path.join("temp", "jw_jobs.sqlite")):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS weeks (
+                job TEXT NOT NULL,
+                year_week TEXT NOT NULL,
+                status TEXT NOT NULL,
+                data TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job, year_week)
+            )
+        """)
+        self._db.commit()
+
+    def completed(self, job: str, year_week: str) -> Optional[Dict[str, Any]]:
+        """Gespeichertes Ergebnis einer erledigten Woche oder None"""
+        row = self._db.execute(
+            "SELECT data FROM weeks WHERE job = ? AND year_week = ? AND status = 'done'", (job, year_week)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def mark_done(self, job: str, year_week: str, data: Dict[str, Any]):
+        self._record(job, year_week, "done", json.dumps(data, ensure_ascii=False), None)
+
+    def mark_failed(self, job: str, year_week: str, error: str):
+        self._record(job, year_week, "failed", None, error)
+
+    def _record(self, job: str, year_week: str, status: str, data: Optional[str], error: Optional[str]):
+        self._db.execute(
+            "INSERT INTO weeks (job, year_week, status, data, error, attempts, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, 1, ?) "
+            "ON CONFLICT (job, year_week) DO UPDATE SET status = excluded.status, data = excluded.data, "
+            "error = excluded.error, attempts = weeks.attempts + 1, updated_at = excluded.updated_at",
+            (job, year_week, status, data, error, time.time()),
+        )
+        self._db.commit()
+
+    def summary(self, job: str) -> Dict[str, int]:
+        rows = self._db.execute("SELECT status, COUNT(*) FROM weeks WHERE job = ? GROUP BY status", (job,))
+        return dict(rows.fetchall())
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,187 @@
+import re
+from datetime import date, timedelta
+from typing import Dict, Optional, Pattern, Set
+
+# Sprachunabhängige Muster, einmal beim Laden kompiliert
+NUMBER_RE = re.compile(r"(\d+)")
+YEAR_RE = re.compile(r"(\d{4})")
+# Nummerierung am Anfang eines Programmpunkts ("3. ...")
+NUMBERING_RE = re.compile(r"^\d+\.\s*")
+
+# Regeltabellen pro Sprache: Texte, an denen die Parser die Programmteile erkennen.
+# rbook/lp sind die Pfadteile der Sprache in /wol/meetings/<rbook>/<lp>.
+# week_title erkennt den Wochenbereich in Inhaltsverzeichnissen der Ausgaben
+# (Starttag, Monat des Starttags falls abweichend, Monat des Endtags).
+LOCALES: Dict[str, Dict[str, object]] = {
+    "de": {
+        "rbook": "r10",
+        "lp": "lp-x",
+        "accept_language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
+        "sections": {
+            "treasures": "SCHÄTZE AUS GOTTES WORT",
+            "ministry": "UNS IM DIENST VERBESSERN",
+            "christian": "UNSER LEBEN ALS CHRIST",
+        },
+        "headings": {
+            "closing": "Schlussworte",
+            "bible_reading": "Bibellesung",
+            "public_talk": "Öffentlicher Vortrag",
+            "study_article": "Studienartikel",
+        },
+        "song": "Lied",
+        "article_song": "LIED",
+        "lesson": "Lektion",
+        "bible_reading_lesson": "th Lektion",
+        "informal_marker": "INFORMELL.",
+        "long_parts": ("bibelstudium", "aktuelles"),
+        "date_range": r"(\d+\.\s+\w+)\s+–\s+(\d+\.\s+\w+\s+\d{4})",
+        "week_title": r"(?P<day>\d{1,2})\.\s*(?:(?P<month>[^\W\d_]+)\s*)?[–-]\s*\d{1,2}\.\s*(?P<end_month>[^\W\d_]+)",
+        "months": ("Januar", "Februar", "März", "April", "Mai", "Juni",
+                   "Juli", "August", "September", "Oktober", "November", "Dezember"),
+    },
+    "en": {
+        "rbook": "r1",
+        "lp": "lp-e",
+        "accept_language": "en-US,en;q=0.9",
+        "sections": {
+            "treasures": "TREASURES FROM GOD’S WORD",
+            "ministry": "APPLY YOURSELF TO THE FIELD MINISTRY",
+            "christian": "LIVING AS CHRISTIANS",
+        },
+        "headings": {
+            "closing": "Concluding Comments",
+            "bible_reading": "Bible Reading",
+            "public_talk": "Public Talk",
+            "study_article": "Watchtower Study",
+        },
+        "song": "Song",
+        "article_song": "SONG",
+        "lesson": "lesson",
+        "bible_reading_lesson": "th study",
+        "informal_marker": "INFORMAL WITNESSING.",
+        "long_parts": ("congregation bible study", "local needs"),
+        "date_range": r"(\w+\s+\d+)\s*[–-]\s*(\w+\s+\d+,\s+\d{4})",
+        "week_title": r"(?P<month>[^\W\d_]+)\s+(?P<day>\d{1,2})\s*[–-]\s*(?:(?P<end_month>[^\W\d_]+)\s+)?\d{1,2}",
+        "months": ("January", "February", "March", "April", "May", "June",
+                   "July", "August", "September", "October", "November", "December"),
+    },
+    "fr": {
+        "rbook": "r30",
+        "lp": "lp-f",
+        "accept_language": "fr-FR,fr;q=0.9,en;q=0.7",
+        "sections": {
+            "treasures": "JOYAUX DE LA PAROLE DE DIEU",
+            "ministry": "APPLIQUE-TOI AU MINISTÈRE",
+            "christian": "VIE CHRÉTIENNE",
+        },
+        "headings": {
+            "closing": "Paroles de conclusion",
+            "bible_reading": "Lecture de la Bible",
+            "public_talk": "Discours public",
+            "study_article": "Étude de La Tour de Garde",
+        },
+        "song": "Cantique",
+        "article_song": "CANTIQUE",
+        "lesson": "leçon",
+        "bible_reading_lesson": "th leçon",
+        "informal_marker": "DE MANIÈRE INFORMELLE.",
+        "long_parts": ("étude biblique de l’assemblée", "besoins de l’assemblée"),
+        "date_range": r"(\d+\s+\w+)\s+[–-]\s+(\d+\s+\w+\s+\d{4})",
+        "week_title": r"(?P<day>\d{1,2})(?:er)?\s*(?:(?P<month>[^\W\d_]+)\s*)?[–-]\s*\d{1,2}\s+(?P<end_month>[^\W\d_]+)",
+        "months": ("janvier", "février", "mars", "avril", "mai", "juin",
+                   "juillet", "août", "septembre", "octobre", "novembre", "décembre"),
+    },
+}
+
+
+def _alternation(needles: Dict[str, str]) -> Pattern:
+    """Eine Alternation mit benannten Gruppen, damit ein Suchlauf alle Schlüssel erkennt"""
+    return re.compile("|".join(f"(?P<{key}>{re.escape(text)})" for key, text in needles.items()))
+
+
+class LocaleRules:
+    """Die Regeltabelle einer Sprache, beim Laden in fertige Matcher übersetzt"""
+
+    def __init__(self, lang: str, table: Dict[str, object]):
+        self.lang = lang
+        self.rbook = table["rbook"]
+        self.lp = table["lp"]
+        self.accept_language = table["accept_language"]
+        self.section_titles: Dict[str, str] = dict(table["sections"])
+        self.heading_titles: Dict[str, str] = dict(table["headings"])
+        self.song = table["song"]
+        self.article_song = table["article_song"]
+        self.lesson = table["lesson"]
+        self.bible_reading_lesson = table["bible_reading_lesson"]
+        self.informal_marker = table["informal_marker"]
+
+        self.section_re = _alternation(self.section_titles)
+        self.heading_re = _alternation(self.heading_titles)
+        self.long_part_re = re.compile("|".join(map(re.escape, table["long_parts"])), re.IGNORECASE)
+        self.date_range_re = re.compile(table["date_range"])
+        self.bible_reading_re = re.compile(
+            re.escape(self.heading_titles["bible_reading"]) + r":\s+([^(]+)(?:\(([^)]+)\))?")
+        # "thLektion" -> "th Lektion"
+        self.lesson_fix_re = re.compile(f"(th|lmd)({re.escape(self.lesson)})")
+        self.week_title_re = re.compile(table["week_title"])
+        # Links auf Wochenseiten derselben Sprache (Navigation zur Vor- und Folgewoche)
+        self.week_link_re = re.compile(
+            rf"/{re.escape(lang)}/wol/meetings/{re.escape(self.rbook)}/{re.escape(self.lp)}/(\d{{4}})/(\d{{1,2}})(?:$|[/?#])")
+        self.months: Dict[str, int] = {name.casefold(): number
+                                       for number, name in enumerate(table["months"], start=1)}
+
+    def meetings_url(self, origin: str = "https://wol.jw.org") -> str:
+        return f"{origin}/{self.lang}/wol/meetings/{self.rbook}/{self.lp}"
+
+    def publication_url(self, symbol: str, origin: str = "https://wol.jw.org") -> str:
+        """Inhaltsverzeichnis einer Ausgabe, z. B. mwb25.03 (Arbeitsheft) oder w25.01 (Wachtturm)"""
+        return f"{origin}/{self.lang}/wol/publication/{self.rbook}/{self.lp}/{symbol}"
+
+    def week_start(self, text: str, near: date) -> Optional[date]:
+        """Montag der Woche aus einem Eintrag wie "3.–9. März"; das Jahr ist das nächstgelegene zu `near`"""
+        match = self.week_title_re.search(text)
+        if not match:
+            return None
+        month = self.months.get((match.group("month") or match.group("end_month")).casefold())
+        if month is None:
+            return None
+        day = int(match.group("day"))
+        candidates = []
+        for year in (near.year - 1, near.year, near.year + 1):
+            try:
+                candidates.append(date(year, month, day))
+            except ValueError:
+                continue
+        if not candidates:
+            return None
+        start = min(candidates, key=lambda candidate: abs(candidate - near))
+        return start - timedelta(days=start.weekday())
+
+    def index_headings(self, headings) -> Dict[str, object]:
+        """Erste Überschrift je Schlüssel (Schlussworte, Bibellesung, ...) in einem Durchlauf"""
+        found = {}
+        for heading in headings:
+            for match in self.heading_re.finditer(heading.text):
+                found.setdefault(match.lastgroup, heading)
+            if len(found) == len(self.heading_titles):
+                break
+        return found
+
+    def sections(self, outline) -> Set[str]:
+        """Vorhandene Abschnitte: über die Symbole, sonst über den Abschnittstitel im Text"""
+        found = set(outline.icons)
+        if len(found) < len(self.section_titles):
+            found.update(match.lastgroup for match in self.section_re.finditer(outline.text))
+        return found
+
+
+# Alle Sprachen werden beim Import kompiliert, der Parse-Pfad kompiliert nichts mehr
+RULES: Dict[str, LocaleRules] = {lang: LocaleRules(lang, table) for lang, table in LOCALES.items()}
+
+
+def get_rules(lang: Optional[str] = None) -> LocaleRules:
+    """Kompilierte Regeln einer Sprache (Standard: de)"""
+    rules = RULES.get(lang or "de")
+    if rules is None:
+        raise ValueError(f"Unbekannte Sprache: {lang} (verfügbar: {', '.join(sorted(RULES))})")
+    return rules
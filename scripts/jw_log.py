@@ -0,0 +1,38 @@
+import json
+import logging
+import sys
+from typing import Optional, TextIO, Tuple
+
+# Alle Scraper-Module loggen unterhalb dieses Namens (jw_scraper läuft oft als __main__)
+LOGGER = "jw_scraper"
+LEVELS = ("debug", "info", "warning", "error")
+
+# Zuletzt gesetzte (Stufe, Format), damit Pool-Prozesse dieselbe Einstellung übernehmen
+settings: Optional[Tuple[str, str]] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Eine JSON-Zeile pro Meldung, wie die Spans von --metrics-log"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {"ts": round(record.created, 3), "level": record.levelname.lower(), "msg": record.getMessage()}
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure(level: str = "info", fmt: str = "text", stream: Optional[TextIO] = None) -> logging.Logger:
+    """Meldungen ab `level` nach stderr, als Text oder (fmt="json") als JSON-Lines
+
+    stdout bleibt damit den Ergebnissen vorbehalten.
+    """
+    global settings
+    settings = (level, fmt)
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter("%(levelname)-7s %(message)s"))
+
+    logger = logging.getLogger(LOGGER)
+    logger.handlers[:] = [handler]
+    logger.setLevel(level.upper())
+    logger.propagate = False
+    return logger
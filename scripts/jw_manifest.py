@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import time
+from typing import Optional
+
+
+class WeekManifest:
+    """Verzeichnis der Wochenseiten, die es upstream gibt bzw. (noch) nicht gibt, in SQLite
+
+    Vorhandene Wochen kommen aus geladenen Wochenseiten (Überschrift mit
+    Datumsbereich) und deren Navigations-Links, fehlende aus 404-Antworten.
+    Fehlende Wochen gelten nur `missing_ttl` Sekunden lang als fehlend,
+    danach wird wieder nachgesehen, ob sie inzwischen veröffentlicht sind.
+    """
+
+    def __init__(self, path: str = os.path.join("temp", "jw_manifest.sqlite"), missing_ttl: float = 24 * 3600):
+        self.path = path
+        self.missing_ttl = missing_ttl
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS weeks (
+                url TEXT PRIMARY KEY,
+                year_week TEXT NOT NULL,
+                status TEXT NOT NULL,
+                title TEXT,
+                start TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def mark_available(self, url: str, year_week: str, title: Optional[str] = None, start: Optional[str] = None):
+        """Woche existiert; Titel und Wochenbeginn bleiben erhalten, wenn sie hier fehlen (Navigations-Links)"""
+        self._db.execute(
+            "INSERT INTO weeks (url, year_week, status, title, start, updated_at) VALUES (?, ?, 'available', ?, ?, ?) "
+            "ON CONFLICT (url) DO UPDATE SET status = 'available', title = COALESCE(excluded.title, weeks.title), "
+            "start = COALESCE(excluded.start, weeks.start), updated_at = excluded.updated_at",
+            (url, year_week, title, start, time.time()),
+        )
+        self._db.commit()
+
+    def mark_missing(self, url: str, year_week: str):
+        self._db.execute(
+            "INSERT INTO weeks (url, year_week, status, updated_at) VALUES (?, ?, 'missing', ?) "
+            "ON CONFLICT (url) DO UPDATE SET status = 'missing', updated_at = excluded.updated_at",
+            (url, year_week, time.time()),
+        )
+        self._db.commit()
+
+    def is_missing(self, url: str) -> bool:
+        """True, wenn die Seite vor kurzem (innerhalb von missing_ttl) nicht vorhanden war"""
+        row = self._db.execute(
+            "SELECT 1 FROM weeks WHERE url = ? AND status = 'missing' AND updated_at > ?",
+            (url, time.time() - self.missing_ttl),
+        ).fetchone()
+        return row is not None
+
+    def close(self):
+        self._db.close()
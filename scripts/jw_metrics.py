@@ -0,0 +1,93 @@
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+
+class Span:
+    """Ein gemessener Abschnitt (Abruf, Parsing, ...) mit frei setzbaren Attributen"""
+
+    __slots__ = ("name", "attrs", "started", "duration")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self.started = time.time()
+        self.duration = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"span": self.name, "ts": round(self.started, 3), "duration_ms": round(self.duration * 1000, 2), **self.attrs}
+
+
+class Metrics:
+    """Sammelt Spans, aggregiert sie für den Export und schreibt sie optional als JSON-Lines"""
+
+    def __init__(self, sink: Optional[TextIO] = None):
+        self.sink = sink
+        # (Span-Name, Seitenart) -> [Anzahl, Summe Sekunden]
+        self.durations: Dict[Tuple[str, str], list] = defaultdict(lambda: [0, 0.0])
+        # (Zählername, Seitenart, Zusatzlabel) -> Wert
+        self.counters: Dict[Tuple[str, str, str], float] = defaultdict(float)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        span = Span(name, attrs)
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - started
+            self._record(span)
+
+    def _record(self, span: Span):
+        kind = span.attrs.get("kind", "")
+        entry = self.durations[(span.name, kind)]
+        entry[0] += 1
+        entry[1] += span.duration
+
+        if span.name == "fetch":
+            self.counters[("fetch_bytes_total", kind, "")] += span.attrs.get("bytes", 0)
+            self.counters[("fetch_retries_total", kind, "")] += span.attrs.get("retries", 0)
+            self.counters[("fetch_cache_total", kind, span.attrs.get("cache", "miss"))] += 1
+            if span.attrs.get("error"):
+                self.counters[("fetch_errors_total", kind, "")] += 1
+            if span.attrs.get("truncated"):
+                self.counters[("fetch_truncated_total", kind, "")] += 1
+
+        if self.sink:
+            self.sink.write(json.dumps(span.to_dict(), ensure_ascii=False) + "\n")
+            self.sink.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregierte Werte als JSON-taugliches Dict"""
+        return {
+            "spans": [
+                {"span": name, "kind": kind, "count": count, "seconds": round(total, 6)}
+                for (name, kind), (count, total) in sorted(self.durations.items())
+            ],
+            "counters": [
+                {"counter": name, "kind": kind, "label": label, "value": value}
+                for (name, kind, label), value in sorted(self.counters.items())
+            ],
+        }
+
+    def prometheus(self) -> str:
+        """Aggregierte Werte im Prometheus-Textformat"""
+        lines = [
+            "# HELP jw_scraper_span_seconds Dauer der Scraper-Abschnitte",
+            "# TYPE jw_scraper_span_seconds summary",
+        ]
+        for (name, kind), (count, total) in sorted(self.durations.items()):
+            labels = f'span="{name}",kind="{kind}"'
+            lines.append(f"jw_scraper_span_seconds_count{{{labels}}} {count}")
+            lines.append(f"jw_scraper_span_seconds_sum{{{labels}}} {total:.6f}")
+
+        typed = set()
+        for (name, kind, label), value in sorted(self.counters.items()):
+            if name not in typed:
+                lines.append(f"# TYPE jw_scraper_{name} counter")
+                typed.add(name)
+            labels = f'kind="{kind}"' + (f',result="{label}"' if label else "")
+            lines.append(f"jw_scraper_{name}{{{labels}}} {value:g}")
+        return "\n".join(lines) + "\n"
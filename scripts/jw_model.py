@@ -0,0 +1,324 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Schneller JSON-Encoder, falls installiert; sonst die Standardbibliothek
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Grenzen aus der Weeks-Collection (src/collections/Weeks/index.ts)
+SONG_RANGE = (1, 151)
+TALK_DURATION_RANGE = (5, 30)
+BIBLE_READING_DURATION_RANGE = (1, 10)
+ASSIGNMENT_DURATION_RANGE = (1, 30)
+
+
+class ValidationError(ValueError):
+    """Ein Datensatz passt nicht zu dem, was die Weeks-Collection annimmt"""
+
+    def __init__(self, problems: List[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+def _check_number(problems: List[str], path: str, value, bounds) -> None:
+    low, high = bounds
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        problems.append(f"{path}: {value!r} liegt nicht zwischen {low} und {high}")
+
+
+def _check_text(problems: List[str], path: str, value) -> None:
+    if not isinstance(value, str):
+        problems.append(f"{path}: Text erwartet, nicht {type(value).__name__}")
+
+
+def _mapping(data, path: str) -> Dict[str, Any]:
+    if not isinstance(data, dict):
+        raise ValidationError([f"{path}: Objekt erwartet, nicht {type(data).__name__}"])
+    return data
+
+
+@dataclass(slots=True)
+class FieldMinistryAssignment:
+    title: str
+    lesson: str = ""
+    duration: int = 4
+    id: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "lesson": self.lesson, "duration": self.duration, "id": self.id}
+
+    @classmethod
+    def from_dict(cls, data) -> "FieldMinistryAssignment":
+        data = _mapping(data, "fieldMinistryAssignments[]")
+        return cls(data.get("title", ""), data.get("lesson", ""), data.get("duration", 4), data.get("id", ""))
+
+    def problems(self, path: str) -> List[str]:
+        problems = []
+        _check_text(problems, f"{path}.title", self.title)
+        _check_text(problems, f"{path}.lesson", self.lesson)
+        _check_number(problems, f"{path}.duration", self.duration, ASSIGNMENT_DURATION_RANGE)
+        _check_text(problems, f"{path}.id", self.id)
+        return problems
+
+
+@dataclass(slots=True)
+class LivingAsChristiansAssignment:
+    title: str
+    duration: int = 5
+    id: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "duration": self.duration, "id": self.id}
+
+    @classmethod
+    def from_dict(cls, data) -> "LivingAsChristiansAssignment":
+        data = _mapping(data, "assignments[]")
+        return cls(data.get("title", ""), data.get("duration", 5), data.get("id", ""))
+
+    def problems(self, path: str) -> List[str]:
+        problems = []
+        _check_text(problems, f"{path}.title", self.title)
+        _check_number(problems, f"{path}.duration", self.duration, ASSIGNMENT_DURATION_RANGE)
+        _check_text(problems, f"{path}.id", self.id)
+        return problems
+
+
+@dataclass(slots=True)
+class TreasuresFromGodsWord:
+    talk_title: str = ""
+    talk_duration: int = 10
+    spiritual_gems_duration: int = 10
+    bible_reading_scripture: str = ""
+    bible_reading_lesson: str = ""
+    bible_reading_duration: int = 4
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "talkTitle": self.talk_title,
+            "talkDuration": self.talk_duration,
+            "spiritualGemsDuration": self.spiritual_gems_duration,
+            "bibleReadingScripture": self.bible_reading_scripture,
+            "bibleReadingLesson": self.bible_reading_lesson,
+            "bibleReadingDuration": self.bible_reading_duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data) -> "TreasuresFromGodsWord":
+        data = _mapping(data, "treasuresFromGodsWord")
+        return cls(
+            talk_title=data.get("talkTitle", ""),
+            talk_duration=data.get("talkDuration", 10),
+            spiritual_gems_duration=data.get("spiritualGemsDuration", 10),
+            bible_reading_scripture=data.get("bibleReadingScripture", ""),
+            bible_reading_lesson=data.get("bibleReadingLesson", ""),
+            bible_reading_duration=data.get("bibleReadingDuration", 4),
+        )
+
+    def problems(self, path: str) -> List[str]:
+        problems = []
+        _check_text(problems, f"{path}.talkTitle", self.talk_title)
+        _check_number(problems, f"{path}.talkDuration", self.talk_duration, TALK_DURATION_RANGE)
+        _check_number(problems, f"{path}.spiritualGemsDuration", self.spiritual_gems_duration, TALK_DURATION_RANGE)
+        _check_text(problems, f"{path}.bibleReadingScripture", self.bible_reading_scripture)
+        _check_text(problems, f"{path}.bibleReadingLesson", self.bible_reading_lesson)
+        _check_number(problems, f"{path}.bibleReadingDuration", self.bible_reading_duration,
+                      BIBLE_READING_DURATION_RANGE)
+        return problems
+
+
+@dataclass(slots=True)
+class MidweekMeeting:
+    opening_song: int = 0
+    treasures: TreasuresFromGodsWord = field(default_factory=TreasuresFromGodsWord)
+    field_ministry_assignments: List[FieldMinistryAssignment] = field(default_factory=list)
+    living_as_christians_song: int = 0
+    living_as_christians_assignments: List[LivingAsChristiansAssignment] = field(default_factory=list)
+    closing_song: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "openingSong": self.opening_song,
+            "treasuresFromGodsWord": self.treasures.to_dict(),
+            "applyYourselfToFieldMinistry": {
+                "fieldMinistryAssignments": [item.to_dict() for item in self.field_ministry_assignments],
+            },
+            "livingAsChristians": {
+                "livingAsChristiansSong": self.living_as_christians_song,
+                "assignments": [item.to_dict() for item in self.living_as_christians_assignments],
+            },
+            "closingSong": self.closing_song,
+        }
+
+    @classmethod
+    def from_dict(cls, data) -> "MidweekMeeting":
+        data = _mapping(data, "midweekMeeting")
+        ministry = _mapping(data.get("applyYourselfToFieldMinistry", {}), "applyYourselfToFieldMinistry")
+        christian = _mapping(data.get("livingAsChristians", {}), "livingAsChristians")
+        return cls(
+            opening_song=data.get("openingSong", 0),
+            treasures=TreasuresFromGodsWord.from_dict(data.get("treasuresFromGodsWord", {})),
+            field_ministry_assignments=[FieldMinistryAssignment.from_dict(item)
+                                        for item in ministry.get("fieldMinistryAssignments", [])],
+            living_as_christians_song=christian.get("livingAsChristiansSong", 0),
+            living_as_christians_assignments=[LivingAsChristiansAssignment.from_dict(item)
+                                              for item in christian.get("assignments", [])],
+            closing_song=data.get("closingSong", 0),
+        )
+
+    def problems(self, path: str = "midweekMeeting") -> List[str]:
+        problems = []
+        _check_number(problems, f"{path}.openingSong", self.opening_song, SONG_RANGE)
+        problems += self.treasures.problems(f"{path}.treasuresFromGodsWord")
+        for index, item in enumerate(self.field_ministry_assignments):
+            problems += item.problems(f"{path}.applyYourselfToFieldMinistry.fieldMinistryAssignments[{index}]")
+        _check_number(problems, f"{path}.livingAsChristians.livingAsChristiansSong",
+                      self.living_as_christians_song, SONG_RANGE)
+        for index, item in enumerate(self.living_as_christians_assignments):
+            problems += item.problems(f"{path}.livingAsChristians.assignments[{index}]")
+        _check_number(problems, f"{path}.closingSong", self.closing_song, SONG_RANGE)
+        return problems
+
+
+@dataclass(slots=True)
+class WeekendMeeting:
+    opening_song: int = 0
+    middle_song: int = 0
+    closing_song: int = 0
+    # None: Titel unbekannt (z. B. beim Laden aus den Ausgaben), der gespeicherte Titel bleibt
+    public_talk_title: Optional[str] = None
+    public_talk_duration: int = 30
+    watchtower_study_title: str = ""
+    watchtower_study_duration: int = 60
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "openingSong": self.opening_song,
+            "middleSong": self.middle_song,
+            "closingSong": self.closing_song,
+            "publicTalkTitle": self.public_talk_title,
+            "publicTalkDuration": self.public_talk_duration,
+            "watchtowerStudyTitle": self.watchtower_study_title,
+            "watchtowerStudyDuration": self.watchtower_study_duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data) -> "WeekendMeeting":
+        data = _mapping(data, "weekendMeeting")
+        return cls(
+            opening_song=data.get("openingSong", 0),
+            middle_song=data.get("middleSong", 0),
+            closing_song=data.get("closingSong", 0),
+            public_talk_title=data.get("publicTalkTitle"),
+            public_talk_duration=data.get("publicTalkDuration", 30),
+            watchtower_study_title=data.get("watchtowerStudyTitle", ""),
+            watchtower_study_duration=data.get("watchtowerStudyDuration", 60),
+        )
+
+    def problems(self, path: str = "weekendMeeting") -> List[str]:
+        # Die Dauern werden nicht in die Collection übernommen, nur die Lieder und Titel
+        problems = []
+        _check_number(problems, f"{path}.openingSong", self.opening_song, SONG_RANGE)
+        _check_number(problems, f"{path}.middleSong", self.middle_song, SONG_RANGE)
+        _check_number(problems, f"{path}.closingSong", self.closing_song, SONG_RANGE)
+        if self.public_talk_title is not None:
+            _check_text(problems, f"{path}.publicTalkTitle", self.public_talk_title)
+        _check_text(problems, f"{path}.watchtowerStudyTitle", self.watchtower_study_title)
+        return problems
+
+
+@dataclass(slots=True)
+class MeetingWeek:
+    """Ergebnis einer Woche; ein Teil ist None, wenn er nicht gefunden wurde"""
+
+    midweek: Optional[MidweekMeeting] = None
+    weekend: Optional[WeekendMeeting] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.midweek is not None and self.weekend is not None
+
+    @property
+    def uses_defaults(self) -> bool:
+        """True, wenn ein Teil nicht gefunden und durch die Standarddaten ersetzt wurde"""
+        return self.midweek is DEFAULT_MIDWEEK or self.weekend is DEFAULT_WEEKEND
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "midweekMeeting": self.midweek.to_dict() if self.midweek is not None else None,
+            "weekendMeeting": self.weekend.to_dict() if self.weekend is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data) -> "MeetingWeek":
+        """Liest einen gespeicherten Datensatz ein und prüft ihn; wirft ValidationError"""
+        data = _mapping(data, "week")
+        midweek = data.get("midweekMeeting")
+        weekend = data.get("weekendMeeting")
+        week = cls(MidweekMeeting.from_dict(midweek) if midweek is not None else None,
+                   WeekendMeeting.from_dict(weekend) if weekend is not None else None)
+        week.validate()
+        return week
+
+    def validate(self) -> "MeetingWeek":
+        problems = []
+        if self.midweek is not None:
+            problems += self.midweek.problems()
+        if self.weekend is not None:
+            problems += self.weekend.problems()
+        if problems:
+            raise ValidationError(problems)
+        return self
+
+
+# Platzhalter, wenn eine Woche nicht gefunden wird; einmal gebaut und nur gelesen, nie verändert
+DEFAULT_MIDWEEK = MidweekMeeting(
+    opening_song=11,
+    treasures=TreasuresFromGodsWord(
+        talk_title="Was wir von den Ameisen lernen können",
+        bible_reading_scripture="Sprüche 6:1-26",
+        bible_reading_lesson="th Lektion 10",
+    ),
+    field_ministry_assignments=[
+        FieldMinistryAssignment("Gespräche beginnen", "lmd Lektion 4, Punkt 3", 4, "1"),
+        FieldMinistryAssignment("Gespräche beginnen", "lmd Lektion 3, Punkt 3", 4, "2"),
+        FieldMinistryAssignment("Gespräche beginnen", "lmd Lektion 5, Punkt 3", 4, "3"),
+    ],
+    living_as_christians_song=2,
+    living_as_christians_assignments=[
+        LivingAsChristiansAssignment("Jehovas Schöpfung gibt uns Gründe zur Freude – Faszinierende Tiere", 5, "1"),
+        LivingAsChristiansAssignment("Aktuelles", 10, "2"),
+        LivingAsChristiansAssignment("Versammlungs\xadbibelstudium", 30, "3"),
+    ],
+    closing_song=126,
+)
+
+DEFAULT_WEEKEND = WeekendMeeting(
+    opening_song=11,
+    middle_song=18,
+    closing_song=107,
+    public_talk_title="Öffentlicher Vortrag",
+    watchtower_study_title="Was wir durch das Lösegeld lernen",
+)
+
+
+def _to_dict(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"{type(value).__name__} ist nicht serialisierbar")
+
+
+def dumps(value, compact: bool = False) -> str:
+    """Serialisiert Modellobjekte (auch in Listen und Dicts) als JSON
+
+    compact=True lässt Einrückung und Leerzeichen weg (NDJSON, Worker-Protokoll).
+    """
+    if orjson is not None:
+        # Ohne PASSTHROUGH würde orjson Dataclasses selbst (mit Python-Feldnamen) serialisieren
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | (0 if compact else orjson.OPT_INDENT_2)
+        return orjson.dumps(value, default=_to_dict, option=option).decode("utf-8")
+    if compact:
+        return json.dumps(value, default=_to_dict, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, default=_to_dict, ensure_ascii=False, indent=2)
@@ -0,0 +1,233 @@
+import os
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from typing import Dict, List, Optional
+
+# Parser-Backend: lxml ist deutlich schneller als html.parser, aber optional.
+# Nur nachsehen, nicht importieren: bs4 und lxml werden erst beim ersten Parsen geladen.
+DEFAULT_BACKEND = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+# Abschnittssymbole der Wochenübersicht
+SECTION_ICONS = {
+    "dc-icon--gem": "treasures",
+    "dc-icon--wheat": "ministry",
+    "dc-icon--sheep": "christian",
+}
+
+
+def classify_url(url: str) -> str:
+    """Seitenart einer wol.jw.org-URL: week, issue, toc, article oder other"""
+    if "/meetings/" in url:
+        return "week"
+    if "/publication/" in url:
+        return "issue"
+    if "/tc/" in url:
+        return "toc"
+    if "/d/" in url:
+        return "article"
+    return "other"
+
+
+def make_soup(html: str, backend: Optional[str] = None):
+    """Baut den Dokumentbaum mit dem gewählten (oder schnellsten verfügbaren) Backend"""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, backend or os.environ.get("JW_SCRAPER_PARSER") or DEFAULT_BACKEND)
+
+
+class Heading:
+    """Eine h3-Überschrift mit vorberechnetem Text und den Folgeblöcken"""
+
+    __slots__ = ("element", "text", "classes", "links", "next_div", "next_block")
+
+    def __init__(self, element):
+        self.element = element
+        self.text = element.get_text(strip=True)
+        self.classes = element.get("class") or ()
+        self.links = element.find_all("a")
+        # Nächstes div bzw. nächstes div.du-margin-inlineStart--5 in Dokumentreihenfolge
+        self.next_div = None
+        self.next_block = None
+
+    def link_containing(self, needle: str):
+        for link in self.links:
+            if needle in link.get_text():
+                return link
+        return None
+
+
+class WeekOutline:
+    """Zwischenform der Wochenübersicht, in einem einzigen Durchlauf aufgebaut"""
+
+    def __init__(self):
+        self.headings: List[Heading] = []
+        self.h2_texts: List[tuple] = []
+        self.icons: Dict[str, object] = {}
+        self.toc = None
+        self.text = ""
+        # Überschrift der Woche (h1, z. B. "3.–9. MÄRZ") und Links auf andere Wochenseiten
+        self.title = ""
+        self.week_links: List[str] = []
+
+
+def build_week_outline(soup) -> WeekOutline:
+    """Klassifiziert Überschriften, Abschnittssymbole und Folgeblöcke in einem Durchlauf"""
+    outline = WeekOutline()
+    awaiting_div: List[Heading] = []
+    awaiting_block: List[Heading] = []
+
+    for element in soup.find_all(True):
+        name = element.name
+        if name == "div":
+            if awaiting_div:
+                for heading in awaiting_div:
+                    heading.next_div = element
+                awaiting_div.clear()
+
+            classes = element.get("class") or ()
+            if awaiting_block and "du-margin-inlineStart--5" in classes:
+                for heading in awaiting_block:
+                    heading.next_block = element
+                awaiting_block.clear()
+
+            for cls in classes:
+                section = SECTION_ICONS.get(cls)
+                if section and section not in outline.icons:
+                    outline.icons[section] = element
+
+            if (outline.toc is None and "groupTOC" in classes
+                    and element.find_parent("div", class_="itemData")):
+                outline.toc = element
+        elif name == "h3":
+            heading = Heading(element)
+            outline.headings.append(heading)
+            awaiting_div.append(heading)
+            awaiting_block.append(heading)
+        elif name == "h2":
+            outline.h2_texts.append((element, element.get_text()))
+        elif name == "h1":
+            if not outline.title:
+                outline.title = element.get_text(" ", strip=True)
+        elif name == "a":
+            href = element.get("href")
+            if href and "/meetings/" in href:
+                outline.week_links.append(href)
+
+    outline.text = soup.get_text()
+    return outline
+
+
+def find_article_link(toc_soup, lp: str) -> Optional[str]:
+    """Sucht im Inhaltsverzeichnis den Link zum eigentlichen Artikel (/d/)
+
+    Ohne markierten Link (jwac) gilt der erste Artikel-Link der Sprache (`lp` der Sprachregeln).
+    """
+    fallback = None
+    for link in toc_soup.find_all("a", href=True):
+        href = link["href"]
+        if "/d/" not in href:
+            continue
+        if "jwac" in (link.get("class") or ()):
+            return href
+        if fallback is None and f"/{lp}/" in href:
+            fallback = href
+    return fallback
+
+
+def find_issue_entries(issue_soup) -> List[tuple]:
+    """Dokument-Links (/d/) im Inhaltsverzeichnis einer Ausgabe: (href, Linktext, Text des Eintrags)
+
+    Der Eintrag ist das umgebende li, sonst das Elternelement des Links;
+    dort steht bei Wachtturm-Artikeln die Studienwoche neben dem Titel.
+    """
+    entries = []
+    for link in issue_soup.find_all("a", href=True):
+        href = link["href"]
+        if "/d/" not in href:
+            continue
+        entry = link.find_parent("li") or link.parent
+        entries.append((href, link.get_text(strip=True), entry.get_text(" ", strip=True)))
+    return entries
+
+
+def find_song_links(article_soup, needle: str = "LIED") -> List[object]:
+    """Alle Lied-Verweise im Artikel (p.pubRefs bzw. div.du-color--textSubdued), in Dokumentreihenfolge"""
+    songs = []
+    for link in article_soup.find_all("a"):
+        if needle not in link.get_text():
+            continue
+        for parent in link.parents:
+            classes = parent.get("class") or ()
+            if ((parent.name == "p" and "pubRefs" in classes)
+                    or (parent.name == "div" and "du-color--textSubdued" in classes)):
+                songs.append(link)
+                break
+    return songs
+
+
+class SongLinkScanner(HTMLParser):
+    """Ereignisbasierte Variante von find_song_links für gestreamte Artikelseiten
+
+    Nimmt den Text stückweise über feed() entgegen, ohne einen Dokumentbaum
+    aufzubauen, und setzt `done`, sobald das <article>-Element geschlossen
+    ist; alles danach (Fußzeile, Skripte) wird nicht mehr gebraucht.
+    """
+
+    def __init__(self, needle: str = "LIED"):
+        self.needle = needle
+        # HTMLParser.__init__ ruft reset() auf
+        super().__init__(convert_charrefs=True)
+
+    def reset(self):
+        """Zurück auf Anfang, z. B. wenn ein Abruf nach teilweise gelesenem Body wiederholt wird"""
+        super().reset()
+        self.songs: List[str] = []
+        self.done = False
+        # Offene p/div/article-Elemente: (Tagname, ist Lied-Container)
+        self._open: List[tuple] = []
+        self._containers = 0
+        self._link_parts: Optional[List[str]] = None
+
+    def feed(self, data: str):
+        if not self.done:
+            super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self._link_parts = []
+            return
+        if tag not in ("p", "div", "article"):
+            return
+        # Ein Block-Element schließt ein offenes p implizit
+        if self._open and self._open[-1][0] == "p":
+            self._pop()
+        classes = (dict(attrs).get("class") or "").split()
+        container = ((tag == "p" and "pubRefs" in classes)
+                     or (tag == "div" and "du-color--textSubdued" in classes))
+        self._open.append((tag, container))
+        self._containers += container
+
+    def handle_endtag(self, tag):
+        if tag == "a":
+            parts, self._link_parts = self._link_parts, None
+            if parts is not None and self._containers and self.needle in "".join(parts):
+                # Wie get_text(strip=True): jedes Textstück einzeln getrimmt
+                self.songs.append("".join(part.strip() for part in parts))
+            return
+        if not any(name == tag for name, _ in self._open):
+            return
+        while self._open:
+            name, _ = self._pop()
+            if name == tag:
+                break
+        if tag == "article":
+            self.done = True
+
+    def handle_data(self, data):
+        if self._link_parts is not None:
+            self._link_parts.append(data)
+
+    def _pop(self):
+        name, container = self._open.pop()
+        self._containers -= container
+        return name, container
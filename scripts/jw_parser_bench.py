@@ -0,0 +1,84 @@
+"""Micro-Benchmark: Selektor-Abfragen (bisheriger Parser) gegen den Einzeldurchlauf (WeekOutline)
+
+Aufruf: python3 scripts/jw_parser_bench.py [WOCHE.html] [--rounds 20] [--article ARTIKEL.html]
+"""
+import argparse
+import os
+import time
+
+from jw_parser import DEFAULT_BACKEND, SongLinkScanner, build_week_outline, find_song_links, make_soup
+
+# Die Abfragen, die _parse_midweek_meeting/_parse_weekend_meeting bisher pro Woche ausgeführt haben
+LEGACY_SELECTORS = [
+    "h3.dc-icon--music a, h3 a:-soup-contains('Lied')",
+    "div.dc-icon--sheep + h3.dc-icon--music, div:-soup-contains('UNSER LEBEN ALS CHRIST') + h3 a:-soup-contains('Lied')",
+    "h3:-soup-contains('Schlussworte')",
+    "div.dc-icon--gem, div:-soup-contains('SCHÄTZE AUS GOTTES WORT')",
+    "div.dc-icon--gem + div h3, h2:-soup-contains('SCHÄTZE AUS GOTTES WORT') + * h3",
+    "h3:-soup-contains('Bibellesung')",
+    "div.dc-icon--wheat, div:-soup-contains('UNS IM DIENST VERBESSERN')",
+    "h3.du-fontSize--base.du-color--gold-700",
+    "div.dc-icon--sheep, div:-soup-contains('UNSER LEBEN ALS CHRIST')",
+    "h3.du-fontSize--base.du-color--maroon-600",
+    "h3:-soup-contains('Öffentlicher Vortrag')",
+    "h3:-soup-contains('Studienartikel')",
+    "div.itemData div.groupTOC",
+]
+
+
+def legacy_queries(soup):
+    for selector in LEGACY_SELECTORS:
+        soup.select_one(selector)
+
+
+def scan_songs(html, chunk_size=16 * 1024):
+    scanner = SongLinkScanner()
+    for start in range(0, len(html), chunk_size):
+        scanner.feed(html[start:start + chunk_size])
+        if scanner.done:
+            break
+    return scanner.songs
+
+
+def measure(label, func, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - started) / rounds * 1000
+    print(f"{label:<40} {elapsed:8.2f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-Benchmark für den Wochen-Parser')
+    parser.add_argument('html_file', nargs='?',
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'week_2025_10.html'),
+                        help='Gespeicherte Wochenübersicht (Standard: fixtures/week_2025_10.html)')
+    parser.add_argument('--rounds', type=int, default=20, help='Wiederholungen pro Messung (Standard: 20)')
+    parser.add_argument('--article',
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'article_2025123.html'),
+                        help='Gespeicherter Studienartikel für den Lieder-Vergleich (Standard: fixtures/article_2025123.html)')
+    args = parser.parse_args()
+
+    with open(args.html_file, encoding='utf-8') as f:
+        html = f.read()
+
+    backends = ['html.parser'] if DEFAULT_BACKEND == 'html.parser' else ['html.parser', DEFAULT_BACKEND]
+    for backend in backends:
+        measure(f"Baum aufbauen ({backend})", lambda: make_soup(html, backend), args.rounds)
+
+    soup = make_soup(html, 'html.parser')
+    legacy = measure("Selektor-Abfragen (bisher)", lambda: legacy_queries(soup), args.rounds)
+    outline = measure("Einzeldurchlauf (WeekOutline)", lambda: build_week_outline(soup), args.rounds)
+    print(f"Faktor: {legacy / outline:.1f}x")
+
+    with open(args.article, encoding='utf-8') as f:
+        article = f.read()
+
+    tree = measure("Artikel: Baum + find_song_links", lambda: find_song_links(make_soup(article)), args.rounds)
+    streamed = measure("Artikel: SongLinkScanner (Stücke)", lambda: scan_songs(article), args.rounds)
+    print(f"Faktor: {tree / streamed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
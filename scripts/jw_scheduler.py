@@ -0,0 +1,247 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from jw_log import LOGGER
+
+log = logging.getLogger(LOGGER)
+
+# Statuscodes, bei denen sich ein erneuter Versuch lohnt
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+# Statuscodes, mit denen der Server signalisiert, dass wir zu schnell sind
+THROTTLE_STATUS = {429}
+# Oft nur ein kurzer Aussetzer: gilt erst mit Retry-After oder wiederholt als Drosselung
+UNAVAILABLE_STATUS = 503
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After als Sekunden (Zahl oder HTTP-Datum)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Einfacher Token-Bucket: `rate` Anfragen pro Sekunde, bis zu `capacity` auf einmal"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        # Der Lock sorgt dafür, dass wartende Anfragen in Ankunftsreihenfolge bedient werden
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class CircuitBreaker:
+    """Pausiert alle Anfragen an einen Host, wenn er drosselt oder wiederholt fehlschlägt
+
+    Mit Retry-After dauert die Pause so lange wie angegeben. Ohne Retry-After wird
+    nach der Pause wieder angefragt; schlägt es erneut fehl, verdoppelt sich die
+    Pause bis `max_cooldown`. Ein Erfolg setzt den Zustand zurück.
+    Ein einzelner 503 ohne Retry-After pausiert nicht, erst der zweite in Folge.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0, max_cooldown: float = 600.0):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.failures = 0
+        # 503-Antworten in Folge
+        self.unavailable = 0
+        self.open_until = 0.0
+
+    async def wait(self):
+        remaining = self.open_until - time.monotonic()
+        while remaining > 0:
+            await asyncio.sleep(remaining)
+            remaining = self.open_until - time.monotonic()
+
+    def record_success(self):
+        self.failures = 0
+        self.unavailable = 0
+        self.cooldown = self.base_cooldown
+
+    def record_failure(self, retry_after: Optional[float] = None, status: Optional[int] = None) -> bool:
+        """Zählt einen Fehlschlag (`status` bei HTTP-Fehlern); gibt True zurück, wenn der Host dadurch pausiert wird"""
+        self.failures += 1
+        self.unavailable = self.unavailable + 1 if status == UNAVAILABLE_STATUS else 0
+        throttled = status in THROTTLE_STATUS or self.unavailable >= 2
+        if not (throttled or retry_after is not None or self.failures >= self.failure_threshold):
+            return False
+
+        if retry_after is not None:
+            # Der Server nennt die Wartezeit selbst: genau so lange pausieren (höchstens max_cooldown)
+            pause = min(retry_after, self.max_cooldown)
+        else:
+            pause = self.cooldown
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+        self.open_until = max(self.open_until, time.monotonic() + pause)
+        return True
+
+
+class AimdController:
+    """Passt das Anfragebudget eines Hosts an (additive increase, multiplicative decrease)
+
+    Schnelle 200er erhöhen den Takt schrittweise, langsame Antworten senken
+    ihn leicht, Drosselung, 5xx und Netzwerkfehler halbieren ihn.
+    """
+
+    def __init__(self, rate: float, min_rate: float = 0.2, max_rate: float = 4.0,
+                 increase: float = 0.1, slow_decrease: float = 0.8, error_decrease: float = 0.5,
+                 latency_target: float = 1.5):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max_rate, max(min_rate, rate))
+        self.increase = increase
+        self.slow_decrease = slow_decrease
+        self.error_decrease = error_decrease
+        self.latency_target = latency_target
+
+    def on_success(self, latency: float) -> float:
+        if latency <= self.latency_target:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+        else:
+            self.rate = max(self.min_rate, self.rate * self.slow_decrease)
+        return self.rate
+
+    def on_failure(self) -> float:
+        self.rate = max(self.min_rate, self.rate * self.error_decrease)
+        return self.rate
+
+
+class RequestScheduler:
+    """Begrenzt gleichzeitige Anfragen und verteilt sie höflich über ein Budget pro Host
+
+    Mit `adaptive` ist requests_per_second nur der Startwert: das Budget jedes
+    Hosts folgt Latenz und Fehlern (AimdController) und kann über
+    load_rates/save_rates zwischen Läufen erhalten bleiben.
+    """
+
+    def __init__(self, concurrency: int = 4, requests_per_second: float = 1.0,
+                 burst: float = 2, jitter: float = 0.25, adaptive: bool = False,
+                 min_rate: float = 0.2, max_rate: float = 4.0):
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.jitter = jitter
+        self.adaptive = adaptive and requests_per_second > 0
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._controllers: Dict[str, AimdController] = {}
+        # Gelernte Budgets aus früheren Läufen, Startwert für neue Hosts
+        self._initial_rates: Dict[str, float] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self._controller(host).rate if self.adaptive else self.requests_per_second,
+                                 self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _controller(self, host: str) -> AimdController:
+        controller = self._controllers.get(host)
+        if controller is None:
+            controller = AimdController(self._initial_rates.get(host, self.requests_per_second),
+                                        self.min_rate, self.max_rate)
+            self._controllers[host] = controller
+        return controller
+
+    def _adapt(self, url: str, latency: Optional[float]):
+        if not self.adaptive:
+            return
+        host = urlsplit(url).netloc
+        controller = self._controller(host)
+        rate = controller.on_failure() if latency is None else controller.on_success(latency)
+        self._bucket(host).rate = rate
+
+    def rates(self) -> Dict[str, float]:
+        """Aktuelles Budget (Anfragen/s) pro Host"""
+        return {host: controller.rate for host, controller in self._controllers.items()}
+
+    def load_rates(self, path: str):
+        """Gelernte Budgets eines früheren Laufs übernehmen (fehlende oder kaputte Datei: Startwerte)"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._initial_rates = {host: float(rate) for host, rate in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            self._initial_rates = {}
+
+    def save_rates(self, path: str):
+        rates = {**self._initial_rates, **self.rates()}
+        if not rates:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rates, f, indent=2)
+            f.write("\n")
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            self._breakers[host] = breaker
+        return breaker
+
+    def record_success(self, url: str, latency: Optional[float] = None):
+        """Erfolgreiche Antwort; mit `latency` (Sekunden bis zur Antwort) wird das Budget angepasst"""
+        self.breaker(url).record_success()
+        if latency is not None:
+            self._adapt(url, latency)
+
+    def record_failure(self, url: str, retry_after: Optional[float] = None, status: Optional[int] = None):
+        self._adapt(url, None)
+        breaker = self.breaker(url)
+        if breaker.record_failure(retry_after, status):
+            pause = breaker.open_until - time.monotonic()
+            log.warning(f"Host {urlsplit(url).netloc} drosselt oder antwortet nicht, pausiere alle Anfragen für {pause:.0f}s")
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wartet auf einen freien Platz und ein Token für den Host der URL"""
+        breaker = self.breaker(url)
+        await breaker.wait()
+        async with self._semaphore:
+            # Der Host kann pausiert worden sein, während wir auf den Platz gewartet haben
+            await breaker.wait()
+            # requests_per_second <= 0: kein Budget (z. B. beim Abspielen eines Archivs)
+            if self.requests_per_second > 0:
+                await self._bucket(urlsplit(url).netloc).acquire()
+            if self.jitter:
+                # Leichte Zufallsverzögerung, damit die Anfragen nicht im Gleichtakt kommen
+                await asyncio.sleep(random.uniform(0, self.jitter))
+            yield
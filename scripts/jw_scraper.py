@@ -1,58 +1,465 @@
 import asyncio
-import aiohttp
+import codecs
+import copy
+import hashlib
 import json
+import logging
 import re
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from typing import Dict, List, Any
+from collections import OrderedDict, deque
+from contextlib import aclosing, asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+from urllib.parse import urljoin
 import time
 import random
-import argparse
 import os
+import sys
+
+from jw_cache import HttpCache
+from jw_issues import index_issue, study_issues, workbook_issues
+from jw_jobs import JobJournal
+import jw_log
+from jw_manifest import WeekManifest
+from jw_locales import NUMBER_RE, NUMBERING_RE, RULES, YEAR_RE, get_rules
+from jw_metrics import Metrics
+from jw_model import (DEFAULT_MIDWEEK, DEFAULT_WEEKEND, FieldMinistryAssignment, LivingAsChristiansAssignment,
+                      MeetingWeek, MidweekMeeting, ValidationError, WeekendMeeting, dumps)
+from jw_parser import (SongLinkScanner, WeekOutline, build_week_outline, classify_url, find_article_link,
+                       find_issue_entries, make_soup)
+from jw_scheduler import RETRYABLE_STATUS, RequestScheduler, parse_retry_after
+from jw_transport import AiohttpTransport, HttpxTransport, RecordingTransport, ReplayTransport
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ProcessPoolExecutor
+
+# Schwere Module (aiohttp, bs4, argparse, multiprocessing) werden erst dort importiert,
+# wo sie gebraucht werden; ein Aufruf, der nur den Cache liest, startet ohne sie.
+
+# Diagnosemeldungen gehen über logging nach stderr (siehe jw_log), stdout gehört den Ergebnissen
+log = logging.getLogger(jw_log.LOGGER)
+
+YEAR_WEEK_RE = re.compile(r"(\d{4})/(\d{1,2})")
+
+def parse_year_week(value) -> Tuple[int, int]:
+    """'JJJJ/WW' -> (Jahr, Woche); ValueError mit lesbarer Meldung, wenn es keine ISO-Woche ist"""
+    match = YEAR_WEEK_RE.fullmatch(value) if isinstance(value, str) else None
+    if match:
+        year, week = int(match[1]), int(match[2])
+        try:
+            date.fromisocalendar(year, week, 1)
+            return year, week
+        except ValueError:
+            pass
+    if value is None:
+        raise ValueError("Woche fehlt (erwartet JJJJ/WW)")
+    raise ValueError(f"Ungültige Woche: {value} (erwartet JJJJ/WW)")
+
+def iso_week_range(from_year_week: str, to_year_week: str):
+    """Liefert alle ISO-Wochen (Jahr, Woche) von from_year_week bis einschließlich to_year_week"""
+    from_year, from_week = parse_year_week(from_year_week)
+    to_year, to_week = parse_year_week(to_year_week)
+    current = date.fromisocalendar(from_year, from_week, 1)
+    last = date.fromisocalendar(to_year, to_week, 1)
+    while current <= last:
+        iso_year, iso_week, _ = current.isocalendar()
+        yield iso_year, iso_week
+        current += timedelta(weeks=1)
+
+def iso_weeks_from(start_year_week: str, num_weeks: int):
+    """num_weeks ISO-Wochen ab start_year_week, über Jahreswechsel hinweg (auch mit Woche 53)"""
+    year, week = parse_year_week(start_year_week)
+    current = date.fromisocalendar(year, week, 1)
+    for _ in range(num_weeks):
+        iso_year, iso_week, _ = current.isocalendar()
+        yield iso_year, iso_week
+        current += timedelta(weeks=1)
+
+def _normalize(value):
+    """Leerraum und weiche Trennstriche vereinheitlichen, damit Layout-Details nicht als Änderung zählen"""
+    if isinstance(value, str):
+        return " ".join(value.replace("\xad", "").split())
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+def week_fingerprint(meeting_data: Dict[str, Any]) -> str:
+    """Fingerabdruck der extrahierten Abschnitte einer Woche (ohne yearWeek und ohne eigenen Fingerabdruck)"""
+    sections = {key: value for key, value in meeting_data.items() if key not in ("yearWeek", "fingerprint")}
+    canonical = json.dumps(_normalize(sections), ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+def load_fingerprints(path: str) -> Dict[str, str]:
+    """Fingerabdrücke (yearWeek -> Fingerabdruck) aus der NDJSON-Ausgabe eines früheren Laufs"""
+    known = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                if record.get("fingerprint"):
+                    known[record["yearWeek"]] = record["fingerprint"]
+    return known
+
+# Parser-Instanzen in den Pool-Prozessen, eine pro Sprache
+_pool_parsers: Dict[str, "JWMeetingScraper"] = {}
+
+def _init_parse_worker(log_settings: Optional[Tuple[str, str]] = None):
+    """Pool-Prozesse schreiben Diagnoseausgaben nach stderr, stdout bleibt dem Protokoll vorbehalten"""
+    sys.stdout = sys.stderr
+    if log_settings:
+        jw_log.configure(*log_settings)
+
+def create_parse_pool(workers: int) -> "ProcessPoolExecutor":
+    """Prozess-Pool fürs Parsen; spawn statt fork, weil die Event-Loop bereits Threads hat"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                               initializer=_init_parse_worker, initargs=(jw_log.settings,))
+
+def _pool_parser(lang: str) -> "JWMeetingScraper":
+    parser = _pool_parsers.get(lang)
+    if parser is None:
+        parser = _pool_parsers[lang] = JWMeetingScraper(lang=lang)
+    return parser
+
+def parse_week_html(html: str, lang: str):
+    """Parst eine Wochenübersicht außerhalb der Event-Loop und liefert nur einfache Daten zurück
+
+    Ergebnis: (MidweekMeeting, WeekendMeeting ohne Lieder, Wachtturm-Link, Überschrift, Wochen-Links)
+    """
+    parser = _pool_parser(lang)
+    outline = build_week_outline(make_soup(html))
+    weekend_data, watchtower_link = parser._parse_weekend_page(outline)
+    return (parser._parse_midweek_meeting(outline), weekend_data, watchtower_link,
+            outline.title, outline.week_links)
+
+def parse_midweek_html(html: str, lang: str) -> MidweekMeeting:
+    """Parst die Seite einer Arbeitsheft-Woche (gleiches Markup wie in der Wochenübersicht)"""
+    return _pool_parser(lang)._parse_midweek_meeting(build_week_outline(make_soup(html)))
+
+def parse_toc_html(html: str, lang: str) -> Optional[str]:
+    """Artikel-Link aus einer Inhaltsverzeichnis-Seite"""
+    return find_article_link(make_soup(html), get_rules(lang).lp)
+
+def parse_issue_html(html: str, lang: str, near: date) -> Dict[date, Tuple[str, str]]:
+    """Einträge aus dem Inhaltsverzeichnis einer Ausgabe: Wochenbeginn -> (href, Titel)"""
+    return index_issue(find_issue_entries(make_soup(html)), get_rules(lang), near)
 
 class JWMeetingScraper:
-    def __init__(self, base_url: str = "https://wol.jw.org/de/wol/meetings/r10/lp-x"):
-        self.base_url = base_url
+    def __init__(self, base_url: Optional[str] = None,
+                 concurrency: int = 4, requests_per_second: float = 1.0,
+                 cache: Optional[HttpCache] = None, max_retries: int = 4,
+                 metrics: Optional[Metrics] = None, lang: str = "de",
+                 parse_executor: Optional["Executor"] = None, transport=None,
+                 origin: str = "https://wol.jw.org", adaptive_rate: bool = True,
+                 max_rate: Optional[float] = None, rate_state: Optional[str] = None,
+                 by_issue: bool = False, manifest: Optional[WeekManifest] = None):
+        # Kompilierte Erkennungsregeln der Sprache (Abschnittstitel, Lied, Lektion, ...)
+        self.rules = get_rules(lang)
+        # Host für Wochenseiten und relative Folge-Links (z. B. ein lokaler Ersatzserver)
+        self.origin = origin.rstrip('/')
+        self.base_url = base_url or self.rules.meetings_url(self.origin)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Language': self.rules.accept_language,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Cache-Control': 'max-age=0',
             'Connection': 'keep-alive',
         }
-        self.session = None
-        self.rate_limit_delay = 3  # Sekunden zwischen Anfragen
+        # Gemeinsamer Verbindungspool für alle Abrufe (Keep-Alive, DNS-Cache, Timeouts)
+        self.transport = transport or AiohttpTransport(concurrency=concurrency)
+        # Gleichzeitige Anfragen und Anfragebudget pro Host; beim Abspielen ohne Budget und Jitter.
+        # Adaptiv ist requests_per_second nur der Startwert, der Takt folgt Latenz und Fehlern.
+        if self.transport.throttle:
+            self.scheduler = RequestScheduler(concurrency=concurrency, requests_per_second=requests_per_second,
+                                              adaptive=adaptive_rate,
+                                              max_rate=max_rate or max(4.0, requests_per_second))
+        else:
+            self.scheduler = RequestScheduler(concurrency=concurrency, requests_per_second=0, jitter=0)
+        # Gelernter Takt pro Host, bleibt zwischen Läufen erhalten
+        self.rate_state = rate_state
+        if rate_state:
+            self.scheduler.load_rates(rate_state)
+        # Optionaler persistenter Seiten-Cache
+        self.cache = cache
+        # Vorhandene und fehlende Wochenseiten; ohne Datei nur für die Dauer des Prozesses
+        self.manifest = manifest or WeekManifest(":memory:")
+        # Wiederholungen bei vorübergehenden Fehlern (429, 5xx, Netzwerk) mit exponentiellem Backoff
+        self.max_retries = max_retries
+        self.backoff_base = 1.0
+        self.backoff_max = 60.0
+        # Optionaler Prozess- oder Thread-Pool fürs Parsen, damit die Event-Loop für Abrufe frei bleibt
+        self.parse_executor = parse_executor
+        # Spans für Abrufe und Parsing (Dauer, Bytes, Cache, Wiederholungen)
+        self.metrics = metrics or Metrics()
+        # Laufende Abrufe pro URL, gleichzeitige Aufrufer teilen sich eine Anfrage
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Ergebnisse der Wachtturm-Folgeseiten (TOC -> Artikel-Link, Artikel -> Lieder)
+        self._follow_up_memo: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self.memo_size = 256
+        # Wartezeit auf Bestätigungen im Worker-Modus, bevor ein Bereich abgebrochen wird
+        self.ack_timeout = 300.0
+        # Im Worker-Modus wird der gelernte Takt höchstens so oft (Sekunden) gespeichert
+        self.rate_save_interval = 30.0
+        # Wochen aus den Inhaltsverzeichnissen der Ausgaben statt über die Wochenübersicht laden
+        self.by_issue = by_issue
+        # Größe der Body-Stücke, die beim Streamen an den Scanner gehen
+        self.stream_chunk_size = 16 * 1024
+        # Scraper für weitere Sprachen, die Verbindungspool, Scheduler, Cache und Metriken mitbenutzen
+        self._languages: Dict[str, "JWMeetingScraper"] = {self.rules.lang: self}
+
+    def for_lang(self, lang: Optional[str]) -> "JWMeetingScraper":
+        """Scraper für eine andere Sprache, der alle Ressourcen mit diesem teilt"""
+        lang = lang or self.rules.lang
+        scraper = self._languages.get(lang)
+        if scraper is None:
+            rules = get_rules(lang)
+            scraper = copy.copy(self)
+            scraper.rules = rules
+            scraper.base_url = rules.meetings_url(self.origin)
+            scraper.headers = {**self.headers, 'Accept-Language': rules.accept_language}
+            self._languages[lang] = scraper
+        return scraper
+
+    def for_request(self) -> "JWMeetingScraper":
+        """Scraper für eine Worker-Anfrage: teilt alle Ressourcen, merkt sich Folgeseiten aber nur für diese Anfrage"""
+        scraper = copy.copy(self)
+        scraper._follow_up_memo = OrderedDict()
+        return scraper
+
+    def _absolute(self, link: str) -> str:
+        """Relative Links der Seiten gegen den konfigurierten Host auflösen"""
+        return urljoin(self.origin + "/", link)
 
     async def _init_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        await self.transport.open()
+
+    @asynccontextmanager
+    async def _connection(self):
+        """Verbindungspool für einen Lauf; danach wird der gelernte Takt gespeichert
+
+        Geöffnet wird der Pool erst mit der ersten Anfrage, die nicht aus dem Cache kommt.
+        """
+        try:
+            yield
+        finally:
+            await self.transport.close()
+            self._save_rate_state()
+            rates = ", ".join(f"{host} {rate:.2f}/s" for host, rate in self.scheduler.rates().items())
+            if rates and self.scheduler.adaptive:
+                log.info(f"Anfragetakt am Ende: {rates}")
+
+    def _save_rate_state(self):
+        if self.rate_state and self.scheduler.adaptive:
+            self.scheduler.save_rates(self.rate_state)
 
     async def close(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+        await self.transport.close()
+        self._save_rate_state()
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+        if self.manifest:
+            self.manifest.close()
+            self.manifest = None
+        if self.parse_executor is not None:
+            # Sonst laufen die Pool-Prozesse bis zum Ende des Interpreters weiter (auch im Worker-Modus)
+            self.parse_executor.shutdown(wait=True, cancel_futures=True)
+            self.parse_executor = None
+
+    async def _fetch_page(self, url: str, scanner: Optional[SongLinkScanner] = None) -> str:
+        if scanner is not None:
+            # Gestreamte Abrufe gehören einem Aufrufer; doppelte Artikel fängt bereits _memoized ab
+            return await self._download(url, scanner)
+        
+        # Gleichzeitige Abrufe derselben URL warten auf dieselbe laufende Anfrage
+        inflight = self._inflight.get(url)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._download(url))
+            self._inflight[url] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(inflight)
+
+    async def _memoized(self, key: str, factory):
+        """Teilt ein Ergebnis zwischen allen Wochen eines Laufs bzw. einer Worker-Anfrage
+
+        Leere Ergebnisse und Fehler werden nicht gemerkt, die nächste Woche versucht es erneut.
+        """
+        future = self._follow_up_memo.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._follow_up_memo[key] = future
+            while len(self._follow_up_memo) > self.memo_size:
+                self._follow_up_memo.popitem(last=False)
+        else:
+            self._follow_up_memo.move_to_end(key)
+
+        try:
+            result = await asyncio.shield(future)
+        except Exception:
+            if self._follow_up_memo.get(key) is future:
+                del self._follow_up_memo[key]
+            raise
+        if not result and self._follow_up_memo.get(key) is future:
+            del self._follow_up_memo[key]
+        return result
+
+    async def _resolve_article_link(self, tc_url: str) -> Optional[str]:
+        """Sucht auf der Inhaltsverzeichnis-Seite den Link zum eigentlichen Artikel"""
+        tc_html = await self._fetch_page(tc_url)
+        if not tc_html:
+            return None
+        # a.jwac, sonst beliebiger /d/-Link
+        with self.metrics.span("parse", kind="toc", bytes=len(tc_html)):
+            return await self._run_parse(parse_toc_html, tc_html, self.rules.lang)
+
+    async def _run_parse(self, func, *args):
+        """Führt eine Parse-Funktion im Pool aus, falls einer konfiguriert ist, sonst direkt"""
+        if self.parse_executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.parse_executor, func, *args)
+
+    async def _load_article_songs(self, article_url: str) -> List[str]:
+        """Lädt den Artikel gestreamt und liefert die Texte aller Lied-Verweise in Dokumentreihenfolge
+
+        Der Body wird stückweise in den SongLinkScanner gereicht, ohne
+        Dokumentbaum; nach dem Ende des <article>-Elements bricht der Abruf ab.
+        """
+        scanner = SongLinkScanner(self.rules.article_song)
+        if not await self._fetch_page(article_url, scanner):
+            return []
+        scanner.close()
+        return scanner.songs
 
-    async def _fetch_page(self, url: str) -> str:
+    async def _download(self, url: str, scanner: Optional[SongLinkScanner] = None) -> str:
+        with self.metrics.span("fetch", url=url, kind=classify_url(url)) as span:
+            html = await self._download_page(url, span, scanner)
+            span.attrs["bytes"] = len(html)
+            if scanner is not None and not span.attrs.get("streamed"):
+                # Cache-Treffer und veraltete Kopien gehen am Stück an den Scanner,
+                # ohne Reste eines abgebrochenen Versuchs
+                scanner.reset()
+                scanner.feed(html)
+            return html
+
+    async def _read_streamed(self, response, scanner: SongLinkScanner, span) -> str:
+        """Dekodiert den Body genau einmal, stückweise, und bricht ab, sobald der Scanner fertig ist"""
+        try:
+            decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        # Jeder Versuch beginnt mit leerem Scanner, sonst zählen Lieder eines abgebrochenen Versuchs doppelt
+        scanner.reset()
+        span.attrs["streamed"] = True
+        parts = []
+        async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+            text = decoder.decode(chunk)
+            parts.append(text)
+            scanner.feed(text)
+            if scanner.done:
+                # Der Rest der Seite wird nicht gebraucht: Verbindung verwerfen statt leerlesen
+                span.attrs["truncated"] = True
+                response.close()
+                return "".join(parts)
+        parts.append(decoder.decode(b'', final=True))
+        scanner.feed(parts[-1])
+        return "".join(parts)
+
+    async def _download_page(self, url: str, span, scanner: Optional[SongLinkScanner] = None) -> str:
+        # Frische Seiten kommen direkt aus dem Cache, ohne Anfrage und ohne Rate-Limit
+        cached = self.cache.get(url) if self.cache else None
+        if cached and cached.is_fresh(self.cache.ttl):
+            span.attrs["cache"] = "hit"
+            return cached.text
+        
+        # Der Verbindungspool (und damit aiohttp) wird erst für die erste echte Anfrage geöffnet
         await self._init_session()
         
-        # Rate-Limiting mit leichter Zufallsverzögerung
-        delay = self.rate_limit_delay + random.uniform(0.5, 1.5)
-        await asyncio.sleep(delay)
+        headers = self.headers
+        if cached:
+            # Abgelaufene Einträge nur bedingt neu laden
+            headers = dict(self.headers)
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
         
-        try:
-            async with self.session.get(url, headers=self.headers) as response:
-                if response.status != 200:
-                    print(f"Fehler: HTTP-Status {response.status} für URL {url}")
-                    return ""
-                return await response.text()
-        except Exception as e:
-            print(f"Fehler beim Abrufen von {url}: {e}")
-            return ""
+        reason = ""
+        for attempt in range(self.max_retries + 1):
+            span.attrs["retries"] = attempt
+            retry_after = None
+            try:
+                # Rate-Limiting über den gemeinsamen Scheduler
+                async with self.scheduler.slot(url):
+                    started = time.perf_counter()
+                    async with self.transport.get(url, headers=headers) as response:
+                        # Zeit bis zu den Antwort-Headern steuert den adaptiven Takt
+                        latency = time.perf_counter() - started
+                        span.attrs["status"] = response.status
+                        if response.status == 304 and cached:
+                            self.scheduler.record_success(url, latency)
+                            self.cache.revalidated(url)
+                            span.attrs["cache"] = "revalidated"
+                            return cached.text
+                        if response.status == 200:
+                            if scanner is None:
+                                html = await response.text()
+                            else:
+                                # Bei abgebrochenen Artikeln landet nur der gelesene Anfang im Cache;
+                                # er enthält alles, was der Scanner braucht
+                                html = await self._read_streamed(response, scanner, span)
+                            self.scheduler.record_success(url, latency)
+                            if self.cache:
+                                self.cache.put(url, html, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                            return html
+                        if response.status not in RETRYABLE_STATUS:
+                            # Dauerhafte Fehler (z. B. 404) nicht wiederholen
+                            log.warning(f"HTTP-Status {response.status} für URL {url}")
+                            if response.status in (404, 410):
+                                self._week_missing(url)
+                            span.attrs["error"] = reason = f"HTTP-Status {response.status}"
+                            return ""
+                        
+                        reason = f"HTTP-Status {response.status}"
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        self.scheduler.record_failure(url, retry_after, status=response.status)
+            except self.transport.errors as e:
+                reason = str(e) or type(e).__name__
+                self.scheduler.record_failure(url)
+            except Exception as e:
+                log.error(f"Fehler beim Abrufen von {url}: {e}")
+                span.attrs["error"] = str(e)
+                return ""
+            
+            # Ein abgebrochener Stream zählt nicht: der nächste Versuch oder die Cache-Kopie füttert den Scanner neu
+            span.attrs.pop("streamed", None)
+            span.attrs.pop("truncated", None)
+            
+            if attempt < self.max_retries:
+                # Exponentielles Backoff; bei Retry-After wartet bereits der Circuit Breaker
+                if retry_after is not None:
+                    log.warning(f"Fehler bei {url} ({reason}), Versuch {attempt + 2}/{self.max_retries + 1} nach Retry-After ({retry_after:.0f}s)")
+                else:
+                    delay = min(self.backoff_max, self.backoff_base * 2 ** attempt) + random.uniform(0, self.backoff_base)
+                    log.warning(f"Fehler bei {url} ({reason}), Versuch {attempt + 2}/{self.max_retries + 1} in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+        
+        log.error(f"Fehler beim Abrufen von {url}: {reason}, gebe nach {self.max_retries + 1} Versuchen auf")
+        span.attrs["error"] = reason
+        if cached:
+            # Eine veraltete Seite ist besser als Platzhalterdaten
+            log.warning(f"Verwende veraltete Seite aus dem Cache für {url}")
+            span.attrs["cache"] = "stale"
+            return cached.text
+        return ""
 
     def _extract_week_date_range(self, date_header: str) -> Dict[str, str]:
         """Extrahiert Start- und Enddatum aus dem Wochentitel"""
-        date_pattern = r"(\d+\.\s+\w+)\s+–\s+(\d+\.\s+\w+\s+\d{4})"
-        matches = re.search(date_pattern, date_header)
+        matches = self.rules.date_range_re.search(date_header)
         
         if matches:
             start_date_str = matches.group(1)
@@ -60,7 +467,7 @@ class JWMeetingScraper:
             
             # Falls Jahr im ersten Teil fehlt, aus dem zweiten Teil ergänzen
             if not any(char.isdigit() for char in start_date_str[-4:]):
-                year = re.search(r"(\d{4})", end_date_str).group(1)
+                year = YEAR_RE.search(end_date_str).group(1)
                 start_date_str = f"{start_date_str} {year}"
             
             return {
@@ -71,8 +478,7 @@ class JWMeetingScraper:
 
     def _extract_bible_reading_details(self, title: str) -> Dict[str, str]:
         """Extrahiert Bibellesungsdetails aus dem Titel"""
-        scripture_pattern = r"Bibellesung:\s+([^(]+)(?:\(([^)]+)\))?"
-        matches = re.search(scripture_pattern, title)
+        matches = self.rules.bible_reading_re.search(title)
         
         if matches:
             scripture = matches.group(1).strip()
@@ -86,7 +492,7 @@ class JWMeetingScraper:
 
     def _extract_song_number(self, song_text):
         """Extrahiert die Liednummer aus einem Lied-Text"""
-        match = re.search(r'(\d+)', song_text)
+        match = NUMBER_RE.search(song_text)
         if match:
             try:
                 return int(match.group(1))
@@ -98,598 +504,1080 @@ class JWMeetingScraper:
         """Korrigiert das Format der Lektionsreferenzen, indem ein Leerzeichen eingefügt wird"""
         if not text:
             return text
-        return re.sub(r'(th|lmd)(Lektion)', r'\1 \2', text)
+        return self.rules.lesson_fix_re.sub(r'\1 \2', text)
 
-    def _parse_midweek_meeting(self, week_soup) -> Dict[str, Any]:
+    def _parse_midweek_meeting(self, outline: WeekOutline) -> MidweekMeeting:
         """Extrahiert die Daten für das Wochentags-Meeting"""
-        midweek_data = {
-            "openingSong": 0,
-            "treasuresFromGodsWord": {
-                "talkTitle": "",
-                "talkDuration": 10,
-                "spiritualGemsDuration": 10,
-                "bibleReadingScripture": "",
-                "bibleReadingLesson": "",
-                "bibleReadingDuration": 4
-            },
-            "applyYourselfToFieldMinistry": {
-                "fieldMinistryAssignments": []
-            },
-            "livingAsChristians": {
-                "livingAsChristiansSong": 0,
-                "assignments": []
-            },
-            "closingSong": 0
-        }
+        midweek = MidweekMeeting()
+        treasures = midweek.treasures
         
-        print("Analyse der Midweek-Meeting-Struktur beginnt...")
+        log.debug("Analyse der Midweek-Meeting-Struktur beginnt...")
         
+        rules = self.rules
         try:
-            # Finde das Eröffnungslied (erstes h3 mit dc-icon--music-Klasse)
-            opening_song_elem = week_soup.select_one("h3.dc-icon--music a, h3 a:-soup-contains('Lied')")
-            if opening_song_elem:
-                opening_song_text = opening_song_elem.get_text(strip=True)
-                midweek_data["openingSong"] = self._extract_song_number(opening_song_text)
-                print(f"Eröffnungslied gefunden: {opening_song_text} -> {midweek_data['openingSong']}")
+            # Überschriften und Abschnitte werden je Woche nur einmal klassifiziert
+            marked = rules.index_headings(outline.headings)
+            sections = rules.sections(outline)
             
-            # Finde das Living as Christians Lied (nach dem dc-icon--sheep)
-            lac_song_elem = week_soup.select_one("div.dc-icon--sheep + h3.dc-icon--music, div:-soup-contains('UNSER LEBEN ALS CHRIST') + h3 a:-soup-contains('Lied')")
-            if lac_song_elem:
-                # Suche nach dem Link innerhalb des Elements
-                song_link = lac_song_elem.select_one("a")
-                if song_link:
-                    lac_song_text = song_link.get_text(strip=True)
-                    midweek_data["livingAsChristians"]["livingAsChristiansSong"] = self._extract_song_number(lac_song_text)
-                    print(f"Living as Christians Lied gefunden: {lac_song_text} -> {midweek_data['livingAsChristians']['livingAsChristiansSong']}")
+            # Finde das Eröffnungslied (erstes h3 mit dc-icon--music-Klasse oder Lied-Link)
+            for heading in outline.headings:
+                opening_song_elem = (heading.links[0] if heading.links and "dc-icon--music" in heading.classes
+                                     else heading.link_containing(rules.song))
+                if opening_song_elem:
+                    opening_song_text = opening_song_elem.get_text(strip=True)
+                    midweek.opening_song = self._extract_song_number(opening_song_text)
+                    log.debug(f"Eröffnungslied gefunden: {opening_song_text} -> {midweek.opening_song}")
+                    break
+            
+            # Finde das Living as Christians Lied (direkt nach dem dc-icon--sheep)
+            sheep_div = outline.icons.get("christian")
+            if sheep_div:
+                lac_song_elem = sheep_div.find_next_sibling()
+                if lac_song_elem and lac_song_elem.name == "h3" and "dc-icon--music" in (lac_song_elem.get("class") or ()):
+                    # Suche nach dem Link innerhalb des Elements
+                    song_link = lac_song_elem.find("a")
+                    if song_link:
+                        lac_song_text = song_link.get_text(strip=True)
+                        midweek.living_as_christians_song = self._extract_song_number(lac_song_text)
+                        log.debug(f"Living as Christians Lied gefunden: {lac_song_text} -> {midweek.living_as_christians_song}")
             
-            # Finde das Schlusslied (im oder nach dem Schlussworte-Element)
-            closing_section = week_soup.select_one("h3:-soup-contains('Schlussworte')")
+            # Finde das Schlusslied (im Schlussworte-Element)
+            closing_section = marked.get("closing")
             if closing_section:
-                # Suche nach dem Link innerhalb des Elements
-                song_link = closing_section.select_one("a:-soup-contains('Lied')")
+                song_link = closing_section.link_containing(rules.song)
                 if song_link:
                     closing_song_text = song_link.get_text(strip=True)
-                    midweek_data["closingSong"] = self._extract_song_number(closing_song_text)
-                    print(f"Schlusslied gefunden: {closing_song_text} -> {midweek_data['closingSong']}")
+                    midweek.closing_song = self._extract_song_number(closing_song_text)
+                    log.debug(f"Schlusslied gefunden: {closing_song_text} -> {midweek.closing_song}")
             
             # Finde die SCHÄTZE AUS GOTTES WORT Sektion
-            treasures_section = week_soup.select_one("div.dc-icon--gem, div:-soup-contains('SCHÄTZE AUS GOTTES WORT')")
-            if treasures_section:
-                print("SCHÄTZE AUS GOTTES WORT Sektion gefunden")
+            if "treasures" in sections:
+                log.debug(f"{rules.section_titles['treasures']} Sektion gefunden")
                 
-                # Suche nach dem ersten Vortragstitel (h3 nach dem Abschnitt)
-                talk_title_elem = week_soup.select_one("div.dc-icon--gem + div h3, h2:-soup-contains('SCHÄTZE AUS GOTTES WORT') + * h3")
+                # Suche nach dem ersten Vortragstitel (h3 im div nach dem Abschnitt)
+                talk_title_elem = None
+                gem_div = outline.icons.get("treasures")
+                if gem_div:
+                    next_div = gem_div.find_next_sibling()
+                    if next_div and next_div.name == "div":
+                        talk_title_elem = next_div.find("h3")
+                if not talk_title_elem:
+                    for h2, h2_text in outline.h2_texts:
+                        if rules.section_titles["treasures"] in h2_text:
+                            following = h2.find_next_sibling()
+                            talk_title_elem = following.find("h3") if following else None
+                            if talk_title_elem:
+                                break
                 if talk_title_elem:
                     talk_title = talk_title_elem.get_text(strip=True)
                     # Bereinige den Titel (entferne Zahlen und Punkte am Anfang)
-                    talk_title = re.sub(r'^\d+\.\s*', '', talk_title)
-                    midweek_data["treasuresFromGodsWord"]["talkTitle"] = talk_title
-                    print(f"Vortragstitel: {midweek_data['treasuresFromGodsWord']['talkTitle']}")
+                    talk_title = NUMBERING_RE.sub('', talk_title)
+                    treasures.talk_title = talk_title
+                    log.debug(f"Vortragstitel: {treasures.talk_title}")
                 
                 # Bibellesung finden
-                bible_reading_section = week_soup.select_one("h3:-soup-contains('Bibellesung')")
+                bible_reading_section = marked.get("bible_reading")
                 if bible_reading_section:
-                    # Finde das div mit der Bibelstelle
-                    bible_div = bible_reading_section.find_next("div", class_="du-margin-inlineStart--5")
+                    # Das div mit der Bibelstelle folgt der Überschrift
+                    bible_div = bible_reading_section.next_block
                     if bible_div:
-                        # Suche nach dem Link zur Bibelstelle
-                        bibl_links = bible_div.select("a.b")
-                        if bibl_links:
-                            scripture = bibl_links[0].get_text(strip=True)
-                            midweek_data["treasuresFromGodsWord"]["bibleReadingScripture"] = scripture
-                            print(f"Bibellesung Schriftstelle: {scripture}")
+                        lesson_link = None
+                        for link in bible_div.find_all("a"):
+                            # Suche nach dem Link zur Bibelstelle
+                            if "b" in (link.get("class") or ()) and not treasures.bible_reading_scripture:
+                                scripture = link.get_text(strip=True)
+                                treasures.bible_reading_scripture = scripture
+                                log.debug(f"Bibellesung Schriftstelle: {scripture}")
+                            # Suche nach dem TH-Lektion-Link
+                            if lesson_link is None and rules.bible_reading_lesson in link.get_text():
+                                lesson_link = link
                         
-                        # Suche nach dem TH-Lektion-Link
-                        lesson_link = bible_div.select_one("a:-soup-contains('th Lektion')")
                         if lesson_link:
                             lesson_text = lesson_link.get_text(strip=True)
                             # Korrektur: Leerzeichen zwischen th/lmd und Lektion einfügen
                             lesson_text = self._fix_lesson_format(lesson_text)
-                            midweek_data["treasuresFromGodsWord"]["bibleReadingLesson"] = lesson_text
-                            print(f"Bibellesung Lektion: {lesson_text}")
+                            treasures.bible_reading_lesson = lesson_text
+                            log.debug(f"Bibellesung Lektion: {lesson_text}")
             
             # Finde "UNS IM DIENST VERBESSERN" Sektion
-            ministry_section = week_soup.select_one("div.dc-icon--wheat, div:-soup-contains('UNS IM DIENST VERBESSERN')")
-            if ministry_section:
-                print("UNS IM DIENST VERBESSERN Sektion gefunden")
+            if "ministry" in sections:
+                log.debug(f"{rules.section_titles['ministry']} Sektion gefunden")
                 
-                # Finde alle h3-Elemente für die Dienstaufgaben
-                ministry_titles = week_soup.select("h3.du-fontSize--base.du-color--gold-700")
+                # Alle h3-Elemente für die Dienstaufgaben
                 field_assignments = []
                 
-                for title_elem in ministry_titles:
+                for heading in outline.headings:
+                    if "du-fontSize--base" not in heading.classes or "du-color--gold-700" not in heading.classes:
+                        continue
                     # Prüfe, ob dies eine Dienstaufgabe ist
-                    if not title_elem.get_text(strip=True).startswith("UNS IM DIENST VERBESSERN"):
-                        title = title_elem.get_text(strip=True)
+                    if not heading.text.startswith(rules.section_titles["ministry"]):
                         # Bereinige den Titel (entferne Zahlen und Punkte am Anfang)
-                        title = re.sub(r'^\d+\.\s*', '', title)
+                        title = NUMBERING_RE.sub('', heading.text)
                         
-                        # Finde die Beschreibung (im nächsten div)
-                        desc_div = title_elem.find_next("div", class_="du-margin-inlineStart--5")
+                        # Die Beschreibung steht im nächsten div
+                        desc_div = heading.next_block
                         lesson = ""
                         
                         if desc_div:
                             # Suche nach dem Paragraph mit der Beschreibung
-                            desc_p = desc_div.select_one("p.du-color--textSubdued")
+                            desc_p = desc_div.find("p", class_="du-color--textSubdued")
                             if desc_p:
                                 desc_text = desc_p.get_text(strip=True)
                                 # Extrahiere die Lektion aus dem Text (nach INFORMELL.)
-                                if "INFORMELL." in desc_text:
-                                    lesson = desc_text.split("INFORMELL.")[1].strip()
+                                if rules.informal_marker in desc_text:
+                                    lesson = desc_text.split(rules.informal_marker)[1].strip()
                                 else:
                                     lesson = desc_text
                             
                             # Suche nach dem Link zur Lektion
-                            lesson_link = desc_div.select_one("a:-soup-contains('lmd')")
+                            lesson_link = next((link for link in desc_div.find_all("a") if "lmd" in link.get_text()), None)
                             if lesson_link:
                                 lesson_detail = lesson_link.get_text(strip=True)
                                 # Korrektur: Leerzeichen zwischen lmd/th und Lektion einfügen
                                 lesson_detail = self._fix_lesson_format(lesson_detail)
-                                if "Lektion" in lesson_detail:
+                                if rules.lesson in lesson_detail:
                                     if lesson:
                                         lesson += f" ({lesson_detail})"
                                     else:
                                         lesson = lesson_detail
                         
                         # Füge die Aufgabe hinzu
-                        field_assignments.append({
-                            "title": title,
-                            "lesson": lesson,
-                            "duration": 4,  # Standard-Dauer basierend auf deinem HTML
-                            "id": str(len(field_assignments) + 1)
-                        })
-                        print(f"Dienstaufgabe: {title} - {lesson}")
+                        field_assignments.append(FieldMinistryAssignment(
+                            title=title,
+                            lesson=lesson,
+                            duration=4,  # Standard-Dauer basierend auf deinem HTML
+                            id=str(len(field_assignments) + 1),
+                        ))
+                        log.debug(f"Dienstaufgabe: {title} - {lesson}")
                 
                 # Filtere die Aufgaben - nur die ersten 3 gehören zu fieldMinistryAssignments
                 if field_assignments:
-                    midweek_data["applyYourselfToFieldMinistry"]["fieldMinistryAssignments"] = field_assignments[:3]
+                    midweek.field_ministry_assignments = field_assignments[:3]
             
             # Finde "UNSER LEBEN ALS CHRIST" Sektion
-            christian_section = week_soup.select_one("div.dc-icon--sheep, div:-soup-contains('UNSER LEBEN ALS CHRIST')")
-            if christian_section:
-                print("UNSER LEBEN ALS CHRIST Sektion gefunden")
+            if "christian" in sections:
+                log.debug(f"{rules.section_titles['christian']} Sektion gefunden")
                 
-                # Finde alle h3-Elemente nach diesem Abschnitt für die Aufgaben
-                christian_titles = week_soup.select("h3.du-fontSize--base.du-color--maroon-600")
+                # Alle h3-Elemente für die Aufgaben
                 christian_assignments = []
                 
-                for title_elem in christian_titles:
+                for heading in outline.headings:
+                    if "du-fontSize--base" not in heading.classes or "du-color--maroon-600" not in heading.classes:
+                        continue
                     # Prüfe, ob dies eine christliche Aufgabe ist (keine Überschrift und kein Lied)
-                    title_text = title_elem.get_text(strip=True)
-                    if not title_text.startswith("UNSER LEBEN ALS CHRIST") and "Lied" not in title_text:
+                    title_text = heading.text
+                    if not title_text.startswith(rules.section_titles["christian"]) and rules.song not in title_text:
                         # Bereinige den Titel (entferne Zahlen und Punkte am Anfang)
-                        title = re.sub(r'^\d+\.\s*', '', title_text)
+                        title = NUMBERING_RE.sub('', title_text)
                         
-                        duration = 10 if "bibelstudium" in title.lower() else 5
-                        if "aktuelles" in title.lower():
-                            duration = 10
+                        # Versammlungsbibelstudium und Aktuelles dauern länger
+                        duration = 10 if rules.long_part_re.search(title) else 5
                         
-                        christian_assignments.append({
-                            "title": title,
-                            "duration": duration,
-                            "id": str(len(christian_assignments) + 1)
-                        })
-                        print(f"Christliche Aufgabe: {title}")
+                        christian_assignments.append(LivingAsChristiansAssignment(
+                            title=title,
+                            duration=duration,
+                            id=str(len(christian_assignments) + 1),
+                        ))
+                        log.debug(f"Christliche Aufgabe: {title}")
                 
                 if christian_assignments:
-                    midweek_data["livingAsChristians"]["assignments"] = christian_assignments
+                    midweek.living_as_christians_assignments = christian_assignments
         
         except Exception as e:
-            print(f"Fehler beim Parsen des Midweek-Meetings: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"Fehler beim Parsen des Midweek-Meetings: {e}")
         
         # Stelle sicher, dass alle Song-Werte gültig sind
-        if midweek_data["openingSong"] <= 0:
-            midweek_data["openingSong"] = 1
+        if midweek.opening_song <= 0:
+            midweek.opening_song = 1
         
-        if midweek_data["livingAsChristians"]["livingAsChristiansSong"] <= 0:
-            midweek_data["livingAsChristians"]["livingAsChristiansSong"] = 1
+        if midweek.living_as_christians_song <= 0:
+            midweek.living_as_christians_song = 1
         
-        if midweek_data["closingSong"] <= 0:
-            midweek_data["closingSong"] = 1
+        if midweek.closing_song <= 0:
+            midweek.closing_song = 1
         
-        return midweek_data
+        return midweek
 
-    async def _parse_weekend_meeting(self, week_soup) -> Dict[str, Any]:
+    async def _parse_weekend_meeting(self, outline: WeekOutline) -> WeekendMeeting:
         """Extrahiert die Daten für das Wochenend-Meeting"""
-        weekend_data = {
-            "openingSong": 0,
-            "middleSong": 0,
-            "closingSong": 0,
-            "publicTalkTitle": "",
-            "publicTalkDuration": 30,
-            "watchtowerStudyTitle": "",
-            "watchtowerStudyDuration": 60
-        }
+        weekend_data, watchtower_link = self._parse_weekend_page(outline)
+        return await self._complete_weekend_meeting(weekend_data, watchtower_link)
+
+    def _parse_weekend_page(self, outline: WeekOutline) -> Tuple[WeekendMeeting, Optional[str]]:
+        """Titel und Wachtturm-Link aus der Wochenübersicht, ohne Folgeabrufe"""
+        weekend_data = WeekendMeeting()
         
-        print("Analyse der Weekend-Meeting-Struktur beginnt...")
+        log.debug("Analyse der Weekend-Meeting-Struktur beginnt...")
+        
+        # Watchtower Study Title und Link finden
+        watchtower_link = None
+        watchtower_title = None
         
         try:
+            marked = self.rules.index_headings(outline.headings)
+            
             # Public Talk Title finden
-            public_talk_heading = week_soup.select_one("h3:-soup-contains('Öffentlicher Vortrag')")
+            public_talk_heading = marked.get("public_talk")
             if public_talk_heading:
-                public_talk_container = public_talk_heading.find_next("div")
+                public_talk_container = public_talk_heading.next_div
                 if public_talk_container:
-                    public_talk_para = public_talk_container.select_one("p")
+                    public_talk_para = public_talk_container.find("p")
                     if public_talk_para:
-                        weekend_data["publicTalkTitle"] = public_talk_para.get_text(strip=True)
-                        print(f"Öffentlicher Vortrag Titel: {weekend_data['publicTalkTitle']}")
-            
-            # Watchtower Study Title und Link finden
-            watchtower_link = None
-            watchtower_title = None
+                        weekend_data.public_talk_title = public_talk_para.get_text(strip=True)
+                        log.debug(f"Öffentlicher Vortrag Titel: {weekend_data.public_talk_title}")
             
             # Methode 1: Über den "Studienartikel" Abschnitt
-            study_article_heading = week_soup.select_one("h3:-soup-contains('Studienartikel')")
+            study_article_heading = marked.get("study_article")
             if study_article_heading:
-                study_container = study_article_heading.find_next("div")
+                study_container = study_article_heading.next_div
                 if study_container:
                     # Suche nach dem Link zum Studienartikel
-                    watchtower_link_elem = study_container.select_one("a.it")
+                    watchtower_link_elem = study_container.find("a", class_="it")
                     if watchtower_link_elem:
                         watchtower_title = watchtower_link_elem.get_text(strip=True)
                         watchtower_link = watchtower_link_elem.get("href")
-                        print(f"Wachtturm Titel gefunden: {watchtower_title}")
-                        print(f"Wachtturm Link gefunden: {watchtower_link}")
+                        log.debug(f"Wachtturm Titel gefunden: {watchtower_title}")
+                        log.debug(f"Wachtturm Link gefunden: {watchtower_link}")
             
             # Methode 2: Über die Inhaltsverzeichnis-Karte
             if not watchtower_link:
-                toc_container = week_soup.select_one("div.itemData div.groupTOC")
+                toc_container = outline.toc
                 if toc_container:
-                    watchtower_link_elem = toc_container.select_one("a.it")
+                    watchtower_link_elem = toc_container.find("a", class_="it")
                     if watchtower_link_elem:
                         watchtower_title = watchtower_link_elem.get_text(strip=True)
                         watchtower_link = watchtower_link_elem.get("href")
-                        print(f"Wachtturm Titel aus TOC: {watchtower_title}")
-                        print(f"Wachtturm Link aus TOC: {watchtower_link}")
+                        log.debug(f"Wachtturm Titel aus TOC: {watchtower_title}")
+                        log.debug(f"Wachtturm Link aus TOC: {watchtower_link}")
             
             if watchtower_title:
-                weekend_data["watchtowerStudyTitle"] = watchtower_title
-            
+                weekend_data.watchtower_study_title = watchtower_title
+        
+        except Exception as e:
+            log.exception(f"Fehler beim Parsen des Weekend-Meetings: {e}")
+        
+        return weekend_data, watchtower_link
+
+    async def _complete_weekend_meeting(self, weekend_data: WeekendMeeting, watchtower_link: Optional[str]) -> WeekendMeeting:
+        """Folgt dem Wachtturm-Link zu den Liedern und ergänzt fehlende Lieder durch Standardwerte"""
+        try:
             # Wenn wir einen Link zum Watchtower haben, folgen wir diesem, um die Lieder zu finden
             if watchtower_link:
                 # FIX: Behandle /tc/ Links - folge ihnen erst, um den richtigen Artikel-Link zu finden
                 if "/tc/" in watchtower_link:
                     # Konstruiere den vollständigen URL für den tc-Link
-                    if watchtower_link.startswith("/"):
-                        full_tc_url = f"https://wol.jw.org{watchtower_link}"
-                    else:
-                        full_tc_url = watchtower_link
+                    full_tc_url = self._absolute(watchtower_link)
                     
-                    print(f"Folge Inhaltsverzeichnis-Link: {full_tc_url}")
+                    log.debug(f"Folge Inhaltsverzeichnis-Link: {full_tc_url}")
                     
-                    # Lade die Inhaltsverzeichnis-Seite
-                    tc_html = await self._fetch_page(full_tc_url)
-                    if tc_html:
-                        tc_soup = BeautifulSoup(tc_html, 'html.parser')
-                        
-                        # Suche nach dem Link zum eigentlichen Artikel
-                        article_elem = tc_soup.select_one("a.jwac")
-                        if article_elem:
-                            article_href = article_elem.get("href")
-                            if article_href and "/d/" in article_href:
-                                watchtower_link = article_href
-                                print(f"Gefundener Artikel-Link: {watchtower_link}")
-                        
-                        # Fallback: Suche nach anderen möglichen Links
-                        if "/d/" not in watchtower_link:
-                            for link in tc_soup.select("a"):
-                                href = link.get("href", "")
-                                if "/d/" in href and "lp-x" in href:
-                                    watchtower_link = href
-                                    print(f"Fallback: Artikel-Link gefunden: {watchtower_link}")
-                                    break
+                    # Lade die Inhaltsverzeichnis-Seite (einmal pro Lauf, auch bei mehreren Wochen)
+                    article_href = await self._memoized(
+                        f"toc:{full_tc_url}", lambda: self._resolve_article_link(full_tc_url))
+                    if article_href:
+                        watchtower_link = article_href
+                        log.debug(f"Gefundener Artikel-Link: {watchtower_link}")
                 
                 # Nun haben wir hoffentlich den direkten Link zum Artikel
                 # Lade die Wachtturm-Seite mit dem korrekten Link
                 if watchtower_link:
-                    print(f"Verwende Wachtturm-Link: {watchtower_link}")
+                    log.debug(f"Verwende Wachtturm-Link: {watchtower_link}")
                     
                     # Konstruiere die URL für den eigentlichen Artikel
-                    if watchtower_link.startswith("/"):
-                        article_url = f"https://wol.jw.org{watchtower_link}"
-                    else:
-                        article_url = watchtower_link
+                    article_url = self._absolute(watchtower_link)
                     
-                    print(f"Vollständige Artikel-URL: {article_url}")
+                    log.debug(f"Vollständige Artikel-URL: {article_url}")
                     
-                    article_html = await self._fetch_page(article_url)
-                    if article_html:
-                        article_soup = BeautifulSoup(article_html, 'html.parser')
-                        
-                        # Finde alle Lied-Elemente
-                        song_elems = article_soup.select("p.pubRefs a:-soup-contains('LIED'), div.du-color--textSubdued a:-soup-contains('LIED')")
-                        print(f"Gefundene Lieder: {len(song_elems)}")
+                    # Liederliste des Artikels (einmal pro Lauf, auch bei mehreren Wochen)
+                    songs = await self._memoized(
+                        f"article:{article_url}", lambda: self._load_article_songs(article_url))
+                    if songs:
+                        log.debug(f"Gefundene Lieder: {len(songs)}")
                         
                         # Logge alle gefundenen Lieder für die Fehlersuche
-                        for i, song in enumerate(song_elems):
-                            print(f"Lied {i+1}: {song.get_text(strip=True)}")
+                        for i, song in enumerate(songs):
+                            log.debug(f"Lied {i+1}: {song}")
                         
                         # Verarbeite die Lieder basierend auf ihrer Position
-                        if song_elems:
-                            if len(song_elems) >= 1:
-                                opening_song_text = song_elems[0].get_text(strip=True)
-                                weekend_data["openingSong"] = self._extract_song_number(opening_song_text)
-                                print(f"Eröffnungslied gefunden: {opening_song_text} -> {weekend_data['openingSong']}")
-                            
-                            if len(song_elems) >= 2:
-                                # Das zweite Lied ist das mittlere Lied
-                                middle_song_text = song_elems[1].get_text(strip=True)
-                                # Stelle sicher, dass es nicht dasselbe wie das erste ist
-                                middle_song_num = self._extract_song_number(middle_song_text)
-                                if middle_song_num != weekend_data["openingSong"]:
-                                    weekend_data["middleSong"] = middle_song_num
-                                    print(f"Mittellied gefunden: {middle_song_text} -> {weekend_data['middleSong']}")
-                            
-                            if len(song_elems) >= 3:
-                                # Das letzte Lied ist das Schlusslied
-                                closing_song_text = song_elems[-1].get_text(strip=True)
-                                weekend_data["closingSong"] = self._extract_song_number(closing_song_text)
-                                print(f"Schlusslied gefunden: {closing_song_text} -> {weekend_data['closingSong']}")
-                            elif len(song_elems) == 2:
-                                # Bei nur zwei Liedern ist das zweite das Schlusslied
-                                closing_song_text = song_elems[1].get_text(strip=True)
-                                weekend_data["closingSong"] = self._extract_song_number(closing_song_text)
-                                print(f"Schlusslied gefunden: {closing_song_text} -> {weekend_data['closingSong']}")
+                        if len(songs) >= 1:
+                            opening_song_text = songs[0]
+                            weekend_data.opening_song = self._extract_song_number(opening_song_text)
+                            log.debug(f"Eröffnungslied gefunden: {opening_song_text} -> {weekend_data.opening_song}")
+                        
+                        if len(songs) >= 2:
+                            # Das zweite Lied ist das mittlere Lied
+                            middle_song_text = songs[1]
+                            # Stelle sicher, dass es nicht dasselbe wie das erste ist
+                            middle_song_num = self._extract_song_number(middle_song_text)
+                            if middle_song_num != weekend_data.opening_song:
+                                weekend_data.middle_song = middle_song_num
+                                log.debug(f"Mittellied gefunden: {middle_song_text} -> {weekend_data.middle_song}")
+                        
+                        if len(songs) >= 3:
+                            # Das letzte Lied ist das Schlusslied
+                            closing_song_text = songs[-1]
+                            weekend_data.closing_song = self._extract_song_number(closing_song_text)
+                            log.debug(f"Schlusslied gefunden: {closing_song_text} -> {weekend_data.closing_song}")
+                        elif len(songs) == 2:
+                            # Bei nur zwei Liedern ist das zweite das Schlusslied
+                            closing_song_text = songs[1]
+                            weekend_data.closing_song = self._extract_song_number(closing_song_text)
+                            log.debug(f"Schlusslied gefunden: {closing_song_text} -> {weekend_data.closing_song}")
             
             # Wenn keine Lieder gefunden wurden, setze Standardwerte
-            if weekend_data["openingSong"] <= 0:
-                weekend_data["openingSong"] = 11
+            if weekend_data.opening_song <= 0:
+                weekend_data.opening_song = 11
             
-            if weekend_data["middleSong"] <= 0:
-                weekend_data["middleSong"] = 18
+            if weekend_data.middle_song <= 0:
+                weekend_data.middle_song = 18
             
-            if weekend_data["closingSong"] <= 0:
-                weekend_data["closingSong"] = 107
+            if weekend_data.closing_song <= 0:
+                weekend_data.closing_song = 107
         
         except Exception as e:
-            print(f"Fehler beim Parsen des Weekend-Meetings: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"Fehler beim Parsen des Weekend-Meetings: {e}")
         
         return weekend_data
 
-    async def scrape_meeting(self, year, week_num):
-        """Lädt die Meeting-Daten für die angegebene Woche und extrahiert die Daten"""
-        print(f"Abrufen der Meeting-Daten für Woche {week_num}/{year}...")
+    def _week_url(self, year, week_num) -> str:
+        return f"{self.base_url}/{year}/{str(week_num).zfill(2)}"
+
+    def _week_missing(self, url: str):
+        """Vermerkt eine Wochenseite, die es upstream nicht gibt, im Manifest (andere URLs werden ignoriert)"""
+        match = self.rules.week_link_re.search(url)
+        if match and self.manifest:
+            year, week_num = map(int, match.groups())
+            self.manifest.mark_missing(self._week_url(year, week_num), f"{year}/{week_num:02d}")
+
+    def _index_week_page(self, year, week_num, week_url: str, title: str, week_links: List[str]):
+        """Trägt die geladene Woche mit Überschrift und Wochenbeginn sowie ihre Navigations-Links ins Manifest ein"""
+        if not self.manifest:
+            return
+        monday = date.fromisocalendar(int(year), int(week_num), 1)
+        start = self.rules.week_start(title, monday) if title else None
+        if start is not None and start != monday:
+            # Im Manifest steht der Beginn laut Überschrift, damit solche Seiten auffindbar bleiben
+            log.warning(f"{week_url} zeigt die Woche ab {start:%d.%m.%Y} statt ab {monday:%d.%m.%Y}")
+        
+        self.manifest.mark_available(week_url, f"{int(year)}/{int(week_num):02d}", title or None,
+                                     start.isoformat() if start else None)
+        for link in week_links:
+            match = self.rules.week_link_re.search(link)
+            if match:
+                linked_year, linked_week = map(int, match.groups())
+                self.manifest.mark_available(self._week_url(linked_year, linked_week),
+                                             f"{linked_year}/{linked_week:02d}")
+
+    def _known_missing(self, year, week_num) -> bool:
+        return self.manifest is not None and self.manifest.is_missing(self._week_url(year, week_num))
+
+    def _existing_weeks(self, weeks):
+        """Lässt Wochen aus, die laut Manifest upstream (noch) nicht existieren"""
+        for year, week_num in weeks:
+            if self._known_missing(year, week_num):
+                log.info(f"Woche {week_num}/{year} übersprungen: laut Manifest nicht vorhanden")
+                continue
+            yield year, week_num
+
+    async def scrape_meeting(self, year, week_num, by_issue: Optional[bool] = None):
+        """Lädt die Meeting-Daten für die angegebene Woche und extrahiert die Daten
+
+        Mit `by_issue` (Standard: self.by_issue) kommt die Woche aus den
+        Ausgaben; fehlt sie dort, wird die Wochenübersicht geladen.
+        """
+        with self.metrics.span("week", year_week=f"{year}/{str(week_num).zfill(2)}"):
+            if self.by_issue if by_issue is None else by_issue:
+                meeting_data = await self._scrape_meeting_from_issues(int(year), int(week_num))
+                if meeting_data is not None:
+                    return meeting_data
+            return await self._scrape_meeting(year, week_num)
+
+    async def _issue_index(self, symbol: str, near: date) -> Dict[date, Tuple[str, str]]:
+        """Inhaltsverzeichnis einer Ausgabe, einmal pro Lauf für alle Wochen geladen"""
+        url = self.rules.publication_url(symbol, self.origin)
+        
+        async def load():
+            html = await self._fetch_page(url)
+            if not html:
+                return {}
+            with self.metrics.span("parse", kind="issue", bytes=len(html)):
+                return await self._run_parse(parse_issue_html, html, self.rules.lang, near)
+        
+        return await self._memoized(f"issue:{url}", load)
+
+    async def _find_in_issues(self, issues, monday: date) -> Optional[Tuple[str, str]]:
+        for symbol, near in issues:
+            entry = (await self._issue_index(symbol, near)).get(monday)
+            if entry is not None:
+                return entry
+        return None
+
+    async def _scrape_meeting_from_issues(self, year, week_num) -> Optional[MeetingWeek]:
+        """Woche aus Arbeitsheft und Wachtturm-Ausgabe, ohne Wochenübersicht und Inhaltsverzeichnis-Link
+
+        Die Inhaltsverzeichnisse der Ausgaben teilen sich alle Wochen eines
+        Laufs; pro Woche bleiben die Arbeitsheft-Seite und der Studienartikel.
+        None, wenn die Woche in keiner Ausgabe gefunden wurde.
+        """
+        monday = date.fromisocalendar(year, week_num, 1)
+        workbook_entry = await self._find_in_issues(workbook_issues(monday), monday)
+        study_entry = await self._find_in_issues(study_issues(monday), monday)
+        if workbook_entry is None or study_entry is None:
+            log.info(f"Woche {week_num}/{year} nicht in den Ausgaben gefunden, verwende die Wochenübersicht")
+            return None
+        
+        log.info(f"Abrufen der Meeting-Daten für Woche {week_num}/{year} aus den Ausgaben...")
+        meeting_data = MeetingWeek()
+        try:
+            workbook_url = self._absolute(workbook_entry[0])
+            log.debug(f"Arbeitsheft: {workbook_url}")
+            html = await self._fetch_page(workbook_url)
+            if not html:
+                return None
+            
+            with self.metrics.span("parse", kind="midweek", bytes=len(html)):
+                meeting_data.midweek = await self._run_parse(parse_midweek_html, html, self.rules.lang)
+            
+            # Der Wachtturm-Eintrag verweist direkt auf den Artikel (/d/), der Inhaltsverzeichnis-Schritt entfällt
+            watchtower_link, watchtower_title = study_entry
+            log.debug(f"Wachtturm Titel aus der Ausgabe: {watchtower_title}")
+            with self.metrics.span("parse", kind="weekend"):
+                meeting_data.weekend = await self._complete_weekend_meeting(
+                    WeekendMeeting(watchtower_study_title=watchtower_title), watchtower_link)
+        
+        except Exception as e:
+            log.exception(f"Fehler beim Abrufen der Meeting-Daten aus den Ausgaben: {e}")
+        
+        return self._checked(meeting_data, year, week_num)
+
+    async def _scrape_meeting(self, year, week_num):
+        log.info(f"Abrufen der Meeting-Daten für Woche {week_num}/{year}...")
         
         # Struktur für die Ergebnisdaten
-        meeting_data = {
-            "midweekMeeting": None,
-            "weekendMeeting": None
-        }
+        meeting_data = MeetingWeek()
         
         try:
-            # Stelle sicher, dass week_num ein String mit führender Null ist, falls nötig
-            week_num_str = str(week_num).zfill(2)
-            week_url = f"https://wol.jw.org/de/wol/meetings/r10/lp-x/{year}/{week_num_str}"
-            print(f"URL: {week_url}")
+            week_url = self._week_url(year, week_num)
+            log.debug(f"URL: {week_url}")
             
             # Lade die Wochenübersicht
             html = await self._fetch_page(week_url)
             if not html:
-                print(f"Keine Daten für Woche {week_num}/{year} gefunden")
+                log.warning(f"Keine Daten für Woche {week_num}/{year} gefunden")
                 return meeting_data
             
-            week_soup = BeautifulSoup(html, 'html.parser')
+            if self.parse_executor is not None:
+                # Der Pool parst beide Meetings und gibt nur Modellobjekte zurück; die Folgeabrufe bleiben hier
+                with self.metrics.span("parse", kind="week", bytes=len(html)):
+                    midweek_meeting, weekend_page, watchtower_link, title, week_links = await self._run_parse(
+                        parse_week_html, html, self.rules.lang)
+                self._index_week_page(year, week_num, week_url, title, week_links)
+                meeting_data.midweek = midweek_meeting
+                with self.metrics.span("parse", kind="weekend"):
+                    meeting_data.weekend = await self._complete_weekend_meeting(weekend_page, watchtower_link)
+                return self._checked(meeting_data, year, week_num)
+            
+            # Ein Durchlauf über das Dokument liefert alle Abschnitte für beide Parser
+            with self.metrics.span("parse", kind="outline", bytes=len(html)):
+                outline = build_week_outline(make_soup(html))
+            self._index_week_page(year, week_num, week_url, outline.title, outline.week_links)
             
             # Extrahiere die Daten für das Wochentags-Meeting
-            midweek_meeting = self._parse_midweek_meeting(week_soup)
-            meeting_data["midweekMeeting"] = midweek_meeting
+            with self.metrics.span("parse", kind="midweek"):
+                midweek_meeting = self._parse_midweek_meeting(outline)
+            meeting_data.midweek = midweek_meeting
             
-            # Extrahiere die Daten für das Wochenend-Meeting
-            weekend_meeting = await self._parse_weekend_meeting(week_soup)
-            meeting_data["weekendMeeting"] = weekend_meeting
+            # Extrahiere die Daten für das Wochenend-Meeting (inklusive Folgeabrufe)
+            with self.metrics.span("parse", kind="weekend"):
+                weekend_meeting = await self._parse_weekend_meeting(outline)
+            meeting_data.weekend = weekend_meeting
         
         except Exception as e:
-            print(f"Fehler beim Abrufen der Meeting-Daten: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"Fehler beim Abrufen der Meeting-Daten: {e}")
         
+        return self._checked(meeting_data, year, week_num)
+
+    def _checked(self, meeting_data: MeetingWeek, year, week_num) -> MeetingWeek:
+        """Verwirft Teile, die nicht zur Weeks-Collection passen, damit sie nie bei Payload ankommen
+
+        Ein verworfener Teil zählt wie ein nicht gefundener: scrape_week setzt
+        Standarddaten ein, run_job versucht die Woche beim nächsten Lauf erneut.
+        """
+        for part in ("midweek", "weekend"):
+            value = getattr(meeting_data, part)
+            problems = value.problems() if value is not None else None
+            if problems:
+                log.warning(f"Ungültige {part}-Daten für Woche {week_num}/{year} verworfen: {'; '.join(problems)}")
+                setattr(meeting_data, part, None)
         return meeting_data
 
-    async def scrape_multiple_weeks(self, start_year_week: str, num_weeks: int = 1) -> List[Dict[str, Any]]:
-        """Mehrere Wochen scrapen (Format start_year_week: YYYY/WW)"""
-        results = []
+    async def scrape_multiple_weeks(self, start_year_week: str, num_weeks: int = 1) -> List[MeetingWeek]:
+        """Mehrere Wochen gleichzeitig scrapen (Format start_year_week: YYYY/WW)
+
+        Die Anfragen laufen über den Scheduler parallel, die Ergebnisse kommen
+        trotzdem in Wochenreihenfolge zurück. Wochen, die es laut Manifest nicht
+        gibt, werden nicht abgerufen und bleiben leer.
+        """
+        year_weeks = list(iso_weeks_from(start_year_week, num_weeks))
         
-        year, week = map(int, start_year_week.split('/'))
+        log.info(f"Scrape {num_weeks} Wochen ab {start_year_week} "
+                 f"(max. {self.scheduler.concurrency} gleichzeitig, "
+                 f"{self.scheduler.requests_per_second} Anfragen/s pro Host"
+                 f"{', adaptiv' if self.scheduler.adaptive else ''})...")
+        started = time.perf_counter()
         
-        for i in range(num_weeks):
-            current_week = week + i
-            current_year = year
-            
-            # Jahreswechsel berücksichtigen
-            if current_week > 52:
-                current_week = 1
-                current_year += 1
+        existing = set(self._existing_weeks(year_weeks))
+        results = await asyncio.gather(*(
+            self.scrape_meeting(current_year, current_week)
+            if (current_year, current_week) in existing else self._no_week()
+            for current_year, current_week in year_weeks
+        ))
+        
+        log.info(f"{num_weeks} Wochen in {time.perf_counter() - started:.1f}s gescraped")
+        return list(results)
+
+    async def _no_week(self) -> MeetingWeek:
+        return MeetingWeek()
+
+    async def _scrape_existing_week(self, year, week_num, by_issue: Optional[bool] = None) -> Optional[MeetingWeek]:
+        """Wie scrape_week, aber None statt Standarddaten, wenn sich die Woche als nicht vorhanden herausstellt"""
+        meeting_data = await self.scrape_meeting(year, week_num, by_issue)
+        if not meeting_data.complete and self._known_missing(year, week_num):
+            log.info(f"Woche {week_num}/{year} gibt es upstream nicht, keine Ausgabe")
+            return None
+        return self._with_defaults(meeting_data)
+
+    async def scrape_week(self, year, week_num, by_issue: Optional[bool] = None) -> MeetingWeek:
+        """Lädt eine Woche und ergänzt fehlende Teile durch die Standarddaten"""
+        return self._with_defaults(await self.scrape_meeting(year, week_num, by_issue))
+
+    def _with_defaults(self, meeting_data: MeetingWeek) -> MeetingWeek:
+        # Prüfe, ob die Meeting-Daten gültig sind
+        if meeting_data.midweek is None:
+            log.warning("Midweek-Meeting-Daten nicht gefunden. Verwende Standarddaten.")
+            meeting_data.midweek = DEFAULT_MIDWEEK
+        
+        if meeting_data.weekend is None:
+            log.warning("Weekend-Meeting-Daten nicht gefunden. Verwende Standarddaten.")
+            meeting_data.weekend = DEFAULT_WEEKEND
+        
+        return meeting_data
+
+    async def _scrape_in_order(self, weeks, scrape):
+        """Führt `scrape(year, week_num)` für alle Wochen aus und liefert die Ergebnisse in Reihenfolge
+
+        Es laufen höchstens doppelt so viele Wochen wie Scheduler-Plätze voraus,
+        sodass der Speicherbedarf unabhängig von der Anzahl der Wochen bleibt.
+        """
+        weeks = iter(weeks)
+        lookahead = max(2, self.scheduler.concurrency * 2)
+        window = deque()
+        
+        def fill():
+            while len(window) < lookahead:
+                try:
+                    year, week_num = next(weeks)
+                except StopIteration:
+                    return
+                window.append((year, week_num, asyncio.ensure_future(scrape(year, week_num))))
+        
+        fill()
+        try:
+            while window:
+                year, week_num, task = window.popleft()
+                result = await task
+                fill()
+                yield year, week_num, result
+        finally:
+            for _, _, task in window:
+                task.cancel()
+
+    def _week_record(self, year, week_num, meeting_data: MeetingWeek,
+                     known: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Ausgabezeile einer Woche; unveränderte Wochen nur mit Fingerabdruck"""
+        year_week = f"{year}/{int(week_num):02d}"
+        week_data = meeting_data.to_dict()
+        fingerprint = week_fingerprint(week_data)
+        if known and known.get(year_week) == fingerprint:
+            return {"yearWeek": year_week, "fingerprint": fingerprint, "unchanged": True}
+        record = {"yearWeek": year_week, "fingerprint": fingerprint, **week_data}
+        if meeting_data.uses_defaults:
+            # Platzhalter statt echter Daten: Empfänger sollen das nicht zwischenspeichern
+            record["defaults"] = True
+        return record
+
+    async def scrape_range(self, from_year_week: str, to_year_week: str, known: Optional[Dict[str, str]] = None,
+                           by_issue: Optional[bool] = None):
+        """Scrapt einen Wochenbereich und liefert jede Woche in Wochenreihenfolge, sobald sie fertig ist
+
+        `known` bildet yearWeek auf den zuletzt importierten Fingerabdruck ab;
+        Wochen mit gleichem Inhalt kommen als {"yearWeek", "fingerprint", "unchanged": true}.
+        Wochen, die es upstream nicht gibt (laut Manifest oder 404), fehlen in der Ausgabe.
+        """
+        # aclosing: bricht der Empfänger ab, werden die vorauslaufenden Wochen sofort beendet
+        async with aclosing(self._scrape_in_order(
+                self._existing_weeks(iso_week_range(from_year_week, to_year_week)),
+                lambda year, week_num: self._scrape_existing_week(year, week_num, by_issue))) as results:
+            async for year, week_num, meeting_data in results:
+                if meeting_data is not None:
+                    yield self._week_record(year, week_num, meeting_data, known)
+
+    async def scrape_weeks(self, year_weeks: List[str], known: Optional[Dict[str, str]] = None,
+                           by_issue: Optional[bool] = None):
+        """Wie scrape_range, aber für eine beliebige Liste von Wochen im Format YYYY/WW"""
+        weeks = [parse_year_week(year_week) for year_week in year_weeks]
+        async with aclosing(self._scrape_in_order(
+                self._existing_weeks(weeks),
+                lambda year, week_num: self._scrape_existing_week(year, week_num, by_issue))) as results:
+            async for year, week_num, meeting_data in results:
+                if meeting_data is not None:
+                    yield self._week_record(year, week_num, meeting_data, known)
+
+    async def run_range(self, from_year_week, to_year_week, output_file=None, known: Optional[Dict[str, str]] = None):
+        """Scrapt einen Wochenbereich und schreibt jede Woche als NDJSON-Zeile"""
+        # Ohne Ausgabedatei gehören die NDJSON-Zeilen nach stdout, Diagnosemeldungen loggen nach stderr
+        out = open(output_file, 'w', encoding='utf-8') if output_file else sys.stdout
+        
+        log.info(f"JW Meetings Scraper startet für {from_year_week} bis {to_year_week}...")
+        count = 0
+        unchanged = 0
+        try:
+            async with self._connection():
+                await self._accept_cookies()
+                async for record in self.scrape_range(from_year_week, to_year_week, known):
+                    out.write(dumps(record, compact=True) + "\n")
+                    out.flush()
+                    count += 1
+                    unchanged += record.get("unchanged", False)
+            log.info(f"{count} Wochen ausgegeben, davon {unchanged} unverändert")
+        finally:
+            if output_file:
+                out.close()
+        
+        return count
+
+    async def run_job(self, journal: JobJournal, from_year_week, to_year_week, output_file=None,
+                      known: Optional[Dict[str, str]] = None):
+        """Wie run_range, aber mit Checkpoint pro Woche
+
+        Bereits erledigte Wochen kommen aus dem Journal, nur fehlende oder
+        fehlgeschlagene Wochen werden erneut abgerufen. Fehlgeschlagene Wochen
+        werden nicht mit Standarddaten aufgefüllt, sondern im Journal vermerkt.
+        Gibt die Anzahl der fehlgeschlagenen Wochen zurück.
+        """
+        job = f"{from_year_week}-{to_year_week}"
+        failed = 0
+        
+        async def resume_or_scrape(year, week_num):
+            nonlocal failed
+            year_week = f"{year}/{week_num:02d}"
+            done = journal.completed(job, year_week)
+            if done is not None:
+                try:
+                    return MeetingWeek.from_dict(done)
+                except ValidationError as e:
+                    # Checkpoint aus einer älteren Version oder beschädigt: neu abrufen
+                    log.warning(f"Checkpoint für {year_week} ungültig ({e}), wird neu abgerufen")
             
-            year_week = f"{current_year}/{current_week:02d}"
-            print(f"Scrape Woche {year_week}...")
+            meeting_data = await self.scrape_meeting(year, week_num)
+            if not meeting_data.complete and self._known_missing(year, week_num):
+                # Kein Fehlschlag: die Woche ist upstream (noch) nicht veröffentlicht
+                log.info(f"Woche {year_week} gibt es upstream nicht")
+                return None
+            if not meeting_data.complete:
+                journal.mark_failed(job, year_week, "Keine Meeting-Daten gefunden")
+                failed += 1
+                log.warning(f"Woche {year_week} fehlgeschlagen, wird beim nächsten Lauf erneut versucht")
+                return None
             
-            week_data = await self.scrape_meeting(current_year, current_week)
-            if week_data:
-                results.append(week_data)
+            journal.mark_done(job, year_week, meeting_data.to_dict())
+            return meeting_data
         
-        return results
+        # Ohne Ausgabedatei gehören die NDJSON-Zeilen nach stdout, Diagnosemeldungen loggen nach stderr
+        out = open(output_file, 'w', encoding='utf-8') if output_file else sys.stdout
+        
+        log.info(f"Job {job} startet (bisher: {journal.summary(job) or 'keine Checkpoints'})...")
+        try:
+            async with self._connection():
+                await self._accept_cookies()
+                async for year, week_num, meeting_data in self._scrape_in_order(
+                        self._existing_weeks(iso_week_range(from_year_week, to_year_week)), resume_or_scrape):
+                    if meeting_data is None:
+                        continue
+                    record = self._week_record(year, week_num, meeting_data, known)
+                    out.write(dumps(record, compact=True) + "\n")
+                    out.flush()
+            log.info(f"Job {job} beendet, {failed} Wochen fehlgeschlagen")
+        finally:
+            if output_file:
+                out.close()
+        
+        return failed
 
-    async def run(self, year, week_num, output_file=None):
-        """Führt den Scraper aus und schreibt die Ergebnisse in eine Datei"""
-        print(f"JW Meetings Scraper startet für Woche {week_num}/{year}...")
-        
-        # Erstelle einen leeren Standard-Datensatz für den Fall eines Fehlers
-        default_data = {
-            "midweekMeeting": {
-                "openingSong": 11,
-                "treasuresFromGodsWord": {
-                    "talkTitle": "Was wir von den Ameisen lernen können",
-                    "talkDuration": 10,
-                    "spiritualGemsDuration": 10,
-                    "bibleReadingScripture": "Sprüche 6:1-26",
-                    "bibleReadingLesson": "th Lektion 10",
-                    "bibleReadingDuration": 4
-                },
-                "applyYourselfToFieldMinistry": {
-                    "fieldMinistryAssignments": [
-                        {
-                            "title": "Gespräche beginnen",
-                            "lesson": "lmd Lektion 4, Punkt 3",
-                            "duration": 4,
-                            "id": "1"
-                        },
-                        {
-                            "title": "Gespräche beginnen",
-                            "lesson": "lmd Lektion 3, Punkt 3",
-                            "duration": 4,
-                            "id": "2"
-                        },
-                        {
-                            "title": "Gespräche beginnen",
-                            "lesson": "lmd Lektion 5, Punkt 3",
-                            "duration": 4,
-                            "id": "3"
-                        }
-                    ]
-                },
-                "livingAsChristians": {
-                    "livingAsChristiansSong": 2,
-                    "assignments": [
-                        {
-                            "title": "Jehovas Schöpfung gibt uns Gründe zur Freude – Faszinierende Tiere",
-                            "duration": 5,
-                            "id": "1"
-                        },
-                        {
-                            "title": "Aktuelles",
-                            "duration": 10,
-                            "id": "2"
-                        },
-                        {
-                            "title": "Versammlungs­bibelstudium",
-                            "duration": 30,
-                            "id": "3"
-                        }
-                    ]
-                },
-                "closingSong": 126
-            },
-            "weekendMeeting": {
-                "openingSong": 11,
-                "middleSong": 18,
-                "closingSong": 107,
-                "publicTalkTitle": "Öffentlicher Vortrag",
-                "publicTalkDuration": 30,
-                "watchtowerStudyTitle": "Was wir durch das Lösegeld lernen",
-                "watchtowerStudyDuration": 60
-            }
-        }
+    async def run(self, year, week_num, output_file=None, compact: bool = False):
+        """Führt den Scraper aus und schreibt die Ergebnisse in eine Datei (compact: ohne Einrückung)"""
+        log.info(f"JW Meetings Scraper startet für Woche {week_num}/{year}...")
         
         try:
-            async with aiohttp.ClientSession() as self.session:
+            async with self._connection():
                 # Akzeptiere die Cookies
                 await self._accept_cookies()
                 
                 # Hole die Meeting-Daten
-                meeting_data = await self.scrape_meeting(year, week_num)
-                
-                # Prüfe, ob die Meeting-Daten gültig sind
-                if meeting_data["midweekMeeting"] is None:
-                    print("WARNUNG: Midweek-Meeting-Daten nicht gefunden. Verwende Standarddaten.")
-                    meeting_data["midweekMeeting"] = default_data["midweekMeeting"]
-                
-                if meeting_data["weekendMeeting"] is None:
-                    print("WARNUNG: Weekend-Meeting-Daten nicht gefunden. Verwende Standarddaten.")
-                    meeting_data["weekendMeeting"] = default_data["weekendMeeting"]
+                meeting_data = await self.scrape_week(year, week_num)
                 
                 # Gib die Ergebnisse aus
                 if output_file:
                     with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(meeting_data, f, ensure_ascii=False, indent=2)
-                    print(f"Ergebnisse wurden in {output_file} gespeichert.")
+                        f.write(dumps(meeting_data, compact))
+                    log.info(f"Ergebnisse wurden in {output_file} gespeichert.")
                 else:
-                    print(json.dumps(meeting_data, ensure_ascii=False, indent=2))
+                    print(dumps(meeting_data, compact))
                 
                 return meeting_data
                 
         except Exception as e:
-            print(f"Fehler beim Ausführen des Scrapers: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"Fehler beim Ausführen des Scrapers: {e}")
             
             # Im Fehlerfall die Standarddaten zurückgeben
+            default_data = MeetingWeek(DEFAULT_MIDWEEK, DEFAULT_WEEKEND)
             if output_file:
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_data, f, ensure_ascii=False, indent=2)
-                print(f"Standarddaten wurden in {output_file} gespeichert.")
+                    f.write(dumps(default_data, compact))
+                log.info(f"Standarddaten wurden in {output_file} gespeichert.")
             
             return default_data
 
-    async def _get_correct_watchtower_url(self, toc_link):
-        """Folgt dem Inhaltsverzeichnis-Link, um den korrekten Artikel-Link zu finden"""
-        print(f"Folge dem Inhaltsverzeichnis-Link: {toc_link}")
+    async def run_multiple(self, start_year_week, num_weeks, output_file=None, compact: bool = False):
+        """Scrapt mehrere Wochen und schreibt die Ergebnisse als Liste in eine Datei"""
+        log.info(f"JW Meetings Scraper startet für {num_weeks} Wochen ab {start_year_week}...")
         
-        # Konstruiere den vollständigen URL
-        if toc_link.startswith("/"):
-            full_toc_url = f"https://wol.jw.org{toc_link}"
+        async with self._connection():
+            await self._accept_cookies()
+            results = await self.scrape_multiple_weeks(start_year_week, num_weeks)
+        
+        if output_file:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(dumps(results, compact))
+            log.info(f"Ergebnisse wurden in {output_file} gespeichert.")
         else:
-            full_toc_url = toc_link
+            print(dumps(results, compact))
+        
+        return results
+
+    async def serve(self):
+        """Worker-Modus: beantwortet Anfragen als JSON-Lines über stdin/stdout.
+
+        Anfrage:  {"id": 1, "yearWeek": "2025/10", "since": "<Fingerabdruck>"}
+        Antwort:  {"id": 1, "success": true, "fingerprint": "...", "weekData": {...}}
+                  bzw. {"id": 1, "success": true, "fingerprint": "...", "unchanged": true}
+        
+        Bereich:  {"id": 2, "from": "2025/10", "to": "2025/20", "known": {"2025/10": "<Fingerabdruck>"}}
+        Antwort:  {"id": 2, "week": {"yearWeek": "2025/10", "fingerprint": "...", ...}} je Woche,
+                  danach {"id": 2, "success": true, "done": true}
+        
+        Liste:    {"id": 4, "weeks": ["2025/10", "2025/14"], "known": {...}}
+        Antwort:  wie beim Bereich, in der Reihenfolge der Liste
+        
+        Mit "byIssue": true kommen die Wochen aus den Inhaltsverzeichnissen der
+        Ausgaben (Arbeitsheft, Wachtturm) statt über die Wochenübersichten.
+        
+        Mit "window": N sind höchstens N Wochen unbestätigt unterwegs; der
+        Empfänger bestätigt gespeicherte Wochen mit {"id": 2, "ack": <Anzahl>}.
+        Bis dahin ruht der Bereich, auch das Abrufen weiterer Seiten.
+        
+        Abbruch:  {"id": 2, "cancel": true} beendet die laufende Anfrage mit derselben id
+        Antwort:  {"id": 2, "success": false, "cancelled": true, "error": "..."}
+        
+        "since" und "known" sind optional; ohne sie kommen immer die vollständigen Daten.
+        Wochen mit Standarddaten statt gefundener Teile tragen "defaults": true.
+        
+        Metriken: {"id": 3, "metrics": "prometheus"} (oder "json")
+        Antwort:  {"id": 3, "success": true, "metrics": "..."}
+        
+        Wochen- und Bereichsanfragen können mit "lang" (z. B. "en") eine andere
+        Sprache anfordern; alle Sprachen teilen sich Session, Cache und Budget.
+
+        Die Session bleibt über alle Anfragen hinweg offen, sodass pro Woche
+        nur noch Abruf und Parsing anfallen. Diagnoseausgaben gehen nach stderr,
+        damit stdout ausschließlich das Protokoll enthält.
+        """
+        protocol_out = sys.stdout
+        sys.stdout = sys.stderr
+        
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        
+        def respond(message):
+            protocol_out.write(dumps(message, compact=True) + "\n")
+            protocol_out.flush()
+        
+        # Bestätigte Wochen je Bereichsanfrage (Flusskontrolle über "window"/"ack")
+        acked: Dict[Any, int] = {}
+        ack_changed = asyncio.Condition()
+        # Laufende Wochen-, Bereichs- und Listenanfragen, damit "cancel" sie beenden kann
+        jobs: Dict[Any, asyncio.Task] = {}
+        last_rate_save = time.monotonic()
         
+        def save_rate_state():
+            # Der Worker läuft lange und wird meist von außen beendet: Takt nach Abrufen sichern,
+            # aber gedrosselt, damit viele kurze Anfragen nicht jedes Mal die Datei schreiben
+            nonlocal last_rate_save
+            if time.monotonic() - last_rate_save >= self.rate_save_interval:
+                last_rate_save = time.monotonic()
+                self._save_rate_state()
+        
+        async def handle(line):
+            request_id = None
+            try:
+                request = json.loads(line)
+                request_id = request.get("id")
+                
+                # Metrikabfrage: aggregierte Spans als Prometheus-Text oder JSON
+                if "metrics" in request:
+                    if request["metrics"] == "prometheus":
+                        respond({"id": request_id, "success": True, "metrics": self.metrics.prometheus()})
+                    else:
+                        respond({"id": request_id, "success": True, "metrics": self.metrics.snapshot()})
+                    return
+                
+                # Bestätigung des Empfängers: gibt im Bereich mit derselben id weitere Wochen frei
+                if "ack" in request:
+                    async with ack_changed:
+                        acked[request_id] = max(acked.get(request_id, 0), int(request["ack"]))
+                        ack_changed.notify_all()
+                    return
+                
+                # Abbruch durch den Empfänger (z. B. Client getrennt): Abrufe des Auftrags beenden
+                if "cancel" in request:
+                    job = jobs.get(request_id)
+                    if job is not None:
+                        job.cancel()
+                    return
+                
+                jobs[request_id] = asyncio.current_task()
+                # Folgeseiten nur innerhalb der Anfrage teilen: der Worker läuft lange, und
+                # gemerkte Ergebnisse würden sonst die TTL des HTTP-Caches umgehen
+                scraper = self.for_lang(request.get("lang")).for_request()
+                
+                # Wochen vor dem ersten Abruf prüfen, damit Fehler verständlich zurückkommen
+                if "weeks" in request:
+                    if not isinstance(request["weeks"], list):
+                        raise ValueError("weeks muss eine Liste von Wochen (JJJJ/WW) sein")
+                    for year_week in request["weeks"]:
+                        parse_year_week(year_week)
+                elif "from" in request:
+                    parse_year_week(request["from"])
+                    parse_year_week(request.get("to"))
+                else:
+                    parse_year_week(request.get("yearWeek"))
+                
+                # Bereichs- oder Listenanfrage: eine Zeile pro Woche, danach eine Abschlusszeile
+                if "from" in request or "weeks" in request:
+                    if "weeks" in request:
+                        records = scraper.scrape_weeks(request["weeks"], request.get("known"), request.get("byIssue"))
+                    else:
+                        records = scraper.scrape_range(request["from"], request["to"], request.get("known"),
+                                                       request.get("byIssue"))
+                    window = request.get("window")
+                    sent = 0
+                    try:
+                        # aclosing: auch bei "cancel" während des Wartens auf eine Bestätigung
+                        # enden die vorauslaufenden Abrufe sofort
+                        async with aclosing(records):
+                            async for record in records:
+                                if window:
+                                    async with ack_changed:
+                                        await asyncio.wait_for(
+                                            ack_changed.wait_for(lambda: sent - acked.get(request_id, 0) < window),
+                                            self.ack_timeout)
+                                respond({"id": request_id, "week": record})
+                                sent += 1
+                    except asyncio.TimeoutError:
+                        raise RuntimeError(f"Keine Bestätigung innerhalb von {self.ack_timeout:.0f}s, "
+                                           f"{sent} Wochen gesendet") from None
+                    finally:
+                        acked.pop(request_id, None)
+                    respond({"id": request_id, "success": True, "done": True})
+                    return
+                
+                year, week_num = parse_year_week(request["yearWeek"])
+                meeting_data = await scraper.scrape_week(year, week_num)
+                week_data = meeting_data.to_dict()
+                fingerprint = week_fingerprint(week_data)
+                if request.get("since") == fingerprint:
+                    respond({"id": request_id, "success": True, "fingerprint": fingerprint, "unchanged": True})
+                elif meeting_data.uses_defaults:
+                    respond({"id": request_id, "success": True, "fingerprint": fingerprint, "weekData": week_data,
+                             "defaults": True})
+                else:
+                    respond({"id": request_id, "success": True, "fingerprint": fingerprint, "weekData": week_data})
+            except asyncio.CancelledError:
+                log.info(f"Worker-Anfrage {request_id} abgebrochen")
+                respond({"id": request_id, "success": False, "cancelled": True, "error": "Anfrage abgebrochen"})
+            except Exception as e:
+                log.error(f"Fehler bei Worker-Anfrage {request_id}: {e}")
+                respond({"id": request_id, "success": False, "error": str(e)})
+            finally:
+                # Nur abgeschlossene Abrufe ändern den Takt, Bestätigungen und Metrikabfragen nicht
+                if jobs.get(request_id) is asyncio.current_task():
+                    del jobs[request_id]
+                    save_rate_state()
+        
+        await self._init_session()
+        await self._accept_cookies()
+        log.info("JW Meetings Scraper Worker bereit")
+        respond({"ready": True})
+        
+        pending = set()
         try:
-            # Lade die Inhaltsverzeichnis-Seite
-            response = await self.session.get(full_toc_url)
-            if response.status != 200:
-                print(f"Fehler: HTTP-Status {response.status} für URL {full_toc_url}")
-                return None
-            
-            html = await response.text()
-            soup = BeautifulSoup(html, 'html.parser')
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                task = asyncio.create_task(handle(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
             
-            # Suche nach dem Link zum eigentlichen Artikel
-            article_link = None
-            article_elem = soup.select_one("a.jwac.card-article")
-            if article_elem:
-                article_link = article_elem.get("href")
-                print(f"Artikel-Link gefunden: {article_link}")
-            
-            # Fallback: Suche nach anderen Link-Formaten
-            if not article_link:
-                link_elems = soup.select("a.lnk")
-                for link in link_elems:
-                    if "/d/" in link.get("href", ""):
-                        article_link = link.get("href")
-                        print(f"Fallback: Artikel-Link gefunden: {article_link}")
-                        break
-            
-            return article_link
-        except Exception as e:
-            print(f"Fehler beim Folgen des Inhaltsverzeichnis-Links: {e}")
-            return None
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            await self.close()
+            sys.stdout = protocol_out
+
+    async def _get_correct_watchtower_url(self, toc_link):
+        """Folgt dem Inhaltsverzeichnis-Link, um den korrekten Artikel-Link zu finden"""
+        log.debug(f"Folge dem Inhaltsverzeichnis-Link: {toc_link}")
+        
+        # Konstruiere den vollständigen URL
+        full_toc_url = self._absolute(toc_link)
+        
+        # Gleicher Weg wie die Wochenseiten: Verbindungspool, Rate-Limit, Cache
+        article_link = await self._resolve_article_link(full_toc_url)
+        if article_link:
+            log.debug(f"Artikel-Link gefunden: {article_link}")
+        return article_link
 
     async def _accept_cookies(self):
         """Simuliert das Akzeptieren von Cookies auf der JW.org Website"""
-        print("Simuliere Cookie-Akzeptanz...")
+        log.debug("Simuliere Cookie-Akzeptanz...")
         try:
             # Einfach eine Anfrage an die Startseite senden
             await self._fetch_page(self.base_url)
         except Exception as e:
-            print(f"Fehler beim Akzeptieren der Cookies: {e}")
+            log.warning(f"Fehler beim Akzeptieren der Cookies: {e}")
 
-if __name__ == "__main__":
-    import sys
+def main(argv: Optional[List[str]] = None) -> int:
+    """Kommandozeile; gibt den Exit-Code zurück"""
     import argparse
-    import os
-    import time
-    import asyncio
     
-    # Verwende ArgumentParser für die Befehlszeilenargumente
     parser = argparse.ArgumentParser(description='JW Meetings Scraper')
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--year-week', help='Jahr und Woche im Format YYYY/WW')
     group.add_argument('--year', help='Jahr')
+    group.add_argument('--from', dest='from_year_week', help='Erste Woche eines Bereichs im Format YYYY/WW (Ausgabe als NDJSON)')
+    group.add_argument('--serve', action='store_true', help='Worker-Modus: JSON-Lines-Anfragen über stdin/stdout beantworten')
     parser.add_argument('--week', help='Wochennummer (erforderlich, wenn --year verwendet wird)')
+    parser.add_argument('--to', dest='to_year_week', help='Letzte Woche des Bereichs im Format YYYY/WW (erforderlich mit --from)')
     parser.add_argument('--output', help='Ausgabedatei')
+    parser.add_argument('--weeks', type=int, default=1, help='Anzahl der Wochen ab --year-week (Standard: 1)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximale Anzahl gleichzeitiger Anfragen (Standard: 4)')
+    parser.add_argument('--rate', type=float, default=1.0, help='Anfragen pro Sekunde und Host, mit adaptivem Takt der Startwert (Standard: 1.0)')
+    parser.add_argument('--max-rate', type=float, default=4.0, help='Obergrenze des adaptiven Takts in Anfragen pro Sekunde (Standard: 4.0)')
+    parser.add_argument('--fixed-rate', action='store_true', help='Festen Takt (--rate) verwenden statt ihn an Latenz und Fehler anzupassen')
+    parser.add_argument('--rate-state', default=os.path.join('temp', 'jw_rate_state.json'), help='Datei für den gelernten Takt pro Host (Standard: temp/jw_rate_state.json)')
+    parser.add_argument('--cache', default=os.path.join('temp', 'jw_http_cache.sqlite'), help='Pfad des Seiten-Caches (Standard: temp/jw_http_cache.sqlite)')
+    parser.add_argument('--cache-ttl', type=float, default=7 * 24 * 3600, help='Sekunden, bis gecachte Seiten revalidiert werden (Standard: 7 Tage)')
+    parser.add_argument('--no-cache', action='store_true', help='Seiten-Cache deaktivieren')
+    parser.add_argument('--retries', type=int, default=4, help='Wiederholungen bei 429/5xx/Netzwerkfehlern (Standard: 4)')
+    parser.add_argument('--metrics-log', help='Spans (Abruf, Parsing) als JSON-Lines in diese Datei schreiben ("-" für stderr)')
+    parser.add_argument('--lang', default='de', choices=sorted(RULES), help='Sprache der Zusammenkunftsseiten (Standard: de)')
+    parser.add_argument('--parse-workers', type=int, default=0, help='Seiten in so vielen Prozessen parsen (Standard: 0 = in der Event-Loop)')
+    parser.add_argument('--since', help='NDJSON-Ausgabe eines früheren Laufs (--from/--to oder --format json): unveränderte Wochen nur mit Fingerabdruck ausgeben')
+    parser.add_argument('--http2', action='store_true', help='HTTP/2 über httpx statt aiohttp (benötigt httpx[http2])')
+    parser.add_argument('--origin', default='https://wol.jw.org', help='Host der Seiten, z. B. ein lokaler Ersatzserver (Standard: https://wol.jw.org)')
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument('--record', metavar='ARCHIV', help='Alle Antworten in ein WARC-Archiv schreiben (ohne Seiten-Cache)')
+    archive.add_argument('--replay', metavar='ARCHIV', help='Seiten nur aus einem WARC-Archiv abspielen: kein Netzwerk, keine Wartezeiten')
+    parser.add_argument('--compact', action='store_true', help='JSON-Ausgabe ohne Einrückung (--year-week/--year)')
+    parser.add_argument('--checkpoint', help='Job-Journal (SQLite) für --from/--to: erledigte Wochen beim Neustart überspringen')
+    parser.add_argument('--manifest', default=os.path.join('temp', 'jw_manifest.sqlite'), help='Verzeichnis vorhandener und fehlender Wochenseiten (Standard: temp/jw_manifest.sqlite)')
+    parser.add_argument('--no-manifest', action='store_true', help='Manifest nicht speichern, fehlende Wochen nur für diesen Lauf merken')
+    parser.add_argument('--by-issue', action='store_true', help='Wochen aus den Inhaltsverzeichnissen von Arbeitsheft und Wachtturm laden statt über die Wochenübersicht')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='json: Ergebnis als JSON-Dokument bzw. NDJSON nach stdout statt in eine temporäre Datei, Meldungen als JSON-Lines nach stderr (Standard: text)')
+    logging_group = parser.add_mutually_exclusive_group()
+    logging_group.add_argument('--log-level', choices=jw_log.LEVELS, default='info', help='Meldungen ab dieser Stufe nach stderr schreiben (Standard: info)')
+    logging_group.add_argument('--quiet', '-q', action='store_const', dest='log_level', const='warning', help='Nur Warnungen und Fehler melden (wie --log-level warning)')
+    
+    args = parser.parse_args(argv)
+    jw_log.configure(args.log_level, args.format)
+    for year_week in (args.year_week, args.from_year_week, args.to_year_week):
+        if year_week is not None:
+            try:
+                parse_year_week(year_week)
+            except ValueError as e:
+                parser.error(str(e))
+    
+    def create_scraper():
+        # Aufnahme und Wiedergabe laufen am Cache vorbei, sonst fehlen Seiten im Archiv bzw. es wird nicht abgespielt
+        use_cache = not (args.no_cache or args.record or args.replay)
+        cache = HttpCache(args.cache, ttl=args.cache_ttl) if use_cache else None
+        metrics = None
+        if args.metrics_log:
+            metrics = Metrics(sys.stderr if args.metrics_log == '-' else open(args.metrics_log, 'a', encoding='utf-8'))
+        transport = None
+        if args.http2:
+            try:
+                transport = HttpxTransport(concurrency=args.concurrency, http2=True)
+            except ImportError:
+                parser.error('--http2 benötigt httpx mit HTTP/2-Unterstützung (pip install "httpx[http2]")')
+        if args.replay:
+            transport = ReplayTransport(args.replay)
+        elif args.record:
+            transport = RecordingTransport(transport or AiohttpTransport(concurrency=args.concurrency), args.record)
+        # Beim Abspielen fehlen nur nicht aufgezeichnete Seiten, das gehört nicht ins Manifest
+        manifest = None if args.no_manifest or args.replay else WeekManifest(args.manifest)
+        return JWMeetingScraper(concurrency=args.concurrency, requests_per_second=args.rate, cache=cache,
+                                max_retries=args.retries, metrics=metrics, lang=args.lang,
+                                parse_executor=create_parse_pool(args.parse_workers) if args.parse_workers > 0 else None,
+                                transport=transport, origin=args.origin, adaptive_rate=not args.fixed_rate,
+                                max_rate=max(args.max_rate, args.rate), rate_state=args.rate_state,
+                                by_issue=args.by_issue, manifest=manifest)
+    
+    def run_scraper(job):
+        """Führt `job(scraper)` aus und schließt danach Cache, Manifest und Verbindungspool, auch bei Fehlern"""
+        async def run_and_close():
+            scraper = create_scraper()
+            try:
+                return await job(scraper)
+            finally:
+                await scraper.close()
+        return asyncio.run(run_and_close())
     
-    args = parser.parse_args()
+    if args.serve:
+        # Langlebiger Worker: eine Session für beliebig viele Wochen
+        asyncio.run(create_scraper().serve())
+        return 0
+    
+    if args.from_year_week:
+        if not args.to_year_week:
+            parser.error('--to ist erforderlich, wenn --from verwendet wird')
+        # Vor dem Lauf lesen, damit --since und --output dieselbe Datei sein dürfen
+        known = load_fingerprints(args.since) if args.since else None
+        if args.checkpoint:
+            # Fortsetzbarer Job: Exit-Code 1, solange noch Wochen fehlgeschlagen sind
+            journal = JobJournal(args.checkpoint)
+            try:
+                failed = run_scraper(lambda scraper: scraper.run_job(journal, args.from_year_week, args.to_year_week,
+                                                                     args.output, known))
+            finally:
+                journal.close()
+            return 1 if failed else 0
+        run_scraper(lambda scraper: scraper.run_range(args.from_year_week, args.to_year_week, args.output, known))
+        return 0
     
     # Verarbeite die Argumente
     if args.year_week:
@@ -702,6 +1590,18 @@ if __name__ == "__main__":
         year = args.year
         week_num = args.week
     
+    if args.format == 'json':
+        # Eine Woche als ein JSON-Dokument, mehrere als NDJSON, beides im Zeilenformat von --from/--to
+        weeks = [f"{y}/{w:02d}" for y, w in iso_weeks_from(f"{year}/{week_num}", max(args.weeks, 1))]
+        known = load_fingerprints(args.since) if args.since else None
+        try:
+            count = run_scraper(lambda scraper: scraper.run_range(weeks[0], weeks[-1], args.output, known))
+        except Exception as e:
+            log.exception(f"Fehler: {e}")
+            return 1
+        # Für eine einzelne Woche ist eine fehlende Ausgabe ein Fehler, in Bereichen nicht
+        return 0 if count or args.weeks > 1 else 1
+    
     output_file = args.output
     
     # Wenn keine Ausgabedatei angegeben wurde, erstelle eine temporäre
@@ -711,39 +1611,22 @@ if __name__ == "__main__":
             os.makedirs(temp_dir)
         output_file = os.path.join(temp_dir, f"meeting_data_{int(time.time() * 1000)}.json")
     
-    print(f"Scrape Woche {year}/{week_num}...")
+    log.info(f"Scrape Woche {year}/{week_num}...")
     
-    # Hier ist die eigentliche Änderung: Mache das Skript vollständig synchron
-    def main():
-        # Ausführen des Scrapers
-        scraper = JWMeetingScraper()
-        
-        try:
-            # Prüfe ob wir bereits in einem Event Loop sind
-            try:
-                loop = asyncio.get_running_loop()
-                in_loop = True
-            except RuntimeError:
-                # Kein laufender Event Loop
-                in_loop = False
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Basierend auf dem Kontext die richtige Methode zum Ausführen der Coroutine wählen
-            if in_loop:
-                # Wenn wir bereits in einem Event Loop sind, verwende loop.run_until_complete
-                meeting_data = loop.run_until_complete(scraper.run(year, week_num, output_file))
-            else:
-                # Wenn kein Event Loop läuft, können wir asyncio.run verwenden
-                meeting_data = asyncio.run(scraper.run(year, week_num, output_file))
-            
-            print(f"Woche {year}/{week_num} erfolgreich gescraped und in {output_file} gespeichert!")
-            return 0
-        except Exception as e:
-            print(f"Fehler: {e}")
-            import traceback
-            traceback.print_exc()
-            return 1
+    if args.weeks > 1:
+        job = lambda scraper: scraper.run_multiple(f"{year}/{week_num}", args.weeks, output_file, args.compact)
+    else:
+        job = lambda scraper: scraper.run(year, week_num, output_file, args.compact)
+    
+    try:
+        run_scraper(job)
+    except Exception as e:
+        log.exception(f"Fehler: {e}")
+        return 1
     
-    # Führe die Hauptfunktion aus und setze den Exit-Code
-    sys.exit(main())
\ No newline at end of file
+    log.info(f"Woche {year}/{week_num} erfolgreich gescraped und in {output_file} gespeichert!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
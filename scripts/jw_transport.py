@@ -0,0 +1,371 @@
+import asyncio
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+
+
+class AiohttpTransport:
+    """Ein explizit konfigurierter Verbindungspool für alle Abrufe (HTTP/1.1, Keep-Alive)
+
+    Wochen-, Inhaltsverzeichnis- und Artikelseiten laufen über dieselbe
+    Session; Verbindungen werden wiederverwendet statt pro Seite neu
+    aufgebaut, DNS-Antworten werden zwischengespeichert. aiohttp wird erst
+    beim Öffnen importiert: Läufe, die nur den Cache brauchen, starten ohne.
+    """
+
+    # Echte Server bekommen Rate-Limit und Jitter des Schedulers
+    throttle = True
+
+    def __init__(self, concurrency: int = 4, keepalive_timeout: float = 30.0,
+                 dns_ttl: int = 300, connect_timeout: float = 10.0, read_timeout: float = 30.0,
+                 total_timeout: Optional[float] = 120.0):
+        # Der Scheduler begrenzt bereits die gleichzeitigen Anfragen; etwas Reserve
+        # für Seiten, die gerade gestreamt oder verworfen werden
+        self.limit = concurrency + 2
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.timeouts = dict(total=total_timeout, connect=connect_timeout, sock_read=read_timeout)
+        self.session = None
+
+    @property
+    def errors(self):
+        """Fehler, bei denen sich ein erneuter Versuch lohnt"""
+        import aiohttp
+
+        return (aiohttp.ClientError, asyncio.TimeoutError)
+
+    async def open(self):
+        # Der Connector braucht eine laufende Event-Loop, daher erst hier anlegen
+        if self.session is None or self.session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit,
+                                             ttl_dns_cache=self.dns_ttl,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 timeout=aiohttp.ClientTimeout(**self.timeouts))
+
+    def get(self, url: str, headers=None):
+        """Asynchroner Kontextmanager; die Antwort wird beim Verlassen freigegeben"""
+        return self.session.get(url, headers=headers)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class _HttpxContent:
+    def __init__(self, response):
+        self._response = response
+
+    def iter_chunked(self, size: int):
+        return self._response.aiter_bytes(size)
+
+
+class _HttpxResponse:
+    """Passt eine httpx-Antwort an die Teile der aiohttp-Antwort an, die der Scraper nutzt"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.charset = response.charset_encoding
+        self.content = _HttpxContent(response)
+
+    async def text(self) -> str:
+        await self._response.aread()
+        return self._response.text
+
+    def close(self):
+        # Beim Verlassen des Stream-Kontexts schließt httpx die ungelesene Antwort ohnehin
+        # (HTTP/2: Stream-Reset, HTTP/1.1: Verbindung wird verworfen)
+        pass
+
+
+class HttpxTransport:
+    """Verbindungspool über httpx, optional mit HTTP/2 (ein Multiplex-Kanal pro Host)
+
+    httpx und h2 sind optional und werden erst beim Anlegen importiert
+    (pip install "httpx[http2]").
+    """
+
+    def __init__(self, concurrency: int = 4, http2: bool = True, keepalive_timeout: float = 30.0,
+                 connect_timeout: float = 10.0, read_timeout: float = 30.0):
+        import httpx
+        if http2:
+            import h2  # noqa: F401  (sonst scheitert erst der erste Abruf)
+
+        self.errors = (httpx.TransportError, asyncio.TimeoutError)
+        self.throttle = True
+        self.http2 = http2
+        self.limits = httpx.Limits(max_connections=concurrency + 2,
+                                   max_keepalive_connections=concurrency + 2,
+                                   keepalive_expiry=keepalive_timeout)
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.client = None
+
+    async def open(self):
+        import httpx
+
+        if self.client is None:
+            self.client = httpx.AsyncClient(http2=self.http2, limits=self.limits, timeout=self.timeout)
+
+    @asynccontextmanager
+    async def get(self, url: str, headers=None):
+        # Verbindungsbezogene Header sind in HTTP/2 unzulässig, den Pool verwaltet httpx selbst
+        headers = {key: value for key, value in (headers or {}).items() if key.lower() != "connection"}
+        async with self.client.stream("GET", url, headers=headers) as response:
+            yield _HttpxResponse(response)
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+# Antwort-Header, die im Archiv nichts verloren haben: der Body liegt dort bereits dekodiert
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive", "set-cookie"}
+
+
+class WarcArchive:
+    """Schlankes WARC-Archiv (WARC/1.0, Datensätze vom Typ response)
+
+    Jeder Datensatz enthält die HTTP-Antwort mit Statuszeile, Headern und
+    dekodiertem Body; Werkzeuge wie warcio können die Datei lesen. Beim
+    Aufzeichnen wird angehängt, beim Abspielen gewinnt die letzte Antwort
+    je URL.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def write(self, url: str, status: int, headers, body: bytes):
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "ab")
+
+        lines = [f"HTTP/1.1 {status} {_reason(status)}"]
+        lines += [f"{key}: {value}" for key, value in headers.items() if key.lower() not in _HOP_HEADERS]
+        lines.append(f"Content-Length: {len(body)}")
+        block = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + body
+
+        record = "\r\n".join([
+            "WARC/1.0",
+            "WARC-Type: response",
+            f"WARC-Target-URI: {url}",
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+            "Content-Type: application/http;msgtype=response",
+            f"Content-Length: {len(block)}",
+        ]) + "\r\n\r\n"
+        self._file.write(record.encode("utf-8") + block + b"\r\n\r\n")
+        self._file.flush()
+
+    def load(self) -> Dict[str, Tuple[int, "_Headers", bytes]]:
+        """Alle Antworten nach URL: (Status, Header, Body)"""
+        responses = {}
+        with open(self.path, "rb") as f:
+            while True:
+                line = f.readline()
+                if not line:
+                    break
+                if not line.startswith(b"WARC/"):
+                    continue
+                fields = {}
+                for line in iter(f.readline, b"\r\n"):
+                    if not line:
+                        break
+                    key, _, value = line.decode("utf-8").partition(":")
+                    fields[key.strip().lower()] = value.strip()
+                block = f.read(int(fields.get("content-length", 0)))
+                if fields.get("warc-type") != "response":
+                    continue
+                head, _, body = block.partition(b"\r\n\r\n")
+                status_line, *header_lines = head.decode("utf-8").split("\r\n")
+                headers = _Headers()
+                for header in header_lines:
+                    key, _, value = header.partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                responses[fields["warc-target-uri"]] = (int(status_line.split()[1]), headers, body)
+        return responses
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+class _Headers(dict):
+    """Header mit kleingeschriebenen Schlüsseln; get() ignoriert Groß-/Kleinschreibung wie aiohttp"""
+
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+def _charset(content_type: Optional[str]) -> Optional[str]:
+    for param in (content_type or "").split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset":
+            return value.strip('"') or None
+    return None
+
+
+class _RecordingContent:
+    def __init__(self, recorder: "_RecordingResponse"):
+        self._recorder = recorder
+
+    async def iter_chunked(self, size: int):
+        async for chunk in self._recorder._response.content.iter_chunked(size):
+            self._recorder.parts.append(chunk)
+            yield chunk
+
+
+class _RecordingResponse:
+    """Reicht die Antwort durch und merkt sich dabei jeden gelesenen Teil des Bodys"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status
+        self.headers = response.headers
+        self.charset = response.charset
+        self.content = _RecordingContent(self)
+        self.parts: List[bytes] = []
+
+    async def text(self) -> str:
+        text = await self._response.text()
+        # Als UTF-8 ablegen, die Kodierung im Archiv-Header wird entsprechend gesetzt
+        self.charset = "utf-8"
+        self.parts.append(text.encode("utf-8"))
+        return text
+
+    def close(self):
+        self._response.close()
+
+    def archived_headers(self) -> Dict[str, str]:
+        headers = {key: value for key, value in self.headers.items() if key.lower() != "content-type"}
+        headers["Content-Type"] = f"text/html; charset={self.charset or 'utf-8'}"
+        return headers
+
+
+class RecordingTransport:
+    """Reicht alle Abrufe an einen anderen Transport durch und schreibt jede Antwort ins Archiv
+
+    Bei gestreamten Artikeln landet nur der gelesene Teil im Archiv; er
+    enthält alles, was der Scanner beim Abspielen braucht.
+    """
+
+    def __init__(self, inner, archive_path: str):
+        self.inner = inner
+        self.archive = WarcArchive(archive_path)
+        self.throttle = inner.throttle
+
+    @property
+    def errors(self):
+        return self.inner.errors
+
+    async def open(self):
+        await self.inner.open()
+
+    @asynccontextmanager
+    async def get(self, url: str, headers=None):
+        async with self.inner.get(url, headers=headers) as response:
+            recorder = _RecordingResponse(response)
+            yield recorder
+        self.archive.write(url, recorder.status, recorder.archived_headers(), b"".join(recorder.parts))
+
+    async def close(self):
+        await self.inner.close()
+        self.archive.close()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class _ReplayContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+
+class _ReplayResponse:
+    def __init__(self, status: int, headers: "_Headers", body: bytes):
+        self.status = status
+        self.headers = headers
+        self.charset = _charset(headers.get("content-type"))
+        self.content = _ReplayContent(body)
+        self._body = body
+
+    async def text(self) -> str:
+        return self._body.decode(self.charset or "utf-8", errors="replace")
+
+    def close(self):
+        pass
+
+
+class ReplayTransport:
+    """Spielt ein aufgezeichnetes Archiv ab: kein Netzwerk, kein Rate-Limit, keine Wartezeiten
+
+    Nicht aufgezeichnete URLs antworten mit 404, damit der Scraper sie wie
+    fehlende Seiten behandelt und nicht wiederholt.
+    """
+
+    errors = ()
+    throttle = False
+
+    def __init__(self, archive_path: str):
+        self.archive = WarcArchive(archive_path)
+        self.responses: Optional[Dict[str, Tuple[int, _Headers, bytes]]] = None
+
+    async def open(self):
+        if self.responses is None:
+            self.responses = self.archive.load()
+
+    @asynccontextmanager
+    async def get(self, url: str, headers=None):
+        status, response_headers, body = self.responses.get(url, (404, _Headers(), b""))
+        yield _ReplayResponse(status, response_headers, body)
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
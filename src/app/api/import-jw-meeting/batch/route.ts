@@ -0,0 +1,138 @@
+import { NextResponse } from 'next/server'
+import { getPayload, type Where } from 'payload'
+import configPromise from '@payload-config'
+import type { Week } from '@/payload-types'
+import { getJWScraperWorker } from '@/utilities/jwScraperWorker'
+import { getISOYearWeek, getISOYearWeeksBetween, shiftDays } from '@/utilities/jwWeekImport'
+import { WeekIngestPipeline } from '@/utilities/jwWeekIngest'
+
+// Parallele Updates pro Block; der Worker darf doppelt so viele Wochen vorauslaufen
+const BATCH_SIZE = 8
+
+/**
+ * Importiert mehrere Wochen auf einmal: {"ids": ["..."]} oder {"from": "2025-03-03", "to": "2025-08-25"}.
+ * Mit {"create": true} werden im Zeitraum fehlende Wochen angelegt, mit {"byIssue": true}
+ * lädt der Scraper die Wochen ausgabeweise (Arbeitsheft, Wachtturm) statt einzeln.
+ *
+ * Alle Wochen gehen in einer einzigen Anfrage an den Scraper-Worker; jede fertige
+ * Woche wird sofort über die Local API gespeichert, unveränderte Wochen (gleicher
+ * Fingerabdruck) werden übersprungen. Kommt die Datenbank nicht hinterher, wartet
+ * der Worker mit weiteren Abrufen.
+ */
+export async function POST(request: Request) {
+  const payload = await getPayload({ config: configPromise })
+
+  const { user } = await payload.auth({ headers: request.headers })
+  if (!user) {
+    return NextResponse.json({ success: false, error: 'Nicht angemeldet' }, { status: 401 })
+  }
+
+  let body
+  try {
+    body = await request.json()
+  } catch {
+    return NextResponse.json({ success: false, error: 'Ungültiger JSON-Body' }, { status: 400 })
+  }
+
+  const { ids, from, to, lang, create, byIssue } = body ?? {}
+  const createMissing = Boolean(create) && !(Array.isArray(ids) && ids.length > 0)
+  let where: Where
+  // Wochen des Zeitraums (YYYY/WW); Dokumente werden über die ISO-Woche zugeordnet
+  let rangeWeeks: Set<string> | null = null
+  if (Array.isArray(ids) && ids.length > 0) {
+    where = { id: { in: ids } }
+  } else if (from && to) {
+    if (Number.isNaN(Date.parse(from)) || Number.isNaN(Date.parse(to))) {
+      return NextResponse.json(
+        { success: false, error: 'Ungültiges Datum in "from" oder "to"' },
+        { status: 400 },
+      )
+    }
+    rangeWeeks = new Set(getISOYearWeeksBetween(from, to))
+    // weekStartDate ist ein Zeitstempel (lokale Mitternacht, z. B. 23:00 UTC am Vortag, oder
+    // 12:00 UTC): an beiden Enden einen Tag Spielraum, Nachbarwochen fallen unten wieder heraus
+    where = {
+      and: [
+        { weekStartDate: { greater_than_equal: shiftDays(from, -1) } },
+        { weekStartDate: { less_than_equal: shiftDays(to, 1) } },
+      ],
+    }
+  } else {
+    return NextResponse.json(
+      { success: false, error: 'Erwartet "ids" oder "from" und "to"' },
+      { status: 400 },
+    )
+  }
+
+  try {
+    const { docs } = await payload.find({
+      collection: 'weeks',
+      where,
+      depth: 0,
+      pagination: false,
+      sort: 'weekStartDate',
+      user,
+      overrideAccess: false,
+    })
+
+    // Mehrere Dokumente können auf dieselbe Woche fallen; gescrapt wird jede Woche nur einmal
+    const docsByYearWeek = new Map<string, Week[]>()
+    const skipped: string[] = []
+    for (const doc of docs) {
+      if (!doc.weekStartDate) {
+        skipped.push(doc.id)
+        continue
+      }
+      const yearWeek = getISOYearWeek(doc.weekStartDate)
+      if (rangeWeeks && !rangeWeeks.has(yearWeek)) continue
+      docsByYearWeek.set(yearWeek, [...(docsByYearWeek.get(yearWeek) ?? []), doc])
+    }
+
+    // Fingerabdruck nur mitschicken, wenn alle Dokumente der Woche auf demselben Stand sind
+    const known: Record<string, string> = {}
+    for (const [yearWeek, weekDocs] of docsByYearWeek) {
+      const fingerprint = weekDocs[0]?.jwFingerprint
+      if (fingerprint && weekDocs.every((doc) => doc.jwFingerprint === fingerprint)) {
+        known[yearWeek] = fingerprint
+      }
+    }
+
+    // Fehlende Wochen des Zeitraums werden mitgescrapt und angelegt
+    const yearWeeks = new Set(docsByYearWeek.keys())
+    if (createMissing && rangeWeeks) {
+      for (const yearWeek of rangeWeeks) {
+        yearWeeks.add(yearWeek)
+      }
+    }
+
+    const pipeline = new WeekIngestPipeline(payload, user, docsByYearWeek, {
+      batchSize: BATCH_SIZE,
+      create: createMissing,
+    })
+
+    console.log(`Batch-Import von ${yearWeeks.size} Wochen über Scraper-Worker`)
+    await getJWScraperWorker().scrapeWeeks([...yearWeeks].sort(), (week) => pipeline.push(week), {
+      lang,
+      known,
+      window: BATCH_SIZE * 2,
+      byIssue: Boolean(byIssue),
+    })
+
+    const { updated, created, unchanged, failed } = pipeline.result
+    return NextResponse.json({
+      success: failed.length === 0,
+      weeks: yearWeeks.size,
+      updated,
+      created,
+      unchanged,
+      skipped,
+      failed,
+    })
+  } catch (error) {
+    console.error('Fehler beim Batch-Import der JW-Meeting-Daten:', error)
+    return NextResponse.json(
+      { success: false, error: error.message || 'Unbekannter Fehler beim Import' },
+      { status: 500 },
+    )
+  }
+}
@@ -0,0 +1,28 @@
+import { NextResponse } from 'next/server'
+import { getJWScraperWorker } from '@/utilities/jwScraperWorker'
+
+/**
+ * Metriken des Scraper-Workers im Prometheus-Textformat (oder als JSON mit ?format=json)
+ */
+export async function GET(request: Request) {
+  const url = new URL(request.url)
+  const format = url.searchParams.get('format') === 'json' ? 'json' : 'prometheus'
+
+  try {
+    const metrics = await getJWScraperWorker().metrics(format)
+
+    if (format === 'json') {
+      return NextResponse.json(metrics)
+    }
+
+    return new Response(metrics, {
+      headers: { 'Content-Type': 'text/plain; version=0.0.4; charset=utf-8' },
+    })
+  } catch (error) {
+    console.error('Fehler beim Abrufen der Scraper-Metriken:', error)
+    return NextResponse.json(
+      { success: false, error: error.message || 'Unbekannter Fehler' },
+      { status: 500 },
+    )
+  }
+}
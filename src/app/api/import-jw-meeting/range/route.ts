@@ -0,0 +1,95 @@
+import { NextResponse } from 'next/server'
+import { getJWScraperWorker } from '@/utilities/jwScraperWorker'
+
+const YEAR_WEEK_PATTERN = /^\d{4}\/\d{1,2}$/
+// Gepufferte Wochen (Zeilen) und zugleich unbestätigte Wochen im Worker
+const RANGE_WINDOW = 2
+
+/**
+ * Importiert einen Wochenbereich und streamt jede Woche als NDJSON-Zeile,
+ * sobald sie geparst ist: {"yearWeek": "2025/10", "fingerprint": "...", "midweekMeeting": {...}, "weekendMeeting": {...}}
+ *
+ * Der Worker lädt nur so weit voraus, wie der Client liest; trennt sich der Client,
+ * wird der Auftrag im Worker abgebrochen.
+ */
+export async function GET(request: Request) {
+  // URL-Parameter auslesen
+  const url = new URL(request.url)
+  const from = url.searchParams.get('from')
+  const to = url.searchParams.get('to')
+  const lang = url.searchParams.get('lang') || undefined
+
+  if (!from || !to || !YEAR_WEEK_PATTERN.test(from) || !YEAR_WEEK_PATTERN.test(to)) {
+    return NextResponse.json(
+      { success: false, error: 'Ungültiges Format für from/to (erwartet YYYY/WW)' },
+      { status: 400 },
+    )
+  }
+
+  const encoder = new TextEncoder()
+  // Wartet auf `pull`, solange der Puffer des Streams voll ist
+  let resume: (() => void) | null = null
+  const wakeUp = () => {
+    resume?.()
+    resume = null
+  }
+  // Client getrennt oder Stream abgebrochen: der Worker beendet den Auftrag
+  const abort = new AbortController()
+  abort.signal.addEventListener('abort', wakeUp, { once: true })
+  request.signal.addEventListener('abort', () => abort.abort(), { once: true })
+
+  const stream = new ReadableStream<Uint8Array>(
+    {
+      start(controller) {
+        // Nicht abwarten: `pull` wird erst nach dem Ende von `start` aufgerufen
+        getJWScraperWorker()
+          .scrapeRange(
+            from,
+            to,
+            async (week) => {
+              if (abort.signal.aborted) return
+              controller.enqueue(encoder.encode(JSON.stringify(week) + '\n'))
+              // Gegendruck: erst bestätigen (und damit die nächste Woche freigeben),
+              // wenn der Client gelesen hat
+              while ((controller.desiredSize ?? 0) <= 0 && !abort.signal.aborted) {
+                await new Promise<void>((resolve) => {
+                  resume = resolve
+                })
+              }
+            },
+            { lang, window: RANGE_WINDOW, signal: abort.signal },
+          )
+          .then(
+            () => {
+              if (!abort.signal.aborted) controller.close()
+            },
+            (error) => {
+              if (abort.signal.aborted) return
+              console.error('Fehler beim Importieren des Wochenbereichs:', error)
+              // Abschlusszeile mit Fehler, damit der Client einen Abbruch erkennt
+              controller.enqueue(
+                encoder.encode(
+                  JSON.stringify({ error: error.message || 'Unbekannter Fehler beim Import' }) + '\n',
+                ),
+              )
+              controller.close()
+            },
+          )
+      },
+      pull() {
+        wakeUp()
+      },
+      cancel() {
+        abort.abort()
+      },
+    },
+    { highWaterMark: RANGE_WINDOW },
+  )
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'application/x-ndjson; charset=utf-8',
+      'Cache-Control': 'no-store',
+    },
+  })
+}
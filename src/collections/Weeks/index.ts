@@ -22,6 +22,10 @@ export const Weeks: CollectionConfig = {
     ],
     useAsTitle: 'weekStartDate',
     group: 'JW Manager',
+    components: {
+      // Sammelimport der markierten Wochen oder eines Zeitraums
+      beforeListTable: ['@/components/ui/BatchImportWeeks'],
+    },
     preview: (doc) => {
       if (doc?.weekStartDate) {
         return `/weeks/${doc.weekStartDate}`
@@ -264,6 +268,15 @@ export const Weeks: CollectionConfig = {
         hidden: true, // Verstecke das eigentliche Feld, zeige nur den Button
       },
     },
+    {
+      name: 'jwFingerprint',
+      type: 'text',
+      admin: {
+        readOnly: true,
+        position: 'sidebar',
+        description: 'Fingerprint of the last imported JW content (unchanged weeks are skipped)',
+      },
+    },
     {
       name: 'midweekMeeting',
       label: 'Midweek Meeting (Life and Ministry)',
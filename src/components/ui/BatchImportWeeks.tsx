@@ -0,0 +1,147 @@
+'use client'
+
+import React, { useState } from 'react'
+import { Button } from '@/components/ui/button'
+import { useSelection } from '@payloadcms/ui'
+
+/**
+ * Sammelimport über der Wochenliste: importiert die markierten Wochen oder alle
+ * Wochen in einem Datumsbereich mit einem einzigen Aufruf der Batch-API
+ */
+const BatchImportWeeks = () => {
+  const { selected } = useSelection()
+  const [from, setFrom] = useState('')
+  const [to, setTo] = useState('')
+  const [create, setCreate] = useState(false)
+  const [loading, setLoading] = useState(false)
+  const [error, setError] = useState(null)
+  const [success, setSuccess] = useState(null)
+
+  const selectedIds = [...selected.entries()].filter(([, isSelected]) => isSelected).map(([id]) => id)
+
+  const handleImport = async () => {
+    const body = selectedIds.length > 0 ? { ids: selectedIds } : { from, to, create }
+    if (selectedIds.length === 0 && (!from || !to)) {
+      setError('Bitte Wochen markieren oder einen Zeitraum angeben.')
+      return
+    }
+
+    setLoading(true)
+    setError(null)
+    setSuccess(null)
+
+    try {
+      const response = await fetch('/api/import-jw-meeting/batch', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        credentials: 'include',
+        body: JSON.stringify(body),
+      })
+
+      const result = await response.json()
+      if (!response.ok || !result.success) {
+        const failed = result.failed?.length ? ` (${result.failed.length} fehlgeschlagen)` : ''
+        throw new Error((result.error || 'Fehler beim Sammelimport') + failed)
+      }
+
+      setSuccess(
+        `${result.weeks} Wochen abgefragt: ${result.updated.length} aktualisiert, ` +
+          `${result.created.length} angelegt, ${result.unchanged.length} unverändert, ` +
+          `${result.skipped.length} ohne Startdatum.`,
+      )
+
+      if (result.updated.length > 0 || result.created.length > 0) {
+        // Liste nach 2 Sekunden neu laden, um Änderungen anzuzeigen
+        setTimeout(() => {
+          window.location.reload()
+        }, 2000)
+      }
+    } catch (err) {
+      setError(err?.message || 'Unbekannter Fehler')
+      console.error('Sammelimport-Fehler:', err)
+    } finally {
+      setLoading(false)
+    }
+  }
+
+  return (
+    <div style={{ marginBottom: '20px' }}>
+      <div style={{ display: 'flex', gap: '0.5rem', alignItems: 'center', flexWrap: 'wrap' }}>
+        <label>
+          Von{' '}
+          <input
+            type="date"
+            value={from}
+            disabled={selectedIds.length > 0}
+            onChange={(event) => setFrom(event.target.value)}
+          />
+        </label>
+        <label>
+          Bis{' '}
+          <input
+            type="date"
+            value={to}
+            disabled={selectedIds.length > 0}
+            onChange={(event) => setTo(event.target.value)}
+          />
+        </label>
+        <label>
+          <input
+            type="checkbox"
+            checked={create}
+            disabled={selectedIds.length > 0}
+            onChange={(event) => setCreate(event.target.checked)}
+          />{' '}
+          Fehlende Wochen anlegen
+        </label>
+        <Button
+          onClick={handleImport}
+          disabled={loading}
+          style={{
+            backgroundColor: '#2563EB',
+            color: 'white',
+            padding: '10px 16px',
+          }}
+        >
+          {loading
+            ? 'Importiere...'
+            : selectedIds.length > 0
+              ? `📥 ${selectedIds.length} markierte Wochen importieren`
+              : '📥 Zeitraum importieren'}
+        </Button>
+      </div>
+
+      {error && (
+        <div
+          style={{
+            padding: '0.5rem',
+            backgroundColor: '#FECACA',
+            color: '#991B1B',
+            borderRadius: '0.25rem',
+            marginTop: '0.5rem',
+          }}
+        >
+          {error}
+        </div>
+      )}
+
+      {success && (
+        <div
+          style={{
+            padding: '0.5rem',
+            backgroundColor: '#D1FAE5',
+            color: '#065F46',
+            borderRadius: '0.25rem',
+            marginTop: '0.5rem',
+          }}
+        >
+          {success}
+        </div>
+      )}
+    </div>
+  )
+}
+
+export default BatchImportWeeks
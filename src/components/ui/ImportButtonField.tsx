@@ -3,6 +3,7 @@
 import React, { useState, useEffect } from 'react'
 import { Button } from '@/components/ui/button'
 import { useDocumentInfo } from '@payloadcms/ui'
+import { getISOYearWeek } from '@/utilities/jwWeekImport'
 
 const ImportButtonField = ({ path }) => {
   const [loading, setLoading] = useState(false)
@@ -58,31 +59,27 @@ const ImportButtonField = ({ path }) => {
     setDebugInfo(null)
 
     try {
-      // Berechne Jahr/Woche
-      const date = new Date(apiResponse.weekStartDate)
-      const year = date.getFullYear()
-      const onejan = new Date(year, 0, 1)
-      const weekNum = Math.ceil(
-        ((date.getTime() - onejan.getTime()) / 86400000 + onejan.getDay() + 1) / 7,
-      )
-      const yearWeek = `${year}/${String(weekNum).padStart(2, '0')}`
-
+      // Jahr/Woche wie auf dem Server berechnen (ISO-Woche)
       const debugData = {
         startDate: apiResponse.weekStartDate,
-        parsedDate: date.toISOString(),
-        year,
-        weekNum,
-        yearWeek,
+        yearWeek: getISOYearWeek(apiResponse.weekStartDate),
       }
 
       setDebugInfo('Import-Parameter: ' + JSON.stringify(debugData, null, 2))
 
-      // Importiere die Daten mit verbesserter Fehlerbehandlung
+      // Scrapen und Speichern erledigt der Server über die Local API, ohne PATCH aus dem Browser
       let importResponse
       try {
-        importResponse = await fetch(`/api/import-jw-meeting?yearWeek=${yearWeek}`)
+        importResponse = await fetch('/api/import-jw-meeting/batch', {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          credentials: 'include',
+          body: JSON.stringify({ ids: [id] }),
+        })
 
-        if (!importResponse.ok) {
+        if (!importResponse.ok && importResponse.status !== 500) {
           const errorText = await importResponse.text()
           throw new Error(`API-Fehler (${importResponse.status}): ${errorText}`)
         }
@@ -98,82 +95,33 @@ const ImportButtonField = ({ path }) => {
       }
 
       if (!importData.success) {
-        throw new Error(importData.error || 'Unbekannter Fehler beim Import')
+        throw new Error(
+          importData.error || importData.failed?.[0]?.error || 'Unbekannter Fehler beim Import',
+        )
       }
 
-      // Nach dem JSON-Parse von importData:
-      if (importData?.weekData) {
-        // Stelle sicher, dass wir die Struktur genau nach der Collection-Definition aufbauen
-        const updateData = {
-          // Wir brauchen nur die Daten, die wir ändern wollen
-          midweekMeeting: {
-            // Wichtig: Wir lassen meetingDay weg - wird durch Hook gesetzt
-            openingSong: importData.weekData.midweekMeeting?.openingSong || 1,
-            treasuresFromGodsWord: {
-              talkTitle: importData.weekData.midweekMeeting?.treasuresFromGodsWord?.talkTitle || '',
-              talkDuration:
-                importData.weekData.midweekMeeting?.treasuresFromGodsWord?.talkDuration || 10,
-              spiritualGemsDuration:
-                importData.weekData.midweekMeeting?.treasuresFromGodsWord?.spiritualGemsDuration ||
-                10,
-              bibleReadingScripture:
-                importData.weekData.midweekMeeting?.treasuresFromGodsWord?.bibleReadingScripture ||
-                '',
-              bibleReadingLesson:
-                importData.weekData.midweekMeeting?.treasuresFromGodsWord?.bibleReadingLesson || '',
-              bibleReadingDuration:
-                importData.weekData.midweekMeeting?.treasuresFromGodsWord?.bibleReadingDuration ||
-                4,
-            },
-            applyYourselfToFieldMinistry: {
-              fieldMinistryAssignments:
-                importData.weekData.midweekMeeting?.applyYourselfToFieldMinistry
-                  ?.fieldMinistryAssignments || [],
-            },
-            livingAsChristians: {
-              livingAsChristiansSong:
-                importData.weekData.midweekMeeting?.livingAsChristians?.livingAsChristiansSong || 1,
-              assignments:
-                importData.weekData.midweekMeeting?.livingAsChristians?.assignments || [],
-            },
-            closingSong: importData.weekData.midweekMeeting?.closingSong || 1,
-          },
-          weekendMeeting: {
-            // Wichtig: Wir lassen meetingDay weg - wird durch Hook gesetzt
-            openingSong: importData.weekData.weekendMeeting?.openingSong || 1,
-            publicTalk: {
-              title: importData.weekData.weekendMeeting?.publicTalkTitle || '',
-            },
-            middleSong: importData.weekData.weekendMeeting?.middleSong || 1,
-            watchtowerStudy: {
-              title: importData.weekData.weekendMeeting?.watchtowerStudyTitle || '',
-            },
-            closingSong: importData.weekData.weekendMeeting?.closingSong || 1,
-          },
-        }
-
-        console.log('Aktualisierte Daten für PATCH:', JSON.stringify(updateData))
-
-        // Aktualisiere die Woche
-        const updateResponse = await fetch(`/api/weeks/${id}`, {
-          method: 'PATCH',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          credentials: 'include',
-          body: JSON.stringify(updateData),
-        })
-
-        if (!updateResponse.ok) {
-          throw new Error(`Fehler beim Aktualisieren der Woche: ${updateResponse.statusText}`)
-        }
+      if (importData.unchanged?.length > 0) {
+        setSuccess('Keine Änderungen seit dem letzten Import.')
+        return
+      }
 
+      if (importData.updated?.length > 0 || importData.created?.length > 0) {
         setSuccess('JW-Daten erfolgreich importiert!')
 
         // Seite nach 2 Sekunden neu laden, um Änderungen anzuzeigen
         setTimeout(() => {
           window.location.reload()
         }, 2000)
+        return
+      }
+
+      // Nichts gespeichert: Dokument übersprungen oder der Scraper hat keine Woche geliefert (z. B. 404)
+      if (importData.skipped?.length > 0) {
+        setError('Dokument wurde übersprungen: kein gespeichertes Startdatum.')
+      } else {
+        setError(
+          importData.failed?.[0]?.error || `Keine Daten für Woche ${debugData.yearWeek} gefunden.`,
+        )
       }
     } catch (err) {
       setError(err?.message || 'Unbekannter Fehler')
@@ -803,6 +803,10 @@ export interface Week {
    * Select the Monday that starts this week
    */
   weekStartDate?: string | null;
+  /**
+   * Fingerprint of the last imported JW content (unchanged weeks are skipped)
+   */
+  jwFingerprint?: string | null;
   midweekMeeting?: {
     /**
      * Automatically calculated based on congregation settings
@@ -1702,6 +1706,7 @@ export interface GroupsSelect<T extends boolean = true> {
 export interface WeeksSelect<T extends boolean = true> {
   showDateTimeFields?: T;
   weekStartDate?: T;
+  jwFingerprint?: T;
   midweekMeeting?:
     | T
     | {
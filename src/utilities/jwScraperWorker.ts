@@ -0,0 +1,427 @@
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process'
+import fs from 'fs'
+import path from 'path'
+import readline from 'readline'
+import { WeekResultCache, type CachedWeek, type WeekFlight } from '@/utilities/jwWeekCache'
+
+type OnWeek = (week: any) => void | Promise<void>
+
+type PendingRequest = {
+  resolve: (message: any) => void
+  reject: (error: Error) => void
+  onWeek?: OnWeek
+  timer: NodeJS.Timeout
+  /** Mit Flusskontrolle: Anzahl der verarbeiteten Wochen, die dem Worker bestätigt werden */
+  window?: number
+  acked: number
+  handling: Promise<void>[]
+}
+
+export type RangeOptions = {
+  lang?: string
+  known?: Record<string, string>
+  /**
+   * Höchstens so viele Wochen unbestätigt unterwegs: der Worker wartet mit weiteren
+   * Abrufen, bis `onWeek` (auch asynchron) fertig ist
+   */
+  window?: number
+  /**
+   * Wochen aus den Inhaltsverzeichnissen von Arbeitsheft und Wachtturm laden: die Ausgaben
+   * werden einmal für alle Wochen abgerufen, Wochenübersicht und Inhaltsverzeichnis-Link entfallen
+   */
+  byIssue?: boolean
+  /** Bricht den Auftrag ab (z. B. `request.signal`): der Worker beendet seine Abrufe */
+  signal?: AbortSignal
+}
+
+export type WeekResult = {
+  /** Fehlt, wenn die Woche seit `since` unverändert ist */
+  weekData?: any
+  fingerprint: string
+  unchanged: boolean
+  /** Aus dem Zwischenspeicher oder von einer gleichzeitigen Anfrage derselben Woche */
+  cached?: boolean
+}
+
+const REQUEST_TIMEOUT_MS = 5 * 60 * 1000
+
+const cacheKey = (yearWeek: string, lang?: string) => `${lang || 'de'}:${yearWeek}`
+
+/** Wochenzeile des Workers -> Eintrag im Zwischenspeicher */
+const fromRecord = (record: any): CachedWeek => {
+  const { yearWeek, fingerprint, defaults, ...weekData } = record
+  return { yearWeek, fingerprint, weekData, defaults: Boolean(defaults) }
+}
+
+/** Eintrag -> Wochenzeile wie vom Worker, mit `known` als unverändert markiert */
+const toRecord = (week: CachedWeek, known?: Record<string, string>) => {
+  const { yearWeek, fingerprint } = week
+  if (known?.[yearWeek] === fingerprint) {
+    return { yearWeek, fingerprint, unchanged: true }
+  }
+  return { yearWeek, fingerprint, ...week.weekData, ...(week.defaults ? { defaults: true } : {}) }
+}
+
+/**
+ * Gibt eine stderr-Zeile des Workers mit ihrer Stufe aus; Zeilen, die keine
+ * Log-Meldung sind (z. B. ein Traceback beim Absturz), gelten als Fehler
+ */
+const logWorkerLine = (line: string) => {
+  let entry: { level?: string; msg?: string; exc?: string }
+  try {
+    entry = JSON.parse(line)
+  } catch {
+    console.error('Scraper-Worker:', line)
+    return
+  }
+
+  const message = entry?.msg ?? line
+  const details = entry?.exc ? [message, entry.exc] : [message]
+  if (entry?.level === 'error') {
+    console.error('Scraper-Worker:', ...details)
+  } else if (entry?.level === 'warning') {
+    console.warn('Scraper-Worker:', ...details)
+  } else if (entry?.level === 'debug') {
+    console.debug('Scraper-Worker:', ...details)
+  } else {
+    console.log('Scraper-Worker:', ...details)
+  }
+}
+
+/**
+ * Hält einen langlebigen `jw_scraper.py --serve` Prozess und schickt ihm Anfragen
+ * als JSON-Lines. Interpreterstart, Imports und HTTP-Session werden so nur einmal bezahlt.
+ */
+class JWScraperWorker {
+  private child: ChildProcessWithoutNullStreams | null = null
+  private ready: Promise<void> | null = null
+  private pending = new Map<number, PendingRequest>()
+  private nextId = 1
+  // Einzelwochen und Wochenlisten teilen sich laufende Abrufe und fertige Ergebnisse
+  private weeks = new WeekResultCache()
+
+  constructor(private scriptPath: string) {}
+
+  private start(): Promise<void> {
+    if (this.ready) return this.ready
+
+    // Einmal pro Start statt bei jeder Anfrage prüfen
+    if (!fs.existsSync(this.scriptPath)) {
+      return Promise.reject(new Error(`Python-Skript nicht gefunden: ${this.scriptPath}`))
+    }
+
+    // Meldungen als JSON-Lines auf stderr, damit sie mit ihrer Stufe weitergegeben werden können
+    const args = [this.scriptPath, '--serve', '--format', 'json']
+    if (process.env.JW_SCRAPER_LOG_LEVEL) {
+      args.push('--log-level', process.env.JW_SCRAPER_LOG_LEVEL)
+    }
+    const child = spawn('python3', args, { cwd: process.cwd() })
+    this.child = child
+
+    this.ready = new Promise((resolve, reject) => {
+      const lines = readline.createInterface({ input: child.stdout })
+
+      lines.on('line', (line) => {
+        let message: any
+        try {
+          message = JSON.parse(line)
+        } catch {
+          console.error('Ungültige Worker-Ausgabe:', line)
+          return
+        }
+
+        if (message.ready) {
+          resolve()
+          return
+        }
+
+        const request = this.pending.get(message.id)
+        if (!request) return
+
+        // Bereichsanfragen liefern vor dem Abschluss eine Zeile pro Woche
+        if (message.week) {
+          request.timer.refresh()
+          this.handleWeek(message.id, request, message.week)
+          return
+        }
+
+        this.pending.delete(message.id)
+        clearTimeout(request.timer)
+
+        // Abschluss erst melden, wenn alle Wochen verarbeitet sind
+        Promise.all(request.handling).then(() => {
+          if (message.success) {
+            request.resolve(message)
+          } else {
+            request.reject(new Error(message.error || 'Unbekannter Fehler im Scraper-Worker'))
+          }
+        })
+      })
+
+      // Zeilenweise lesen: ein Chunk kann mitten in einer Meldung enden
+      readline.createInterface({ input: child.stderr }).on('line', (line) => logWorkerLine(line))
+
+      child.on('error', (error) => {
+        reject(error)
+        this.reset(child, error)
+      })
+
+      // Schreibfehler (z. B. EPIPE, wenn der Prozess gerade abstürzt) wären sonst unbehandelt
+      child.stdin.on('error', (error) => {
+        reject(error)
+        this.reset(child, error)
+        // Ohne funktionierende Eingabe ist der Prozess nicht mehr ansprechbar
+        child.kill()
+      })
+
+      child.on('exit', (code) => {
+        const error = new Error(`Scraper-Worker beendet (Exit-Code ${code})`)
+        reject(error)
+        this.reset(child, error)
+      })
+    })
+
+    return this.ready
+  }
+
+  private handleWeek(id: number, request: PendingRequest, week: any) {
+    const handled = Promise.resolve()
+      .then(() => request.onWeek?.(week))
+      .catch((error) => {
+        console.error(`Fehler beim Verarbeiten der Woche ${week.yearWeek}:`, error)
+      })
+      .then(() => {
+        if (request.window) {
+          // Verarbeitete Woche bestätigen, damit der Worker die nächste freigibt
+          request.acked += 1
+          this.child?.stdin.write(JSON.stringify({ id, ack: request.acked }) + '\n')
+        }
+      })
+    request.handling.push(handled)
+  }
+
+  private reset(child: ChildProcessWithoutNullStreams, error: Error) {
+    // Späte Ereignisse eines bereits ersetzten Prozesses betreffen den neuen nicht
+    if (this.child !== child) return
+    this.child = null
+    this.ready = null
+
+    for (const request of this.pending.values()) {
+      clearTimeout(request.timer)
+      request.reject(error)
+    }
+    this.pending.clear()
+  }
+
+  private async send(
+    payload: Record<string, unknown>,
+    label: string,
+    onWeek?: OnWeek,
+    signal?: AbortSignal,
+  ): Promise<any> {
+    signal?.throwIfAborted()
+    await this.start()
+
+    const child = this.child
+    if (!child) {
+      throw new Error('Scraper-Worker ist nicht verfügbar')
+    }
+
+    const id = this.nextId++
+
+    return new Promise((resolve, reject) => {
+      // Auftrag im Worker beenden; spätere Zeilen mit dieser id werden ignoriert
+      const cancel = (error: Error) => {
+        if (!this.pending.has(id)) return
+        this.pending.delete(id)
+        clearTimeout(timer)
+        signal?.removeEventListener('abort', onAbort)
+        this.child?.stdin.write(JSON.stringify({ id, cancel: true }) + '\n')
+        reject(error)
+      }
+      const onAbort = () => cancel(new Error(`Import von ${label} abgebrochen`))
+
+      const timer = setTimeout(
+        () => cancel(new Error(`Zeitüberschreitung beim Import von ${label}`)),
+        REQUEST_TIMEOUT_MS,
+      )
+      signal?.addEventListener('abort', onAbort, { once: true })
+
+      const window = typeof payload.window === 'number' ? payload.window : undefined
+      this.pending.set(id, {
+        resolve: (message) => {
+          signal?.removeEventListener('abort', onAbort)
+          resolve(message)
+        },
+        reject: (error) => {
+          signal?.removeEventListener('abort', onAbort)
+          reject(error)
+        },
+        onWeek,
+        timer,
+        window,
+        acked: 0,
+        handling: [],
+      })
+      child.stdin.write(JSON.stringify({ id, ...payload }) + '\n')
+    })
+  }
+
+  /**
+   * Scrapt eine Woche; `lang` wählt die Sprache der Zusammenkunftsseiten (Standard: de).
+   * Stimmt `since` mit dem aktuellen Fingerabdruck überein, kommt nur `unchanged: true` zurück.
+   *
+   * Lädt eine andere Anfrage dieselbe Woche gerade, wird deren Ergebnis mitbenutzt;
+   * kürzlich geladene Wochen kommen aus dem Zwischenspeicher.
+   */
+  async scrapeWeek(
+    yearWeek: string,
+    options: { lang?: string; since?: string } = {},
+  ): Promise<WeekResult> {
+    const key = cacheKey(yearWeek, options.lang)
+    let week = this.weeks.get(key)
+    const shared = week ? undefined : this.weeks.pending(key)
+    if (shared) {
+      // Schlägt der mitbenutzte Abruf fehl, wird die Woche selbst geladen
+      week = (await shared.catch(() => null)) ?? undefined
+    }
+    const cached = Boolean(week)
+
+    if (!week) {
+      const flight = this.weeks.begin(key)
+      try {
+        // Ohne `since`, damit der Zwischenspeicher die vollständigen Daten erhält
+        const message = await this.send({ yearWeek, lang: options.lang }, `Woche ${yearWeek}`)
+        week = fromRecord({ yearWeek, fingerprint: message.fingerprint, defaults: message.defaults, ...message.weekData })
+        flight.resolve(week)
+      } catch (error) {
+        flight.reject(error)
+        throw error
+      }
+    }
+
+    if (options.since && options.since === week.fingerprint) {
+      return { fingerprint: week.fingerprint, unchanged: true, cached }
+    }
+    return { weekData: week.weekData, fingerprint: week.fingerprint, unchanged: false, cached }
+  }
+
+  /**
+   * Scrapt einen Wochenbereich; `onWeek` wird für jede fertige Woche in Wochenreihenfolge aufgerufen.
+   * Das Promise erfüllt sich erst, wenn auch alle `onWeek`-Aufrufe abgeschlossen sind.
+   */
+  async scrapeRange(
+    from: string,
+    to: string,
+    onWeek: OnWeek,
+    options: RangeOptions = {},
+  ): Promise<void> {
+    const { signal, ...workerOptions } = options
+    await this.send({ from, to, ...workerOptions }, `Bereich ${from} bis ${to}`, onWeek, signal)
+  }
+
+  /**
+   * Scrapt eine beliebige Liste von Wochen (YYYY/WW) mit einer einzigen Anfrage.
+   *
+   * Wochen aus dem Zwischenspeicher gehen sofort an `onWeek`, Wochen, die eine andere
+   * Anfrage gerade lädt, sobald diese fertig ist; nur die übrigen gehen an den Worker
+   * und kommen in der Reihenfolge der Liste. `known` wird hier verglichen, damit jede
+   * geladene Woche vollständig im Zwischenspeicher landet.
+   */
+  async scrapeWeeks(
+    yearWeeks: string[],
+    onWeek: OnWeek,
+    options: RangeOptions = {},
+  ): Promise<void> {
+    const { known, signal, ...workerOptions } = options
+    const deliver = async (week: CachedWeek) => {
+      try {
+        await onWeek(toRecord(week, known))
+      } catch (error) {
+        console.error(`Fehler beim Verarbeiten der Woche ${week.yearWeek}:`, error)
+      }
+    }
+
+    const handling: Promise<void>[] = []
+    const own = new Map<string, WeekFlight>()
+    // Wochen, deren mitbenutzter Abruf fehlschlug: werden anschließend selbst geladen
+    const retry: string[] = []
+
+    for (const yearWeek of new Set(yearWeeks)) {
+      const key = cacheKey(yearWeek, options.lang)
+      const cached = this.weeks.get(key)
+      if (cached) {
+        handling.push(deliver(cached))
+        continue
+      }
+      const shared = this.weeks.pending(key)
+      if (shared) {
+        handling.push(
+          shared.then(
+            (week) => (week ? deliver(week) : undefined),
+            () => {
+              retry.push(yearWeek)
+            },
+          ),
+        )
+        continue
+      }
+      own.set(yearWeek, this.weeks.begin(key))
+    }
+
+    try {
+      if (own.size > 0) {
+        await this.send(
+          { weeks: [...own.keys()], ...workerOptions },
+          `${own.size} Wochen`,
+          (record) => {
+            const week = fromRecord(record)
+            own.get(week.yearWeek)?.resolve(week)
+            own.delete(week.yearWeek)
+            return deliver(week)
+          },
+          signal,
+        )
+      }
+      // Ohne Zeile vom Worker gibt es die Woche upstream nicht
+      for (const flight of own.values()) flight.resolve(null)
+    } catch (error) {
+      for (const flight of own.values()) flight.reject(error)
+      throw error
+    } finally {
+      await Promise.all(handling)
+    }
+
+    if (retry.length > 0) {
+      await this.scrapeWeeks(retry, onWeek, options)
+    }
+  }
+
+  /**
+   * Aggregierte Scraper-Metriken (Abrufe, Parsing, Cache, Wiederholungen)
+   */
+  async metrics(format: 'prometheus' | 'json' = 'prometheus'): Promise<any> {
+    const message = await this.send({ metrics: format }, 'Metriken')
+    return message.metrics
+  }
+}
+
+const globalForWorker = globalThis as typeof globalThis & {
+  jwScraperWorker?: JWScraperWorker
+}
+
+/**
+ * Liefert den prozessweiten Scraper-Worker (überlebt auch Hot Reloads im Dev-Modus)
+ */
+export const getJWScraperWorker = () => {
+  if (!globalForWorker.jwScraperWorker) {
+    // Optional das vorkompilierte Zipapp aus scripts/jw_bundle.py (schnellerer Kaltstart)
+    const bundle = process.env.JW_SCRAPER_BUNDLE
+    const scriptPath = bundle
+      ? path.resolve(process.cwd(), bundle)
+      : path.resolve(process.cwd(), 'scripts', 'jw_scraper.py')
+    globalForWorker.jwScraperWorker = new JWScraperWorker(scriptPath)
+  }
+
+  return globalForWorker.jwScraperWorker
+}
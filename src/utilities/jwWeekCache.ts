@@ -0,0 +1,91 @@
+/** Eine vom Scraper geladene Woche, wie sie der Zwischenspeicher hält */
+export type CachedWeek = {
+  yearWeek: string
+  fingerprint: string
+  /** { midweekMeeting, weekendMeeting } */
+  weekData: any
+  /** Teile fehlten und wurden durch Standarddaten ersetzt */
+  defaults?: boolean
+}
+
+/** Ein angemeldeter Abruf: `resolve(null)`, wenn der Scraper keine Woche geliefert hat */
+export type WeekFlight = {
+  resolve: (week: CachedWeek | null) => void
+  reject: (error: Error) => void
+}
+
+/**
+ * Kurzlebiger Zwischenspeicher für geladene Wochen, mit Single-Flight.
+ *
+ * Lädt eine Anfrage gerade eine Woche, warten weitere Anfragen für dieselbe Woche
+ * auf diesen Abruf (`pending`), statt den Scraper erneut zu beauftragen. Fertige
+ * Wochen bleiben `ttlMs` lang im Speicher; bei mehr als `maxEntries` Wochen fällt die
+ * am längsten nicht gelesene heraus. Fehler und Wochen mit Standarddaten werden
+ * nicht gespeichert, die nächste Anfrage versucht es erneut.
+ */
+export class WeekResultCache {
+  // Map hält die Einfügereihenfolge: der erste Eintrag ist der am längsten nicht gelesene
+  private entries = new Map<string, { week: CachedWeek; expires: number }>()
+  private inFlight = new Map<string, Promise<CachedWeek | null>>()
+
+  constructor(private options: { ttlMs?: number; maxEntries?: number } = {}) {}
+
+  get ttlMs() {
+    return this.options.ttlMs ?? 5 * 60 * 1000
+  }
+
+  get maxEntries() {
+    return this.options.maxEntries ?? 100
+  }
+
+  get(key: string): CachedWeek | undefined {
+    const entry = this.entries.get(key)
+    if (!entry) return undefined
+
+    this.entries.delete(key)
+    if (entry.expires <= Date.now()) return undefined
+
+    // Ans Ende verschieben: zuletzt gelesen
+    this.entries.set(key, entry)
+    return entry.week
+  }
+
+  /** Laufender Abruf derselben Woche durch eine andere Anfrage */
+  pending(key: string): Promise<CachedWeek | null> | undefined {
+    return this.inFlight.get(key)
+  }
+
+  /** Meldet einen Abruf an; bis er abgeschlossen ist, liefert `pending` sein Ergebnis */
+  begin(key: string): WeekFlight {
+    let flight!: WeekFlight
+    const promise = new Promise<CachedWeek | null>((resolve, reject) => {
+      flight = { resolve, reject }
+    })
+    // Ohne wartende Anfrage darf ein Fehler nicht als unbehandelt gelten
+    promise.catch(() => {})
+    this.inFlight.set(key, promise)
+
+    return {
+      resolve: (week) => {
+        if (this.inFlight.get(key) === promise) this.inFlight.delete(key)
+        if (week) this.set(key, week)
+        flight.resolve(week)
+      },
+      reject: (error) => {
+        if (this.inFlight.get(key) === promise) this.inFlight.delete(key)
+        flight.reject(error)
+      },
+    }
+  }
+
+  private set(key: string, week: CachedWeek) {
+    // Platzhalter und unvollständige Daten nicht aufbewahren
+    if (week.defaults || !week.weekData?.midweekMeeting || !week.weekData?.weekendMeeting) return
+
+    this.entries.delete(key)
+    this.entries.set(key, { week, expires: Date.now() + this.ttlMs })
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value as string)
+    }
+  }
+}
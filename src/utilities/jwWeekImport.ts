@@ -0,0 +1,98 @@
+/**
+ * ISO-Jahr/-Woche (YYYY/WW) für das Startdatum einer Woche.
+ *
+ * weekStartDate ist ein Zeitstempel; je nach Zeitzone des Browsers liegt der
+ * Montag 00:00 in UTC noch am Sonntag. Der Mittag des Tages ist in jeder
+ * Zeitzone derselbe Kalendertag, daher wird ab dort gerechnet.
+ */
+export const getISOYearWeek = (weekStartDate: string): string => {
+  const date = new Date(new Date(weekStartDate).getTime() + 12 * 60 * 60 * 1000)
+  const day = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate()))
+  // Donnerstag derselben Woche bestimmt das ISO-Jahr
+  day.setUTCDate(day.getUTCDate() + 3 - ((day.getUTCDay() + 6) % 7))
+  const year = day.getUTCFullYear()
+  const week = Math.ceil(((day.getTime() - Date.UTC(year, 0, 1)) / 86400000 + 1) / 7)
+  return `${year}/${String(week).padStart(2, '0')}`
+}
+
+/**
+ * Startdatum (Montag, 12:00 UTC) einer ISO-Woche YYYY/WW; der Mittag ist in jeder
+ * Zeitzone derselbe Kalendertag
+ */
+export const getWeekStartDate = (yearWeek: string): string => {
+  const [year = NaN, week = NaN] = yearWeek.split('/').map(Number)
+  if (!Number.isInteger(year) || !Number.isInteger(week)) {
+    throw new Error(`Ungültige Woche: ${yearWeek} (erwartet YYYY/WW)`)
+  }
+  // Der 4. Januar liegt immer in der ersten ISO-Woche
+  const jan4 = new Date(Date.UTC(year, 0, 4, 12))
+  const monday = jan4.getTime() - ((jan4.getUTCDay() + 6) % 7) * 86400000
+  return new Date(monday + (week - 1) * 7 * 86400000).toISOString()
+}
+
+/**
+ * Datum (YYYY-MM-DD oder Zeitstempel) um `days` Tage verschoben, als ISO-Zeitstempel
+ */
+export const shiftDays = (date: string, days: number): string =>
+  new Date(Date.parse(date) + days * 86400000).toISOString()
+
+/**
+ * Alle ISO-Wochen (YYYY/WW), deren Montag zwischen `from` und `to` (YYYY-MM-DD) liegt
+ */
+export const getISOYearWeeksBetween = (from: string, to: string): string[] => {
+  const yearWeeks: string[] = []
+  const last = Date.parse(to)
+  for (let time = Date.parse(from); time <= last; time += 86400000) {
+    if (new Date(time).getUTCDay() === 1) {
+      yearWeeks.push(getISOYearWeek(new Date(time).toISOString()))
+    }
+  }
+  return yearWeeks
+}
+
+/**
+ * Baut aus den Scraper-Daten einer Woche die Felder für das Update des Weeks-Dokuments,
+ * genau nach der Collection-Definition
+ */
+export const toWeekUpdate = (weekData: any, fingerprint?: string) => ({
+  // Wir brauchen nur die Daten, die wir ändern wollen
+  jwFingerprint: fingerprint,
+  midweekMeeting: {
+    // Wichtig: Wir lassen meetingDay weg - wird durch Hook gesetzt
+    openingSong: weekData.midweekMeeting?.openingSong || 1,
+    treasuresFromGodsWord: {
+      talkTitle: weekData.midweekMeeting?.treasuresFromGodsWord?.talkTitle || '',
+      talkDuration: weekData.midweekMeeting?.treasuresFromGodsWord?.talkDuration || 10,
+      spiritualGemsDuration:
+        weekData.midweekMeeting?.treasuresFromGodsWord?.spiritualGemsDuration || 10,
+      bibleReadingScripture:
+        weekData.midweekMeeting?.treasuresFromGodsWord?.bibleReadingScripture || '',
+      bibleReadingLesson: weekData.midweekMeeting?.treasuresFromGodsWord?.bibleReadingLesson || '',
+      bibleReadingDuration:
+        weekData.midweekMeeting?.treasuresFromGodsWord?.bibleReadingDuration || 4,
+    },
+    applyYourselfToFieldMinistry: {
+      fieldMinistryAssignments:
+        weekData.midweekMeeting?.applyYourselfToFieldMinistry?.fieldMinistryAssignments || [],
+    },
+    livingAsChristians: {
+      livingAsChristiansSong:
+        weekData.midweekMeeting?.livingAsChristians?.livingAsChristiansSong || 1,
+      assignments: weekData.midweekMeeting?.livingAsChristians?.assignments || [],
+    },
+    closingSong: weekData.midweekMeeting?.closingSong || 1,
+  },
+  weekendMeeting: {
+    // Wichtig: Wir lassen meetingDay weg - wird durch Hook gesetzt
+    openingSong: weekData.weekendMeeting?.openingSong || 1,
+    // Unbekannter Titel (null, z. B. beim Laden aus den Ausgaben): gespeicherten Titel behalten
+    ...(weekData.weekendMeeting?.publicTalkTitle != null
+      ? { publicTalk: { title: weekData.weekendMeeting.publicTalkTitle } }
+      : {}),
+    middleSong: weekData.weekendMeeting?.middleSong || 1,
+    watchtowerStudy: {
+      title: weekData.weekendMeeting?.watchtowerStudyTitle || '',
+    },
+    closingSong: weekData.weekendMeeting?.closingSong || 1,
+  },
+})
@@ -0,0 +1,114 @@
+import type { Payload, TypedUser } from 'payload'
+import type { Week } from '@/payload-types'
+import { getWeekStartDate, toWeekUpdate } from '@/utilities/jwWeekImport'
+
+export type IngestResult = {
+  updated: string[]
+  created: string[]
+  unchanged: string[]
+  failed: { id?: string; yearWeek: string; error: string }[]
+}
+
+type Queued = {
+  week: any
+  done: () => void
+}
+
+/**
+ * Schreibt Wochen aus dem Scraper-Worker direkt über die Local API in die Weeks-Collection.
+ *
+ * `push` reiht eine Woche ein und erfüllt sich, sobald sie gespeichert ist; zusammen mit
+ * dem `window` des Workers bremst das den Scraper, wenn die Datenbank langsamer ist als
+ * der Abruf. Was gleichzeitig ankommt, wird als Block mit bis zu `batchSize` parallelen
+ * Updates geschrieben.
+ */
+export class WeekIngestPipeline {
+  readonly result: IngestResult = { updated: [], created: [], unchanged: [], failed: [] }
+  private queue: Queued[] = []
+  private draining: Promise<void> | null = null
+
+  constructor(
+    private payload: Payload,
+    private user: TypedUser,
+    private docsByYearWeek: Map<string, Week[]>,
+    private options: { batchSize?: number; create?: boolean } = {},
+  ) {}
+
+  get batchSize() {
+    return this.options.batchSize ?? 8
+  }
+
+  push(week: any): Promise<void> {
+    return new Promise((done) => {
+      this.queue.push({ week, done })
+      this.draining ??= this.drain()
+    })
+  }
+
+  private async drain() {
+    // Einen Tick warten, damit zusammen eintreffende Wochen im selben Block landen
+    await new Promise((resolve) => setImmediate(resolve))
+    while (this.queue.length > 0) {
+      const batch = this.queue.splice(0, this.batchSize)
+      await Promise.all(
+        batch.map(async ({ week, done }) => {
+          await this.upsert(week)
+          done()
+        }),
+      )
+    }
+    this.draining = null
+  }
+
+  private async upsert(week: any) {
+    const docs = this.docsByYearWeek.get(week.yearWeek) ?? []
+
+    if (week.unchanged) {
+      this.result.unchanged.push(...docs.map((doc) => doc.id))
+      return
+    }
+
+    const data = toWeekUpdate(week, week.fingerprint)
+
+    if (docs.length === 0) {
+      if (!this.options.create) return
+      try {
+        const doc = await this.payload.create({
+          collection: 'weeks',
+          data: { ...data, weekStartDate: getWeekStartDate(week.yearWeek) },
+          depth: 0,
+          user: this.user,
+          overrideAccess: false,
+        })
+        this.result.created.push(doc.id)
+      } catch (error) {
+        console.error(`Fehler beim Anlegen der Woche ${week.yearWeek}:`, error)
+        this.result.failed.push({ yearWeek: week.yearWeek, error: error.message || 'Unbekannter Fehler' })
+      }
+      return
+    }
+
+    await Promise.all(
+      docs.map(async (doc) => {
+        try {
+          await this.payload.update({
+            collection: 'weeks',
+            id: doc.id,
+            data,
+            depth: 0,
+            user: this.user,
+            overrideAccess: false,
+          })
+          this.result.updated.push(doc.id)
+        } catch (error) {
+          console.error(`Fehler beim Speichern der Woche ${week.yearWeek}:`, error)
+          this.result.failed.push({
+            id: doc.id,
+            yearWeek: week.yearWeek,
+            error: error.message || 'Unbekannter Fehler',
+          })
+        }
+      }),
+    )
+  }
+}